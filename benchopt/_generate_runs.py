@@ -1,8 +1,12 @@
 import copy
+import time
 import inspect
+import threading
+from collections import defaultdict
 
 from .utils.parametrized_name_mixin import is_matched
 from .utils.run_context import RunContext
+from .utils.set_data_cache import SET_DATA_CACHE
 
 
 def buffer_iterator(it):
@@ -88,7 +92,9 @@ def _get_all_runs(benchmark, solvers=None, forced_solvers=None,
 def get_solver_kwargs(
     benchmark, dataset, objective, solver, n_repetitions, max_runs,
     timeout=None, force=False, collect=False, terminal=None,
-    run_context=None,
+    run_context=None, completed_runs=None, shared_data=None,
+    lazy_data=False, timing=None, memory=None, async_eval=None, fan_out=None,
+    stop_val_schedule='geometric',
 ):
     """Run a benchmark for a given dataset, objective and solver.
 
@@ -121,6 +127,34 @@ def get_solver_kwargs(
         Base context created in ``_run_benchmark`` carrying config fields
         (``pdb``, ``run_output_base``).  Cloned here for each repetition
         with the per-run fields filled in.
+    completed_runs : set of tuple | None
+        Keys ``(dataset_name, objective_name, solver_name, idx_rep)`` of the
+        runs that are already in the results when resuming a run. These runs
+        are skipped.
+    shared_data : SharedDataStore | None
+        If not None, the data of the dataset is shared through this store
+        with the workers, so they do not need to call ``get_data``.
+    lazy_data : bool
+        If set to True, do not load the data to check if the objective should
+        be skipped, and defer ``get_data``, ``skip`` and ``set_data`` to the
+        runs. The data is still loaded when ``n_repetitions`` is None, as the
+        number of repetitions may depend on the objective's ``cv``.
+    timing : tuple of (int, float) | None
+        If not None, ``(n_repeat, min_time)`` to repeat the timing of each
+        ``stop_val``, see ``run_one_resolution``.
+    memory : 'rss' | 'tracemalloc' | None
+        If not None, measure the peak memory of the solver for each
+        ``stop_val`` in this mode, see ``MemorySampler``.
+    async_eval : int | None
+        If not None, maximal number of pending evaluations of the objective
+        in a background thread for the 'callback' strategy, see
+        ``_Callback``.
+    fan_out : int | None
+        If not None, number of resolutions of the solver run at the same time
+        for the 'iteration' and 'tolerance' strategies, see ``_FanOutRuns``.
+    stop_val_schedule : 'geometric' | 'time'
+        How the stop values of the curves are chosen, see
+        ``StoppingCriterion.get_runner_instance``.
 
     Returns
     -------
@@ -151,8 +185,12 @@ def get_solver_kwargs(
         repetition=0, base_seed=benchmark.seed,
     )
 
-    # Set objective and skip if necessary.
-    skip, reason = objective._set_dataset(dataset)
+    # Set objective and skip if necessary. The same objective is used for all
+    # the solvers, so the state after set_data is cached to only compute it
+    # once for each dataset.
+    skip, reason = objective._set_dataset(
+        dataset, cache=True, lazy=lazy_data and n_repetitions is not None
+    )
     if skip:
         terminal.skip(reason, objective=True)
         return []
@@ -169,6 +207,16 @@ def get_solver_kwargs(
     terminal.n_repetitions = n_repetitions
 
     for rep in range(n_repetitions):
+        run_key = (str(dataset), str(objective), str(solver))
+        if completed_runs and (*run_key, rep) in completed_runs:
+            # Already in the results of the resumed run. Use the same terminal
+            # keys as the runner to count the repetitions that are done.
+            terminal.set(
+                dataset=run_key[0], objective=run_key[1], solver=run_key[2]
+            )
+            terminal.show_status('done')
+            continue
+
         objective_rep = copy.copy(objective)
         objective_rep._repetition = rep
 
@@ -190,19 +238,24 @@ def get_solver_kwargs(
             **{f"p_dataset_{k}": v for k, v in dataset._parameters.items()},
         }
 
-        # Set dataset in objective for the repetition.
-        # We need to set the context here, used in get_data. No need to clone
-        # each components, they are cloned and reset for each run .
+        # Set the context for the repetition, used in get_data. No need to
+        # clone each components, they are cloned and reset for each run.
+        # The copy of the objective only sets its dataset when it is run,
+        # reusing the state after set_data when the seeds of the repetition
+        # do not change it.
         run_ctx = run_context.set_run_context(
             objective=objective_rep, dataset=dataset, solver=solver,
             repetition=rep, base_seed=benchmark.seed,
         )
-        objective_rep._set_dataset(dataset)
+        if shared_data is not None:
+            run_ctx.shared_data = shared_data.share(dataset)
 
         args_run_one_to_cvg = dict(
             benchmark=benchmark, objective=objective_rep, solver=solver,
             meta=meta, timeout=timeout, max_runs=max_runs, force=force,
-            terminal=terminal, run_context=run_ctx,
+            terminal=terminal, run_context=run_ctx, timing=timing,
+            memory=memory, async_eval=async_eval, fan_out=fan_out,
+            stop_val_schedule=stop_val_schedule,
         )
 
         yield args_run_one_to_cvg
@@ -211,13 +264,18 @@ def get_solver_kwargs(
 def generate_run_kwargs(
     benchmark, solvers=None, forced_solvers=None, datasets=None,
     objectives=None, n_repetitions=1, max_runs=10, timeout=None,
-    collect=False, terminal=None, run_context=None,
+    collect=False, terminal=None, run_context=None, completed_runs=None,
+    shared_data=None, lazy_data=False, timing=None, memory=None,
+    async_eval=None, fan_out=None, stop_val_schedule='geometric',
+    data_releaser=None,
 ):
     """Yield kwargs for each ``run_one_to_cvg`` call in the benchmark.
 
     Combines the (dataset, objective, solver) enumeration with the per-run
     metadata so that callers only need a single generator to drive the
-    benchmark execution.
+    benchmark execution. The data of each dataset is released once all its
+    runs have been generated, or once they have completed if the runs are
+    counted with ``data_releaser``.
     """
     all_runs = _get_all_runs(
         benchmark, solvers, forced_solvers, datasets, objectives,
@@ -226,6 +284,162 @@ def generate_run_kwargs(
     common_kwargs = dict(
         benchmark=benchmark, n_repetitions=n_repetitions, max_runs=max_runs,
         timeout=timeout, collect=collect, run_context=run_context,
+        completed_runs=completed_runs, shared_data=shared_data,
+        lazy_data=lazy_data, timing=timing, memory=memory,
+        async_eval=async_eval, fan_out=fan_out,
+        stop_val_schedule=stop_val_schedule,
     )
+    releaser = data_releaser or DataReleaser()
+    dataset = None
     for kwargs in all_runs:
-        yield from get_solver_kwargs(**common_kwargs, **kwargs)
+        if kwargs['dataset'] is not dataset:
+            releaser.generated(dataset)
+            dataset = kwargs['dataset']
+        for run_kwargs in get_solver_kwargs(**common_kwargs, **kwargs):
+            if data_releaser is not None:
+                data_releaser.add(dataset)
+            yield run_kwargs
+    releaser.generated(dataset)
+
+
+class DataReleaser:
+    """Release the data of the datasets once all their runs have completed.
+
+    The runs receive the datasets without their data, but the data is kept
+    in the main process while the runs of a dataset are generated, to call
+    ``set_data`` only once, and until they have completed, as the runs can be
+    generated long before they start, e.g. when they are sorted by cost.
+
+    Each generated run is counted with ``add`` and each completed run with
+    ``release``, as for ``SharedDataStore``.
+    """
+
+    def __init__(self):
+        self.datasets = {}
+        self.n_runs = defaultdict(int)
+        self.lock = threading.Lock()
+
+    def add(self, dataset):
+        "Count a run generated for this dataset."
+        with self.lock:
+            self.n_runs[str(dataset)] += 1
+
+    def generated(self, dataset):
+        "Mark that all the runs of this dataset have been generated."
+        if dataset is None:
+            return
+        with self.lock:
+            self.datasets[str(dataset)] = dataset
+            self._check_release(str(dataset))
+
+    def release(self, dataset_name):
+        "Count a completed run for the dataset named ``dataset_name``."
+        with self.lock:
+            if self.n_runs.get(dataset_name, 0) > 0:
+                self.n_runs[dataset_name] -= 1
+            self._check_release(dataset_name)
+
+    def _check_release(self, dataset_name):
+        if self.n_runs.get(dataset_name, 0) > 0:
+            return
+        dataset = self.datasets.pop(dataset_name, None)
+        if dataset is not None:
+            self.n_runs.pop(dataset_name, None)
+            dataset._data = None
+            SET_DATA_CACHE.clear(dataset)
+
+
+def order_runs_by_cost(all_run_kwargs, costs, is_cached=None):
+    """Sort the runs to submit the most expensive ones first.
+
+    When the slowest runs are submitted last, they delay the end of the
+    benchmark while the other workers are idle. The runs are thus sorted by
+    decreasing estimated duration, which is taken from ``costs`` or from the
+    solver's ``cost_hint``. The runs without estimate are considered as long
+    as the most expensive known run, to start them early.
+
+    Parameters
+    ----------
+    all_run_kwargs : iterable of dict
+        The kwargs of each ``run_one_to_cvg`` call, as generated by
+        ``generate_run_kwargs``.
+    costs : dict
+        Mapping from ``(dataset_name, objective_name, solver_name)`` to the
+        duration of one run in seconds, measured in previous results.
+    is_cached : callable | None
+        If not None, function called with the kwargs of a run, returning True
+        when its result is already in the cache, in which case its cost is 0.
+
+    Returns
+    -------
+    all_run_kwargs : list of dict
+        The kwargs of the runs, from the most to the least expensive. Runs
+        with the same cost are kept in the generation order.
+    """
+    all_run_kwargs = list(all_run_kwargs)
+    run_costs = [
+        _get_run_cost(kwargs, costs, is_cached) for kwargs in all_run_kwargs
+    ]
+    default_cost = max((c for c in run_costs if c is not None), default=0)
+    run_costs = [default_cost if c is None else c for c in run_costs]
+    order = sorted(range(len(all_run_kwargs)), key=lambda i: -run_costs[i])
+    return [all_run_kwargs[i] for i in order]
+
+
+def _get_run_cost(kwargs, costs, is_cached):
+    if (
+        is_cached is not None and not kwargs.get('force', False)
+        and is_cached(**kwargs)
+    ):
+        return 0
+    meta = kwargs['meta']
+    key = (meta['dataset_name'], meta['objective_name'], meta['solver_name'])
+    if key in costs:
+        return costs[key]
+    return getattr(kwargs['solver'], 'cost_hint', None)
+
+
+def apply_time_budget(all_run_kwargs, deadline, n_workers=1,
+                      out_of_budget=None):
+    """Share the time left before a deadline among the pending runs.
+
+    The first repetition of all the configurations is run before the other
+    repetitions, so that all configurations are covered when the time is
+    exhausted. When a run is submitted, the time left is shared among the
+    pending runs, with ``n_workers`` runs executed at the same time, and the
+    deadline and the time share of the run are set in its run context.
+
+    Parameters
+    ----------
+    all_run_kwargs : iterable of dict
+        The kwargs of each ``run_one_to_cvg`` call, as generated by
+        ``generate_run_kwargs``.
+    deadline : float
+        Wall-clock time, as given by ``time.time``, before which all the runs
+        should be completed.
+    n_workers : int
+        Number of runs executed in parallel.
+    out_of_budget : list | None
+        If not None, the kwargs of the runs that are not submitted because
+        the deadline is reached are appended to this list.
+
+    Yields
+    ------
+    args_run_one_to_cvg : dict
+        The kwargs of the runs submitted before the deadline.
+    """
+    all_run_kwargs = sorted(
+        all_run_kwargs, key=lambda kwargs: kwargs['meta']['idx_rep']
+    )
+    n_runs = len(all_run_kwargs)
+    for i, kwargs in enumerate(all_run_kwargs):
+        now = time.time()
+        if now >= deadline:
+            if out_of_budget is not None:
+                out_of_budget.extend(all_run_kwargs[i:])
+            return
+        n_pending = n_runs - i
+        time_share = (deadline - now) * min(n_workers, n_pending) / n_pending
+        kwargs['run_context'].deadline = deadline
+        kwargs['run_context'].time_share = time_share
+        yield kwargs
@@ -6,10 +6,12 @@ from .stopping_criterion import SingleRunCriterion
 from .stopping_criterion import SufficientProgressCriterion
 
 from .utils.misc import NamedTemporaryFile
+from .utils.metric_schedule import ExpensiveMetricsSchedule
 from .utils.class_property import classproperty
 from .utils.dependencies_mixin import DependenciesMixin
 from .utils.parametrized_name_mixin import ParametrizedNameMixin
 from .utils.run_context_mixin import RunContextMixin
+from .utils.set_data_cache import SET_DATA_CACHE
 
 
 class BaseSolver(ParametrizedNameMixin, DependenciesMixin, RunContextMixin,
@@ -81,6 +83,30 @@ class BaseSolver(ParametrizedNameMixin, DependenciesMixin, RunContextMixin,
       used depending on the ``sampling_strategy``.
       See :ref:`stopping_criterion` for available options.
 
+    - ``supports_continuation``: if True, with the 'iteration' or 'tolerance'
+      strategies, each call to ``run(stop_val)`` continues from the state
+      reached by the previous call instead of restarting from scratch, and the
+      time reported for each point is cumulative. The state is reset with
+      ``reset_state`` before the first call of each curve.
+
+    - ``cost_hint``: estimate of the duration in seconds of one run of the
+      solver, i.e. of computing its curve for one repetition. In parallel runs,
+      the runs expected to be the longest are submitted first, to avoid long
+      runs delaying the end of the benchmark. When the results of a previous
+      run of the benchmark are available, the durations measured in these
+      results are used instead.
+
+    - ``n_threads``: number of threads used by the native libraries, such as
+      BLAS or OpenMP, when running the solver. By default, with ``--n-jobs``,
+      the number of CPUs is divided among the local workers to avoid
+      over-subscription, and the number of threads is not limited otherwise.
+      With the ``local`` parallel backend, it is also the number of cores
+      reserved for the runs of the solver.
+
+    - ``memory_gb``: memory in GB needed to run the solver, on top of the one
+      of the dataset. With the ``local`` parallel backend, the runs are only
+      started when this memory is available.
+
     Note that default values for these attributes can be set at the
     ``Objective`` level so that all solvers in a benchmark share the same
     default behavior. Typically, for ML benchmarks, all solvers can be run only
@@ -91,6 +117,10 @@ class BaseSolver(ParametrizedNameMixin, DependenciesMixin, RunContextMixin,
 
     _base_class_name = 'Solver'
     sampling_strategy = None
+    supports_continuation = False
+    cost_hint = None
+    n_threads = None
+    memory_gb = None
 
     @classproperty
     def _stopping_criterion(cls):
@@ -156,6 +186,7 @@ class BaseSolver(ParametrizedNameMixin, DependenciesMixin, RunContextMixin,
         # Check if the objective is compatible with the solver
         skip, reason = self.skip(**objective_dict)
         if not skip:
+            self._objective_dict = objective_dict
             self.set_objective(**objective_dict)
 
         return skip, reason
@@ -284,6 +315,16 @@ class BaseSolver(ParametrizedNameMixin, DependenciesMixin, RunContextMixin,
             self.pre_run_hook(stop_val)
             self.run(stop_val)
 
+    def reset_state(self):
+        """Reset the solver to its initial state, before a curve is computed.
+
+        This is only called when ``supports_continuation`` is True, after the
+        warm up and before the first call to ``run``, so that the next calls
+        continue from this state. By default, ``set_objective`` is called
+        again, which is enough when the state is initialized there.
+        """
+        self.set_objective(**self._objective_dict)
+
     def warm_up(self):
         """User specified warm up step, called once before the runs.
 
@@ -343,11 +384,21 @@ class BaseDataset(ParametrizedNameMixin, DependenciesMixin, RunContextMixin,
         parameterization). The reserved name ``"base_seed"`` (also implied by
         ``"all"``) drops the benchmark ``--seed`` from the prepare cache key,
         for datasets whose preparation does not depend on the seed.
+    n_threads : int | None
+        Number of cores needed to run the solvers on this dataset. With the
+        ``local`` parallel backend, each run reserves the largest number of
+        cores requested by the dataset and the solver.
+    memory_gb : float | None
+        Memory in GB needed to load the data and run the solvers on it. With
+        the ``local`` parallel backend, the runs are only started when the
+        memory of the dataset and of the solver is available.
     """
 
     _base_class_name = 'Dataset'
 
     prepare_cache_ignore = ()
+    n_threads = None
+    memory_gb = None
 
     def prepare(self):
         """Prepare the dataset for use (optional).
@@ -533,6 +584,10 @@ class BaseObjective(ParametrizedNameMixin, DependenciesMixin, RunContextMixin,
       this benchmark.
     - ``sampling_strategy``: the default sampling strategy to use for this
       benchmark.
+    - ``expensive_metrics_schedule``: the points where the metrics of
+      ``evaluate_expensive_result`` are computed, every ``k`` points with an
+      int ``k``, on a log grid of the time with ``'log'`` (default) or only at
+      the final point with ``'final'``.
     """
     _base_class_name = 'Objective'
 
@@ -547,6 +602,8 @@ class BaseObjective(ParametrizedNameMixin, DependenciesMixin, RunContextMixin,
 
     sampling_strategy = None
 
+    expensive_metrics_schedule = 'log'
+
     @abstractmethod
     def set_data(self, **data):
         """Store the info on a dataset to be able to compute the objective.
@@ -595,6 +652,74 @@ class BaseObjective(ParametrizedNameMixin, DependenciesMixin, RunContextMixin,
         """
         pass
 
+    def evaluate_expensive_result(self, **solver_result):
+        """Optionally compute the expensive metrics of a solver output.
+
+        These metrics are only computed on a subsample of the points of the
+        curves, selected with ``expensive_metrics_schedule``, and always at
+        the final point. They are NaN in the results for the other points.
+        The metrics needed by the stopping criterion should be returned by
+        ``evaluate_result``, which is called for all the points.
+
+        Parameters
+        ----------
+        **solver_result : dict
+            The dictionary returned by ``Solver.get_result()``. Keys match the
+            keyword arguments of ``evaluate_result``.
+
+        Returns
+        -------
+        metrics : dict {str: float} or list of dict
+            The expensive metrics. A list should have one dictionary for each
+            one returned by ``evaluate_result``.
+        """
+        pass
+
+    def _has_expensive_metrics(self):
+        "Return True if ``evaluate_expensive_result`` is implemented."
+        return (
+            type(self).evaluate_expensive_result
+            is not BaseObjective.evaluate_expensive_result
+        )
+
+    def _get_expensive_metrics_schedule(self):
+        """Return the schedule of the expensive metrics for one curve.
+
+        Returns
+        -------
+        schedule : ExpensiveMetricsSchedule | None
+            The schedule, or None if the objective has no expensive metrics.
+        """
+        if not self._has_expensive_metrics():
+            return None
+        return ExpensiveMetricsSchedule(self.expensive_metrics_schedule)
+
+    def _evaluate_expensive(self, result, n_rows):
+        """Compute the formatted expensive metrics for the rows of a point.
+
+        Parameters
+        ----------
+        result : dict
+            The output of ``Solver.get_result``.
+        n_rows : int
+            The number of rows of the point, returned by ``evaluate_result``.
+
+        Returns
+        -------
+        metrics_list : list of dict
+            The formatted metrics for each row.
+        """
+        metrics = self.evaluate_expensive_result(**result)
+        if isinstance(metrics, dict):
+            metrics = [metrics] * n_rows
+        elif not isinstance(metrics, list) or len(metrics) != n_rows:
+            raise ValueError(
+                "Objective.evaluate_expensive_result should return a "
+                "dictionary or a list with one dictionary for each one "
+                f"returned by Objective.evaluate_result ({n_rows})."
+            )
+        return [self._format_objective_dict(d) for d in metrics]
+
     def save_final_results(self, **solver_result):
         """Optionally save artefacts from the final solver run.
 
@@ -616,6 +741,13 @@ class BaseObjective(ParametrizedNameMixin, DependenciesMixin, RunContextMixin,
         """
         pass
 
+    def _saves_final_results(self):
+        "Return True if the objective implements ``save_final_results``."
+        return (
+            type(self).save_final_results
+            is not BaseObjective.save_final_results
+        )
+
     def _format_objective_dict(self, objective_dict):
         """Format the output of Objective.evaluate_results.
 
@@ -648,10 +780,12 @@ class BaseObjective(ParametrizedNameMixin, DependenciesMixin, RunContextMixin,
             f'objective_{k}': v for k, v in objective_dict.items()
         }
 
-    def __call__(self, result):
+    def __call__(self, result, expensive=True):
         """Used to call the evaluation of the objective.
 
-        This allows standardizing the output to a dictionary.
+        This allows standardizing the output to a dictionary. With
+        ``expensive=False``, the metrics of ``evaluate_expensive_result`` are
+        not computed.
         """
         if not isinstance(result, dict):
             raise TypeError(
@@ -673,13 +807,28 @@ class BaseObjective(ParametrizedNameMixin, DependenciesMixin, RunContextMixin,
         objective_list = [
             self._format_objective_dict(d) for d in objective_list
         ]
+        if expensive and self._has_expensive_metrics():
+            metrics_list = self._evaluate_expensive(
+                result, len(objective_list)
+            )
+            for objective_dict, metrics in zip(objective_list, metrics_list):
+                objective_dict.update(metrics)
 
         return objective_list
 
     # Save the dataset object used to get the objective data so we can avoid
     # hashing the data directly.
-    def _set_dataset(self, dataset):
+    def _set_dataset(self, dataset, cache=False, lazy=False):
         self._dataset = dataset
+        # With lazy=True, only record the dataset. The data is loaded and set
+        # by ``_restore_dataset`` when the objective is used.
+        self._dataset_pending = lazy
+        if lazy:
+            return False, None
+        # With cache=True, reuse the state after set_data computed in this
+        # process for the same objective and dataset, if any.
+        if cache and SET_DATA_CACHE.restore(self):
+            return False, None
         assert self.is_installed(raise_on_not_installed=True)
         data = dataset._get_data()
 
@@ -706,6 +855,8 @@ class BaseObjective(ParametrizedNameMixin, DependenciesMixin, RunContextMixin,
                     "modified by 'set_data'."
                 )
 
+        if cache:
+            SET_DATA_CACHE.store(self)
         return False,  None
 
     def skip(self, **data):
@@ -762,9 +913,28 @@ class BaseObjective(ParametrizedNameMixin, DependenciesMixin, RunContextMixin,
 
     def __setstate__(self, state):
         self._repetition = state['repetition']
-        dataset = state['dataset']
-        if dataset is not None:
-            self._set_dataset(dataset)
+        # The data is only set with ``_restore_dataset`` when the objective
+        # is used, once the run context is attached to the dataset.
+        self._dataset = state['dataset']
+        self._dataset_pending = self._dataset is not None
+
+    def _restore_dataset(self):
+        """Set the dataset of a copied objective, if not already done.
+
+        The state of the objective after ``set_data`` is cached in each
+        process, so it is reused by the next runs with the same objective
+        and dataset.
+
+        Returns
+        -------
+        skip : bool
+            Whether this objective should be skipped for this dataset.
+        reason : str | None
+            The reason why it should be skipped for display purposes.
+        """
+        if not getattr(self, '_dataset_pending', False):
+            return False, None
+        return self._set_dataset(self._dataset, cache=True)
 
     def _default_split(self, cv_fold, *arrays):
         train_index, test_index = cv_fold
@@ -310,12 +310,14 @@ class Benchmark:
         from .plotting.base import BasePlot
         from .plotting.default_plots import (
             ObjectiveCurvePlot,
+            ObjectiveMemoryPlot,
             BarChart,
             BoxPlot,
             TablePlot
         )
         default_plots = [
             ObjectiveCurvePlot,
+            ObjectiveMemoryPlot,
             BarChart,
             BoxPlot,
             TablePlot
@@ -529,13 +531,14 @@ class Benchmark:
                     kwargs['meta']['objective_name'],
                     kwargs['meta']['solver_name']
                 )
-                return ([], key, 'not run yet', "")
+                return ([], key, 'not run yet', "", None)
         else:
             def _func_cached(**kwargs):
                 if kwargs.get('force', False):
                     return func_cached.call(**kwargs)[0]
                 return func_cached(**kwargs)
 
+        _func_cached.check_call_in_cache = func_cached.check_call_in_cache
         return _func_cached
 
     #####################################################
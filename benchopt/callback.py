@@ -1,6 +1,14 @@
-import time
+import copy
+import threading
+from time import perf_counter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-from .utils.sys_info import get_sys_info
+import numpy as np
+
+from .utils.resource_usage import get_resource_usage
+from .utils.resource_usage import diff_resource_usage
+from .utils.resource_usage import MemorySampler
 
 
 class _Callback:
@@ -18,6 +26,30 @@ class _Callback:
         Contains objective and data names, problem dimension, etc.
     stopping_criterion : instance of StoppingCriterion
         Object to check if we need to stop a solver.
+    memory : 'rss' | 'tracemalloc' | None
+        If not None, measure the peak memory of the solver with a
+        ``MemorySampler`` in this mode.
+    async_eval : int | None
+        If not None, evaluate the objective in a background thread on a copy
+        of the result, so that the solver continues while it is evaluated,
+        with at most ``async_eval`` evaluations pending. When more are
+        pending, the solver waits for the oldest one. The stopping criterion
+        is checked when the evaluations complete, so the solver may run a few
+        more iterations than in the synchronous mode, whose points are
+        dropped. The next stop values are computed before the evaluations
+        complete, and the points logged ahead are dropped when the stopping
+        criterion changes them, e.g. when the curve is flat. The points are
+        the ones of the synchronous mode with ``async_eval=1``, but with more
+        pending evaluations, the solver may already have passed the new stop
+        value, and the stop values computed ahead are kept.
+        The resources used by each evaluation are measured in its thread, and
+        subtracted from the ones of the solver once it completes, so a point
+        counts the part of the evaluation running when it is logged.
+        The counters of ``resource.getrusage`` are set to NaN when they
+        cannot be measured for a thread, i.e. on other platforms than Linux.
+    metrics_schedule : ExpensiveMetricsSchedule | None
+        If not None, only compute the expensive metrics of the objective for
+        the points selected by this schedule, and for the final point.
 
     Attributes
     ----------
@@ -28,15 +60,19 @@ class _Callback:
     meta : dict
         Metadata passed to store in Cost results.
         Contains objective and data names, problem dimension, etc.
-    info : dict
-        A dictionary with info from the current system.
     curve : list
-        The convergence curve stored as a list of dict.
+        The values returned by the objective for each evaluated point, used
+        by the stopping criterion. The metadata, the times and the other
+        columns are only added to the rows in ``get_results``.
     status : 'running' | 'done' | 'diverged' | 'timeout' | 'max_runs'
         The status on which the solver is or was stopped.
     time_iter : float
         Computation time to reach the current iteration.
         Excluding the times to evaluate objective.
+    overhead_call : float
+        The time added to ``time_iter`` by each call to the callback,
+        measured when starting. It is subtracted from the time of the points
+        and the correction is stored in the ``time_correction`` column.
     it : int
         The number of times the callback has been called. It's
         initialized with 0.
@@ -45,29 +81,107 @@ class _Callback:
         updated.
     time_callback : float
         The time when exiting the callback call.
+    usage_start : dict
+        The resources used by the process when starting the solver, see
+        ``get_resource_usage``.
+    usage_eval : dict
+        The resources used to evaluate the objective since the start, which
+        are excluded from the resources reported for the solver. In
+        asynchronous mode, they only include the evaluations completed so
+        far.
+    memory_peak : int
+        The peak memory of the solver since the start, in bytes, when it is
+        measured. The peak is reset after each evaluation, so that the memory
+        used by the evaluations is excluded.
+    pending : deque
+        The indices of the points, results, futures, evaluation kwargs and
+        states of the metrics schedule before the points, for the evaluations
+        that are not processed yet, in the order of the iterations, in
+        asynchronous mode.
+    metrics_schedule : ExpensiveMetricsSchedule | None
+        If not None, the points where the expensive metrics of the objective
+        are computed. They are always computed for the final point.
     """
 
-    def __init__(self, objective, solver, meta, stopping_criterion):
+    def __init__(self, objective, solver, meta, stopping_criterion,
+                 memory=None, async_eval=None, metrics_schedule=None):
         self.objective = objective
         self.solver = solver
         self.meta = meta
         self.stopping_criterion = stopping_criterion
         self._last_result = None
+        self.sampler = None
+        if memory is not None:
+            self.sampler = MemorySampler(memory)
+        if async_eval is not None and async_eval < 1:
+            raise ValueError(
+                f"async_eval should be a positive integer. Got {async_eval}."
+            )
+        self.async_eval = async_eval
+        self._executor = None
+        self._lock = threading.Lock()
+        self.pending = deque()
+        self._n_dropped = 0
+        self.metrics_schedule = metrics_schedule
+        self._last_expensive = True
 
-        # Initialize local variables
-        self.info = get_sys_info()
+        # Initialize local variables. The stop values and the times of the
+        # points are stored in arrays allocated for ``max_runs`` points, and
+        # their other columns in ``_point_info``.
         self.curve = []
         self.status = 'running'
         self.it = 0
         self.time_iter = 0.
+        self.overhead_call = 0.
         self.next_stopval = self.stopping_criterion.init_stop_val()
+        size = (getattr(stopping_criterion, 'max_runs', None) or 14) + 2
+        self._stop_vals = np.empty(size, dtype=np.int64)
+        self._times = np.empty(size, dtype=np.float64)
+        self._n_points = 0
+        self._point_info = []
 
     def start(self):
-        self.time_callback = time.perf_counter()
+        self.usage_start = get_resource_usage()
+        self.usage_eval = {k: 0 for k in self.usage_start}
+        if self.sampler is not None:
+            self.memory_peak = 0
+            self.sampler.start()
+        if self.async_eval is not None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self.overhead_call = self._calibrate()
+        self.time_callback = perf_counter()
+
+    def _calibrate(self, n_calls=200, n_repeat=5):
+        """Measure the time added to ``time_iter`` by each call.
+
+        The callback is called in an empty loop, like in the solvers, without
+        logging any point. The smallest mean time between two calls over the
+        ``n_repeat`` batches is used, as the least perturbed by the other
+        processes.
+        """
+        next_stopval, self.next_stopval = self.next_stopval, -1
+        overheads = []
+        for _ in range(n_repeat):
+            self.it, self.time_iter = 0, 0.
+            self.time_callback = perf_counter()
+            for _ in range(n_calls):
+                self()
+            overheads.append(self.time_iter / n_calls)
+        self.next_stopval = next_stopval
+        self.it, self.time_iter = 0, 0.
+        return min(overheads)
+
+    def stop(self):
+        "Stop the measure of the memory and the evaluations, if any."
+        if self.sampler is not None:
+            self.sampler.stop()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
 
     def __call__(self):
         # Stop time and update computation time since the beginning
-        t0 = time.perf_counter()
+        t0 = perf_counter()
 
         self.time_iter += t0 - self.time_callback
 
@@ -78,7 +192,7 @@ class _Callback:
 
         # Update iteration number and restart time measurement.
         self.it += 1
-        self.time_callback = time.perf_counter()
+        self.time_callback = perf_counter()
         return True
 
     def log_value(self):
@@ -87,25 +201,172 @@ class _Callback:
         Return True if the solver should be stopped.
         """
         self._last_it_log = self.it
+        # The resources are only measured when logging, to keep the overhead
+        # of the callback low, so the ones used for the evaluations are
+        # accumulated and subtracted.
+        usage_log = get_resource_usage()
+        usage = diff_resource_usage(self.usage_start, usage_log)
+        with self._lock:
+            usage = {k: v - self.usage_eval[k] for k, v in usage.items()}
+        # In asynchronous mode, the resources of the evaluations are measured
+        # in their thread, so only count the ones of this thread while it
+        # submits them, to not subtract them twice.
+        is_async = self._executor is not None
+        usage_window = get_resource_usage(thread=True) if is_async else (
+            usage_log
+        )
+        if self.sampler is not None:
+            self.memory_peak = max(self.memory_peak, self.sampler.get_peak())
+            usage[self.sampler.column] = self.memory_peak
+        t_eval = perf_counter()
+        i_point = self._add_stop_val(self.it, self.time_iter)
+        info = usage
+        self._point_info.append(info)
         result = self.solver.get_result()
-        self._last_result = result
-        objective_list = self.objective(result)
-        self.curve.extend(dict(
-            **self.meta, stop_val=self.it,
-            time=self.time_iter,
-            **objective_dict, **self.info
-        ) for objective_dict in objective_list)
-
-        # Check the stopping criterion
-        should_stop_res = self.stopping_criterion.should_stop(
-            self.next_stopval, self.curve
+        kwargs, schedule_state = {}, None
+        if self.metrics_schedule is not None:
+            schedule_state = dict(vars(self.metrics_schedule))
+            kwargs['expensive'] = self.metrics_schedule.update(self.time_iter)
+        if self._executor is None:
+            objective_list = self.objective(result, **kwargs)
+            info['overhead_eval'] = perf_counter() - t_eval
+            stop, self.next_stopval = self._add_point(
+                i_point, result, objective_list, **kwargs
+            )
+        else:
+            # Evaluate a copy of the result, as the solver may update it in
+            # place while it is evaluated.
+            result = copy.deepcopy(result)
+            future = self._executor.submit(
+                self._evaluate_in_thread, result, **kwargs
+            )
+            info['overhead_eval'] = perf_counter() - t_eval
+            self.pending.append(
+                (i_point, result, future, kwargs, schedule_state)
+            )
+            # The next stop value may be changed once the point is evaluated.
+            self.next_stopval = self.stopping_criterion.get_next_stop_val(
+                self.next_stopval
+            )
+            stop = self._process_pending(max_pending=self.async_eval)
+        usage_eval = diff_resource_usage(
+            usage_window, get_resource_usage(thread=is_async)
         )
-        stop, self.status, self.next_stopval = should_stop_res
+        with self._lock:
+            for k, v in usage_eval.items():
+                self.usage_eval[k] += v
+        if self.sampler is not None:
+            self.sampler.reset_peak()
         return stop
 
+    def _evaluate_in_thread(self, result, **kwargs):
+        "Evaluate a result and measure the resources used by this thread."
+        usage_start = get_resource_usage(thread=True)
+        objective_list = self.objective(result, **kwargs)
+        usage = diff_resource_usage(
+            usage_start, get_resource_usage(thread=True)
+        )
+        with self._lock:
+            for k in self.usage_eval:
+                self.usage_eval[k] += usage.get(k, np.nan)
+        return objective_list
+
+    def _add_stop_val(self, stop_val, time_iter):
+        "Store the stop value and the time of a new point, return its index."
+        if self._n_points == len(self._times):
+            self._stop_vals = np.concatenate(
+                [self._stop_vals, np.empty_like(self._stop_vals)]
+            )
+            self._times = np.concatenate(
+                [self._times, np.empty_like(self._times)]
+            )
+        i_point = self._n_points
+        self._stop_vals[i_point] = stop_val
+        self._times[i_point] = time_iter
+        self._n_points += 1
+        return i_point
+
+    def _add_point(self, i_point, result, objective_list, expensive=True):
+        "Add the evaluation of a point to the curve and check for stopping."
+        info = self._point_info[i_point]
+        info['n_rows'] = len(objective_list)
+        self._last_result = result
+        self._last_expensive = expensive
+        self.curve.extend(objective_list)
+
+        # Check the stopping criterion. The times are only recorded for the
+        # evaluated points, as the dropped ones are not part of the curve.
+        t_stop = perf_counter()
+        stop_val = int(self._stop_vals[i_point])
+        self.stopping_criterion.record_time(
+            stop_val, float(self._times[i_point])
+        )
+        stop, self.status, next_stopval = self.stopping_criterion.should_stop(
+            stop_val, self.curve
+        )
+        info['overhead_stop'] = perf_counter() - t_stop
+        return stop, next_stopval
+
+    def _process_pending(self, max_pending, reschedule=True):
+        """Process the completed evaluations, in the order of the iterations.
+
+        Wait for the oldest evaluations while more than ``max_pending`` are
+        pending, and add the time spent waiting to their ``overhead_eval``.
+        When the stopping criterion is met, the evaluations of the later
+        iterations are dropped. With ``reschedule``, they are also dropped
+        when the next stop value given by the stopping criterion differs from
+        the one of the next point, and the solver has not reached it yet.
+
+        Return True if the solver should be stopped.
+        """
+        while self.pending:
+            i_point, result, future, kwargs, _ = self.pending[0]
+            if len(self.pending) <= max_pending and not future.done():
+                break
+            self.pending.popleft()
+            t_wait = perf_counter()
+            objective_list = future.result()
+            info = self._point_info[i_point]
+            info['overhead_eval'] += perf_counter() - t_wait
+            stop, next_stopval = self._add_point(
+                i_point, result, objective_list, **kwargs
+            )
+            if stop:
+                self._n_dropped = self._drop_pending(i_point)
+                return True
+
+            # The stop value of the next point was computed before this
+            # evaluation, which can change it, e.g. when the curve is flat.
+            planned = self.next_stopval
+            if self.pending:
+                planned = int(self._stop_vals[self.pending[0][0]])
+            if reschedule and next_stopval != planned and (
+                    next_stopval > self.it):
+                if self.pending and self.metrics_schedule is not None:
+                    vars(self.metrics_schedule).update(self.pending[0][4])
+                self._drop_pending(i_point)
+                self.next_stopval = next_stopval
+        return False
+
+    def _drop_pending(self, i_point):
+        """Drop the pending evaluations, of the points after ``i_point``.
+
+        Return the number of dropped points.
+        """
+        n_dropped = len(self.pending)
+        for _, _, future, _, _ in self.pending:
+            future.cancel()
+        self.pending.clear()
+        self._n_points = i_point + 1
+        del self._point_info[self._n_points:]
+        return n_dropped
+
     def get_results(self):
         """Get the results stored by the callback
 
+        The rows of the curve are built here, with the metadata and the
+        times corrected by the overhead of the calls to the callback.
+
         Returns
         -------
         curve : list
@@ -119,10 +380,45 @@ class _Callback:
             # last time before returning if the last log was not the previous
             # iteration.
             # Stop time and update computation time since the beginning
-            t0 = time.perf_counter()
+            t0 = perf_counter()
             self.time_iter += t0 - self.time_callback
+            stop = False
             if self._last_it_log != self.it - 1:
-                self.log_value()
-            # Update the status to done
-            self.status = 'done'
-        return self.curve, self.status, self._last_result
+                stop = self.log_value()
+            if self._executor is not None and not stop:
+                stop = self._process_pending(max_pending=0, reschedule=False)
+            # Update the status to done, unless the stopping criterion was met
+            # by an asynchronous evaluation before the last point.
+            if not stop or self._executor is None or self._n_dropped == 0:
+                self.status = 'done'
+
+        # The expensive metrics are always computed for the final point.
+        if not self._last_expensive and self._point_info:
+            n_rows = self._point_info[-1]['n_rows']
+            metrics_list = self.objective._evaluate_expensive(
+                self._last_result, n_rows
+            )
+            for objective_dict, metrics in zip(
+                self.curve[-n_rows:], metrics_list
+            ):
+                objective_dict.update(metrics)
+
+        n_points = self._n_points
+        stop_vals = self._stop_vals[:n_points]
+        time_correction = np.minimum(
+            stop_vals * self.overhead_call, self._times[:n_points]
+        )
+        times = self._times[:n_points] - time_correction
+        curve, objective_dicts = [], iter(self.curve)
+        for stop_val, t, correction, info in zip(
+            stop_vals.tolist(), times.tolist(), time_correction.tolist(),
+            self._point_info
+        ):
+            info = dict(info)
+            for _ in range(info.pop('n_rows')):
+                curve.append(dict(
+                    **self.meta, stop_val=stop_val, time=t,
+                    time_correction=correction, **info,
+                    **next(objective_dicts)
+                ))
+        return curve, self.status, self._last_result
@@ -17,6 +17,7 @@ from benchopt.utils.shell_cmd import _run_shell_in_conda_env
 from benchopt.utils.conda_env_cmd import get_env_info
 from benchopt.utils.profiling import print_stats
 from benchopt.parallel_backends import check_parallel_config
+from benchopt.parallel_backends import is_local_parallel
 
 
 main = click.Group(
@@ -58,22 +59,41 @@ def _get_run_args(cli_kwargs, config_file_kwargs):
         "n_repetitions",
         "timeout",
         "no_timeout",
+        "time_budget",
+        "racing",
+        "timing_repeat",
+        "timing_window",
+        "memory",
+        "async_eval",
+        "fan_out",
+        "stop_val_schedule",
         "collect",
         "plot",
         "display",
         "html",
         "n_jobs",
         "parallel_config",
+        "pin_cpus",
         "pdb",
         "profile",
         "env_name",
         "no_cache",
         "output",
+        "resume",
         "seed",
     ]
     return [cli_kwargs[name] for name in return_names]
 
 
+def _to_seconds(duration):
+    "Convert a duration given in seconds or with the syntax 10h/10m/10s."
+    try:
+        return int(float(duration))
+    except ValueError:  # already under string format
+        import pandas as pd
+        return pd.to_timedelta(duration).total_seconds()
+
+
 @main.command(
     help="Run a benchmark with benchopt.",
     epilog="To (re-)install the required solvers and datasets "
@@ -127,6 +147,71 @@ def _get_run_args(cli_kwargs, config_file_kwargs):
               is_flag=True,
               help='If set, prevent solvers from stopping after running for '
               'a long time. Not compatible with the --timeout option.')
+@click.option('--time-budget',
+              metavar='<time_budget>', default=None, type=str,
+              help='Maximal duration of the whole benchmark run, in seconds. '
+              'The syntax 10h or 10m can be used to denote 10 hours or '
+              'minutes respectively. The remaining time is shared among the '
+              'pending runs, whose timeout is reduced as the deadline '
+              'approaches, and the runs that cannot start before the deadline '
+              'are reported with the status "budget".')
+@click.option('--racing',
+              metavar='<fraction>', default=None, type=float,
+              help='If set, run the solvers of each dataset and objective in '
+              'successive halving races: all solvers are run with a small '
+              'timeout, the <fraction> of the worst ones on the monitored key '
+              'is dropped and the others are run again with a larger timeout, '
+              'until one remains. The dropped runs keep their partial curve '
+              'with the status "dominated". Not compatible with '
+              '--no-timeout and --time-budget.')
+@click.option('--timing-repeat',
+              metavar='<int>', default=None, type=int,
+              help='Run the solver <int> times for each stop_val, and report '
+              'the minimum, median and inter-quartile range of the '
+              'durations. The median is used as the time of the point and '
+              'the objective is only evaluated once. Ignored for the '
+              'callback sampling strategy.')
+@click.option('--timing-window',
+              metavar='<seconds>', default=None, type=float,
+              help='Repeat the runs of the solver for each stop_val until '
+              'they last at least <seconds> in total, as with timeit. Can be '
+              'combined with --timing-repeat.')
+@click.option('--memory',
+              type=click.Choice(['rss', 'tracemalloc']), default=None,
+              help='Measure the peak memory of the solvers for each '
+              'stop_val, above the memory used when starting the run. With '
+              '"rss", the resident memory of the process is sampled in a '
+              'background thread, every memory_sampling_interval ms (see '
+              'the config), and stored in the memory_peak_rss column. '
+              'With "tracemalloc", the Python allocations are traced and '
+              'their peak is stored in the memory_peak_alloc column. Both '
+              'slow down the solvers a bit, so the times are less accurate.')
+@click.option('--async-eval',
+              metavar='<int>', default=None, type=int,
+              help='For the solvers with the callback sampling strategy, '
+              'evaluate the objective in a background thread on a copy of '
+              'the result, so that the solver continues while it is '
+              'evaluated. At most <int> evaluations are pending: beyond, the '
+              'solver waits for the oldest one. The objective must be '
+              'thread-safe, and the solver may run a few iterations past '
+              'the stopping criterion, which are dropped.')
+@click.option('--fan-out',
+              metavar='<int>', default=None, type=int,
+              help='For the solvers with the iteration or tolerance sampling '
+              'strategy that do not support continuation, run the next <int> '
+              'stop_val of each curve at the same time in a pool of local '
+              'processes, instead of one after the other. The runs after '
+              'the stopping point are discarded. The timings are only '
+              'reliable when there is a free core for each of them.')
+@click.option('--stop-val-schedule',
+              type=click.Choice(['geometric', 'time']), default='geometric',
+              show_default=True,
+              help='How the stop_val of the curves are chosen. With '
+              '"geometric", they grow by a constant factor, increased when '
+              'the curve is flat. With "time", the time of the solver is '
+              'fitted as a function of stop_val on the points measured so '
+              'far, to get points evenly spaced in log scale of the time '
+              'between the first point and the timeout.')
 @click.option('--collect',
               is_flag=True,
               help='If set, this run will only collect results which are '
@@ -154,6 +239,12 @@ def _get_run_args(cli_kwargs, config_file_kwargs):
               "The YAML file provided to this argument is used to setup the"
               "parallel run. See :ref:`parallel_run` for a detailed "
               "description.")
+@click.option("--pin-cpus",
+              is_flag=True,
+              help="Bind each local worker to a disjoint set of cores, "
+              "grouped by NUMA node when the topology is available, to reduce "
+              "the timing variations. Only supported on Linux, with --n-jobs "
+              "> 1 or the local backend.")
 @click.option("--pdb",
               is_flag=True,
               help="Launch a debugger if there is an error. This will launch "
@@ -192,6 +283,12 @@ def _get_run_args(cli_kwargs, config_file_kwargs):
               " If not provided, the output will be saved as "
               "<BENCHMARK>/outputs/benchopt_run_<timestamp>.parquet."
               )
+@click.option("--resume", metavar="<output>", default=None, type=str,
+              help="Resume a run from the result file <output>, given as a "
+              "path or as a filename in <BENCHMARK>/outputs. The partial "
+              "results of an interrupted run can also be used. The runs "
+              "already in this file are skipped, and the new results are "
+              "added to the same file. Not compatible with --output.")
 @click.option('--seed',
               metavar="<seed>", type=int, default=None,
               help="Seed to control the stochasticity of the "
@@ -207,8 +304,10 @@ def run(config_file=None, **kwargs):
     (
         benchmark, solver_names, forced_solvers, dataset_names,
         objective_filters, max_runs, n_repetitions, timeout, no_timeout,
-        collect, plot, display, html, n_jobs, parallel_config, pdb,
-        do_profile, env_name, no_cache, output, seed
+        time_budget, racing, timing_repeat, timing_window, memory,
+        async_eval, fan_out, stop_val_schedule, collect, plot, display, html,
+        n_jobs, parallel_config, pin_cpus, pdb, do_profile, env_name, no_cache,
+        output, resume, seed
     ) = _get_run_args(kwargs, config)
 
     if env_name == "False":
@@ -230,15 +329,33 @@ def run(config_file=None, **kwargs):
             'You cannot specify both --timeout and --no-timeout options.'
         )
 
+    if resume is not None and output != "None":
+        raise click.BadParameter(
+            'You cannot specify both --output and --resume options.'
+        )
+
+    if racing is not None and no_timeout:
+        raise click.BadParameter(
+            'You cannot specify both --racing and --no-timeout options, as '
+            'the rounds of the races use fractions of the timeout.'
+        )
+
+    if racing is not None and time_budget is not None:
+        raise click.BadParameter(
+            'You cannot specify both --racing and --time-budget options, as '
+            'the races set the timeouts of the runs.'
+        )
+
     if not no_timeout:
         if timeout is None:
             timeout = get_setting('default_timeout')
         else:
-            try:
-                timeout = int(float(timeout))
-            except ValueError:  # already under string format
-                import pandas as pd
-                timeout = pd.to_timedelta(timeout).total_seconds()
+            timeout = _to_seconds(timeout)
+    if time_budget is not None:
+        time_budget = _to_seconds(time_budget)
+    timing = None
+    if timing_repeat is not None or timing_window is not None:
+        timing = (timing_repeat or 1, timing_window or 0)
 
     # Create the Benchmark object
     benchmark = Benchmark(benchmark, no_cache=no_cache, seed=seed)
@@ -268,6 +385,11 @@ def run(config_file=None, **kwargs):
 
         # Get the config for parallel runs
         parallel_config = check_parallel_config(parallel_config, n_jobs)
+        if pin_cpus and not is_local_parallel(parallel_config):
+            raise click.BadParameter(
+                'The --pin-cpus option requires local workers, with '
+                '--n-jobs > 1 or the local backend.'
+            )
 
         print("Loading objective, datasets and solvers...", end='', flush=True)
         # Check that the objective is installed or raise an error
@@ -291,9 +413,13 @@ def run(config_file=None, **kwargs):
             benchmark, solvers, forced_solvers,
             datasets=datasets, objectives=objectives,
             max_runs=max_runs, n_repetitions=n_repetitions,
-            timeout=timeout, output_file=output, plot_result=plot,
+            timeout=timeout, time_budget=time_budget, racing=racing,
+            timing=timing, memory=memory, async_eval=async_eval,
+            fan_out=fan_out, stop_val_schedule=stop_val_schedule,
+            output_file=output,
+            resume=resume, plot_result=plot,
             display=display, html=html, collect=collect,
-            parallel_config=parallel_config, pdb=pdb
+            parallel_config=parallel_config, pin_cpus=pin_cpus, pdb=pdb
         )
 
         print_stats()  # print profiling stats (does nothing if not profiling)
@@ -360,12 +486,22 @@ def run(config_file=None, **kwargs):
         parallel_args += f"--n-jobs {n_jobs} "
     if parallel_config:
         parallel_args += rf"--parallel-config {parallel_config} "
+    if pin_cpus:
+        parallel_args += "--pin-cpus "
     cmd = (
         rf"benchopt run --local {benchmark.benchmark_dir} "
         rf"{f'--n-repetitions {n_repetitions}' if n_repetitions else ''} "
         rf"--max-runs {max_runs} "
         rf"{f'--timeout {timeout} ' if timeout is not None else ''}"
         rf"{'--no-timeout ' if no_timeout else ''} "
+        rf"{f'--time-budget {time_budget} ' if time_budget else ''}"
+        rf"{f'--racing {racing} ' if racing is not None else ''}"
+        rf"{f'--timing-repeat {timing_repeat} ' if timing_repeat else ''}"
+        rf"{f'--timing-window {timing_window} ' if timing_window else ''}"
+        rf"{f'--memory {memory} ' if memory is not None else ''}"
+        rf"{f'--async-eval {async_eval} ' if async_eval else ''}"
+        rf"{f'--fan-out {fan_out} ' if fan_out else ''}"
+        rf"--stop-val-schedule {stop_val_schedule} "
         rf"{solvers_option} {forced_solvers_option} "
         rf"{datasets_option} {objective_option} "
         rf"{'--plot' if plot else '--no-plot'} "
@@ -374,6 +510,7 @@ def run(config_file=None, **kwargs):
         rf"{parallel_args}"
         rf"{'--pdb ' if pdb else ''}"
         rf"{'--profile ' if do_profile else ''}"
+        rf"{f'--resume {resume} ' if resume is not None else ''}"
         rf"{f'--seed {seed}' if seed is not None else ''}"
         rf"--output {output}"
         .replace('\\', '\\\\')
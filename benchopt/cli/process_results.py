@@ -120,6 +120,39 @@ def merge(benchmark, filenames=None, keep='last', output=None):
     merge_helper(result_filenames, keep=keep, output=output)
 
 
+@process_results.command(
+    help="Summarize the share of the run time spent by benchopt around the "
+    "solvers, per solver: evaluation of the objective (eval), stopping "
+    "criterion and progress display (stop), cache (cache) and transfer of the "
+    "runs to the workers (ipc)."
+)
+@click.argument('benchmark', default=Path.cwd(), type=click.Path(exists=True),
+                shell_complete=complete_benchmarks)
+@click.option('--filename', '-f', type=str, default=None,
+              shell_complete=complete_output_files,
+              help="Specify the file to select in the benchmark. If it is "
+              "not specified, take the latest one in the benchmark output "
+              "folder.")
+def overhead(benchmark, filename=None):
+
+    # Get the result file
+    benchmark = Benchmark(benchmark)
+    result_filename = benchmark.get_result_files(filename)[0]
+
+    from benchopt.results import read_results
+    from benchopt.results.process import summarize_overhead
+    summary = summarize_overhead(read_results(result_filename))
+
+    summary = summary.rename(columns=lambda c: c.replace('overhead_', ''))
+    formatters = {
+        col: '{:.1%}'.format for col in summary.columns
+        if col not in ('n_runs', 'run_duration')
+    }
+    formatters['run_duration'] = '{:.2f}s'.format
+    print(f"Overhead of benchopt in {result_filename.name}:")
+    print(summary.to_string(formatters=formatters))
+
+
 @process_results.command(
     help="Publish the result from a previously run benchmark.\n\n"
     "See the :ref:`publish_benchmark` documentation for more info on how "
@@ -0,0 +1,53 @@
+import pytest
+
+from benchopt.cli.main import run
+from benchopt.cli.process_results import overhead
+from benchopt.results import read_results
+from benchopt.results.process import summarize_overhead
+from benchopt.tests.utils import CaptureCmdOutput
+from benchopt.utils.overhead import OVERHEAD_COLUMNS
+from benchopt.utils.temp_benchmark import temp_benchmark
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_overhead(no_debug_log, n_jobs):
+    objective = """from benchopt.utils.temp_benchmark import TempObjective
+        import time
+
+        class Objective(TempObjective):
+            def evaluate_result(self, beta):
+                time.sleep(0.01)
+                return dict(value=1)
+    """
+    solver = """from benchopt.utils.temp_benchmark import TempSolver
+
+        class Solver(TempSolver):
+            name = "cheap"
+            def run(self, n_iter): pass
+            def get_result(self): return dict(beta=1)
+    """
+    with temp_benchmark(objective=objective, solvers=[solver]) as bench:
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            run(f"{bench.benchmark_dir} -d test-dataset --max-runs 5 -r 2 "
+                f"-j {n_jobs} --no-plot".split(), standalone_mode=False)
+
+        df = read_results(out.result_files[0])
+        with CaptureCmdOutput() as out_overhead:
+            overhead(f"{bench.benchmark_dir} -f {out.result_files[0]}".split(),
+                     standalone_mode=False)
+
+    assert all(col in df for col in OVERHEAD_COLUMNS + ['run_duration'])
+    assert (df['overhead_eval'] >= 0.01).all()
+    assert (df['overhead_ipc'] > 0).all() == (n_jobs > 1)
+
+    # The evaluation dominates the run of this cheap solver, and the runs sent
+    # to the workers are pickled.
+    summary = summarize_overhead(df).loc['cheap']
+    assert summary['n_runs'] == 2
+    assert summary['overhead'] <= 1
+    if n_jobs == 1:
+        assert summary['overhead_eval'] > 0.5
+    else:
+        assert summary['overhead_ipc'] > 0
+    out_overhead.check_output("cheap")
+    out_overhead.check_output("eval")
@@ -5,6 +5,7 @@ import click
 import pytest
 from joblib.memory import _FUNCTION_HASHES
 
+from benchopt.results import read_results
 from benchopt.utils.temp_benchmark import temp_benchmark
 
 from benchopt.tests.utils import CaptureCmdOutput
@@ -407,6 +408,71 @@ class TestRunCmd:
             out.check_output(r'done \(not enough run\)', repetition=1)
             out.check_output('not run yet', repetition=1)
 
+    @pytest.mark.parametrize('partial', ["complete", "partial"])
+    def test_resume(self, no_debug_log, partial):
+        solver = """from benchopt.utils.temp_benchmark import TempSolver
+
+            class Solver(TempSolver):
+                name = "test-solver"
+                sampling_strategy = "run_once"
+                parameters = {'param': [0]}
+                def run(self, n_iter): print(f'#RUN{self.param}')
+            """
+
+        with temp_benchmark(solvers=[solver]) as bench:
+            run_cmd = [
+                str(bench.benchmark_dir), *'-d test-dataset -r 2'.split(),
+                '--no-plot', '--no-cache'
+            ]
+            with CaptureCmdOutput(delete_result_files=False) as out:
+                run(run_cmd + ['--output', 'resumed'],
+                    'benchopt', standalone_mode=False)
+            out.check_output('#RUN0', repetition=2)
+            result_file = Path(out.result_files[0])
+
+            if partial == "partial":
+                # Simulate a crashed run, with only the partial results
+                partial_dir = result_file.with_suffix('.partial')
+                partial_dir.mkdir()
+                result_file.rename(partial_dir / "part-000000.parquet")
+
+            with CaptureCmdOutput(delete_result_files=False) as out:
+                run(run_cmd + ['--resume', 'resumed', '-s',
+                               'test-solver[param=[0,1]]'],
+                    'benchopt', standalone_mode=False)
+
+            # Only the new solver is run, and appended to the same file
+            out.check_output('#RUN0', repetition=0)
+            out.check_output('#RUN1', repetition=2)
+            out.check_output(r'test-solver\[param=0\]: done', repetition=1)
+            assert out.result_files == [str(result_file)]
+            assert not result_file.with_suffix('.partial').exists()
+
+            n_reps = read_results(result_file).groupby('solver_name')[
+                'idx_rep'
+            ].nunique()
+            assert n_reps.to_dict() == {
+                'test-solver[param=0]': 2, 'test-solver[param=1]': 2
+            }
+
+            with pytest.raises(click.BadParameter, match="--resume"):
+                run(run_cmd + ['--resume', 'resumed', '--output', 'other'],
+                    'benchopt', standalone_mode=False)
+
+    @pytest.mark.parametrize('option', ['--no-timeout', '--time-budget 10'])
+    def test_racing_incompatible(self, option):
+        with temp_benchmark() as bench:
+            with pytest.raises(click.BadParameter, match="--racing"):
+                cmd = f"{bench.benchmark_dir} --racing 0.5 {option}"
+                run(cmd.split(), 'benchopt', standalone_mode=False)
+
+    @pytest.mark.parametrize('n_jobs', ['', '-j 1'])
+    def test_pin_cpus_no_workers(self, n_jobs):
+        with temp_benchmark() as bench:
+            with pytest.raises(click.BadParameter, match="--pin-cpus"):
+                cmd = f"{bench.benchmark_dir} --pin-cpus {n_jobs}"
+                run(cmd.split(), 'benchopt', standalone_mode=False)
+
     def test_complete_bench(self, bench_completion_cases):  # noqa: F811
 
         # Completion for benchmark name
@@ -33,7 +33,10 @@ DEFAULT_GLOBAL_CONFIG = {
         if sys.platform != 'win32' else DEFAULT_SHELL
     ),
     'cache': None,
+    'cache_solver_results': False,
     'default_timeout': 100,
+    'set_data_cache_size': 1024,
+    'memory_sampling_interval': 20,
     'warn_nonunique_files': True,
     '_g_config_check': False,
     '_bench_config_check': False,
@@ -61,8 +64,21 @@ particular for logging, warnings and errors. The available options are:
   should be stored. By default, the cache files are stored in the benchmark
   directory, under the folder __cache__. Setting this configuration would
   results in having the cache for benchmark `B1` stored in `${cache}/B1/`.
+* ``cache_solver_results``, *bool*: If set to True, store the output of
+  ``Solver.get_result`` in the cache for each ``stop_val``. By default, only
+  the metrics are stored, as the solver output can be large and it is only
+  needed for the final run, to call ``Objective.save_final_results``.
 * ``default_timeout``, *int*: default timeout in seconds for the benchmark
   runs. Default is 100 seconds.
+* ``set_data_cache_size``, *int*: memory budget in MB used by each worker to
+  keep the state of the objectives after ``Objective.set_data``, so it is not
+  recomputed for the next runs with the same objective and dataset. The
+  memory used by an objective is estimated from the size of its attributes
+  and of the data. Set it to 0 to disable this cache. Default is 1024 MB.
+* ``memory_sampling_interval``, *int*: time in ms between two samples of the
+  resident memory of the solvers with ``--memory rss``. Shorter intervals
+  catch shorter peaks, but the sampling thread competes with the solver for
+  the CPU and the GIL, which slows it down. Default is 20 ms.
 * ``warn_nonunique_files``, *bool*: If set to True, raise a warning when a
   results file is about to be overwritten because a file with the same name
   already exists. Mostly useful to deactivate this warning in tests.
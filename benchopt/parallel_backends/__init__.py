@@ -4,7 +4,7 @@ from joblib import Parallel, delayed
 
 _DISTRIBUTED_FRONTAL = False
 
-DISTRIBUTED_BACKENDS = ('loky', 'dask', 'submitit')
+DISTRIBUTED_BACKENDS = ('loky', 'local', 'dask', 'submitit')
 
 
 def set_distributed_frontal():
@@ -16,6 +16,20 @@ def is_distributed_frontal():
     return _DISTRIBUTED_FRONTAL
 
 
+def is_local_parallel(config):
+    """Check if the runs are dispatched to local worker processes."""
+    config = config or {}
+    backend = config.get('backend', 'loky')
+    n_jobs = config.get('n_jobs') or 1
+    return backend == 'local' or (backend == 'loky' and n_jobs != 1)
+
+
+def is_parallel(config):
+    """Check if the runs are dispatched to several workers."""
+    config = config or {}
+    return config.get('backend', 'loky') != 'loky' or is_local_parallel(config)
+
+
 def parallel_run(benchmark, run, run_kwargs_generator, config, collect=False):
     config = config or {}
     backend = config.pop('backend', 'loky')
@@ -29,6 +43,11 @@ def parallel_run(benchmark, run, run_kwargs_generator, config, collect=False):
         results_generator = run_on_slurm(
             benchmark, config, run, run_kwargs_generator
         )
+    elif backend == 'local':
+        from .local_scheduler import run_on_local_scheduler
+        results_generator = run_on_local_scheduler(
+            config, run, run_kwargs_generator
+        )
     else:
         if backend == 'dask':
             from .dask_backend import check_dask_config
@@ -0,0 +1,175 @@
+import time
+from collections import deque
+from concurrent.futures import wait, FIRST_COMPLETED
+
+from joblib.externals.loky import get_reusable_executor
+
+from ..utils.thread_limits import pin_cpus
+from ..utils.thread_limits import get_available_cpus
+
+
+def get_job_resources(run_kwargs):
+    """Return the number of cores and the memory requested by a run.
+
+    The solver and the dataset can declare the number of threads they use
+    with ``n_threads`` and the memory they need with ``memory_gb``. The run
+    uses the largest number of threads, 1 by default, and the sum of the
+    memories, 0 by default.
+
+    Parameters
+    ----------
+    run_kwargs : dict
+        The kwargs of the ``run_one_to_cvg`` call.
+
+    Returns
+    -------
+    n_threads : int
+        Number of cores requested by the run.
+    memory_gb : float
+        Memory requested by the run, in GB.
+    """
+    solver = run_kwargs.get('solver')
+    dataset = getattr(run_kwargs.get('objective'), '_dataset', None)
+    components = [c for c in (solver, dataset) if c is not None]
+    n_threads = max(
+        [getattr(c, 'n_threads', None) or 1 for c in components], default=1
+    )
+    memory_gb = sum(getattr(c, 'memory_gb', None) or 0 for c in components)
+    return n_threads, memory_gb
+
+
+class ResourcePool:
+    """Cores and memory of the machine available for the runs.
+
+    Parameters
+    ----------
+    cpus : list of int
+        Ids of the cores available for the runs.
+    memory_gb : float
+        Memory available for the runs, in GB.
+    """
+
+    def __init__(self, cpus, memory_gb):
+        self.cpus = list(cpus)
+        self.memory_gb = memory_gb
+        self.free_cpus = list(cpus)
+        self.free_memory_gb = memory_gb
+
+    def acquire(self, n_threads, memory_gb):
+        """Reserve the resources for a run if they are available.
+
+        The requests larger than the machine are reduced to the whole
+        machine, so that these runs are run alone instead of never.
+
+        Returns
+        -------
+        resources : tuple | None
+            The reserved cores and memory, or None if the run does not fit in
+            the free resources.
+        """
+        n_threads = min(n_threads, len(self.cpus))
+        memory_gb = min(memory_gb, self.memory_gb)
+        if n_threads > len(self.free_cpus) or memory_gb > self.free_memory_gb:
+            return None
+        cpus = self.free_cpus[:n_threads]
+        del self.free_cpus[:n_threads]
+        self.free_memory_gb -= memory_gb
+        return cpus, memory_gb
+
+    def release(self, resources):
+        "Free the resources reserved by ``acquire``."
+        cpus, memory_gb = resources
+        self.free_cpus = sorted(self.free_cpus + cpus)
+        self.free_memory_gb += memory_gb
+
+
+def _run_job(run, cpus, queue_wait, run_kwargs):
+    "Run a job pinned to its cores and record its waiting time."
+    run_kwargs['run_context'].n_threads = len(cpus)
+    with pin_cpus(cpus):
+        result = run(**run_kwargs)
+    curve, key, status, reason, info = result
+    if info is not None:
+        info = dict(info, queue_wait=queue_wait)
+    return curve, key, status, reason, info
+
+
+def run_on_local_scheduler(config, run, run_kwargs_generator):
+    """Run the jobs on the local machine within its cores and memory.
+
+    A job is only started when the cores and the memory it requests, given by
+    ``get_job_resources``, are free, and it is pinned to its cores. The jobs
+    are considered in the order of the generator, but a job that fits is
+    started before the previous ones waiting for more resources.
+
+    Parameters
+    ----------
+    config : dict
+        The parallel config. The ``local_n_cpus`` and ``local_memory_gb``
+        keys set the resources used by the jobs, by default all the cores of
+        the process and the memory of the machine, and ``n_jobs`` sets the
+        maximal number of jobs running at the same time, by default the
+        number of cores.
+    run : callable
+        Function running one job.
+    run_kwargs_generator : iterable of dict
+        The kwargs of each job.
+
+    Yields
+    ------
+    result : tuple
+        The outputs of ``run`` for each job, as they complete. The time spent
+        by the job waiting for free resources, in seconds, is added as
+        ``queue_wait`` in its info, separately from its run time.
+    """
+    import psutil
+
+    cpus = get_available_cpus()
+    n_cpus = config.get('local_n_cpus')
+    if n_cpus is not None:
+        cpus = cpus[:n_cpus]
+    memory_gb = config.get('local_memory_gb')
+    if memory_gb is None:
+        memory_gb = psutil.virtual_memory().total / 1024 ** 3
+    pool = ResourcePool(cpus, memory_gb)
+    n_workers = config.get('n_jobs') or len(cpus)
+    if n_workers < 0:
+        n_workers = len(cpus)
+
+    executor = get_reusable_executor(max_workers=n_workers)
+    run_kwargs_generator = iter(run_kwargs_generator)
+    pending, running = deque(), {}
+    exhausted = False
+    try:
+        while True:
+            # Look ahead of the generator to find jobs that fit.
+            while not exhausted and len(pending) < n_workers:
+                try:
+                    pending.append((next(run_kwargs_generator), time.time()))
+                except StopIteration:
+                    exhausted = True
+
+            waiting = deque()
+            for run_kwargs, enqueue_time in pending:
+                resources = None
+                if len(running) < n_workers:
+                    resources = pool.acquire(*get_job_resources(run_kwargs))
+                if resources is None:
+                    waiting.append((run_kwargs, enqueue_time))
+                    continue
+                queue_wait = time.time() - enqueue_time
+                future = executor.submit(
+                    _run_job, run, resources[0], queue_wait, run_kwargs
+                )
+                running[future] = resources
+            pending = waiting
+
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                pool.release(running.pop(future))
+                yield future.result()
+    finally:
+        for future in running:
+            future.cancel()
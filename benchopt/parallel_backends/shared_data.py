@@ -0,0 +1,180 @@
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+from collections import defaultdict
+
+import numpy as np
+
+# Values of the data that are not numpy arrays are sent with each job, so
+# only share the data when they are small.
+MAX_INLINE_BYTES = 1024 ** 2
+
+
+def get_shared_folder():
+    """Return the folder where the shared data files are created.
+
+    On Linux, use ``/dev/shm`` so the files are backed by the memory.
+    Otherwise, fall back to the default temporary folder.
+    """
+    shm = Path("/dev/shm")
+    if shm.is_dir():
+        return shm
+    return None
+
+
+class SharedData:
+    """Handle to the data of a dataset, shared with the workers.
+
+    The numpy arrays of the data are stored in ``.npy`` files and loaded as
+    copy-on-write memory maps in the workers, so that all the workers use the
+    same memory, unless they modify the arrays. The other values are stored in
+    the handle and sent with each job.
+
+    Parameters
+    ----------
+    keys : list of str
+        Keys of the data, in the order returned by ``get_data``.
+    arrays : dict
+        Mapping from the data keys to the paths of the ``.npy`` files.
+    values : dict
+        Other values of the data, sent with the handle.
+    used_seed : int | None
+        Seed used to generate the data, to restore the dataset's state.
+    seed_params : dict
+        Seed parameters used to generate the data.
+    """
+
+    def __init__(self, keys, arrays, values, used_seed, seed_params):
+        self.keys = keys
+        self.arrays = arrays
+        self.values = values
+        self.used_seed = used_seed
+        self.seed_params = seed_params
+
+    def load(self, dataset):
+        """Set the shared data in the dataset, to avoid calling get_data.
+
+        Parameters
+        ----------
+        dataset : BaseDataset
+            The dataset instance that produced the data, after unpickling.
+        """
+        data = {
+            key: np.load(path, mmap_mode='c')
+            for key, path in self.arrays.items()
+        }
+        data.update(self.values)
+        dataset._data = {key: data[key] for key in self.keys}
+        dataset._used_seed = self.used_seed
+        dataset._seed_params = dict(self.seed_params)
+
+
+class SharedDataStore:
+    """Store the datasets' data to share them with the local workers.
+
+    The data of each dataset is written once in the store and the files are
+    removed when all the jobs using it have completed, or when the store is
+    closed.
+
+    Parameters
+    ----------
+    folder : str | Path | None
+        Folder in which the shared files are created. If None, use
+        ``/dev/shm`` if it exists and the default temporary folder otherwise.
+    """
+
+    def __init__(self, folder=None):
+        if folder is None:
+            folder = get_shared_folder()
+        self.folder = Path(tempfile.mkdtemp(prefix="benchopt_", dir=folder))
+        self.shared = {}
+        self.n_jobs = defaultdict(int)
+        self.n_written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def share(self, dataset):
+        """Share the data of a dataset for one job.
+
+        Parameters
+        ----------
+        dataset : BaseDataset
+            The dataset whose data is shared, with the run context of the
+            job's repetition.
+
+        Returns
+        -------
+        shared_data : SharedData | None
+            Handle to load the data in the workers. None if the data cannot
+            be shared, in which case it is loaded in the workers.
+        """
+        name = str(dataset)
+        # Load the data before building the key: get_data is called again if
+        # the seed of this repetition differs, which updates `_used_seed`.
+        dataset._get_data()
+        key = (name, dataset._used_seed)
+        if key not in self.shared:
+            self.shared[key] = self._write(dataset)
+        if self.shared[key] is not None:
+            self.n_jobs[name] += 1
+        return self.shared[key]
+
+    def release(self, dataset_name):
+        """Release the data of a dataset after one job completed.
+
+        When no running job uses the data of this dataset anymore, the files
+        are removed.
+        """
+        if self.n_jobs.get(dataset_name, 0) == 0:
+            return
+        self.n_jobs[dataset_name] -= 1
+        if self.n_jobs[dataset_name] > 0:
+            return
+        del self.n_jobs[dataset_name]
+        for key in [k for k in self.shared if k[0] == dataset_name]:
+            shared_data = self.shared.pop(key)
+            if shared_data is not None:
+                for path in shared_data.arrays.values():
+                    Path(path).unlink(missing_ok=True)
+
+    def close(self):
+        """Remove all the shared files."""
+        shutil.rmtree(self.folder, ignore_errors=True)
+        self.shared = {}
+        self.n_jobs.clear()
+
+    def _write(self, dataset):
+        data = dataset._get_data()
+        arrays, values = {}, {}
+        for key, value in data.items():
+            if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+                arrays[key] = value
+            elif _is_small(value):
+                values[key] = value
+            else:
+                return None
+
+        paths = {}
+        for key, value in arrays.items():
+            path = self.folder / f"data_{self.n_written}.npy"
+            np.save(path, value, allow_pickle=False)
+            paths[key] = str(path)
+            self.n_written += 1
+
+        return SharedData(
+            list(data), paths, values, dataset._used_seed,
+            dataset._seed_params
+        )
+
+
+def _is_small(value):
+    "Check that a value can be sent with each job."
+    try:
+        return len(pickle.dumps(value)) <= MAX_INLINE_BYTES
+    except Exception:
+        return False
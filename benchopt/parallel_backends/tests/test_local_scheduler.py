@@ -0,0 +1,92 @@
+from benchopt.cli.main import run
+from benchopt.results import read_results
+from benchopt.utils.temp_benchmark import TempSolver
+from benchopt.utils.temp_benchmark import TempDataset
+from benchopt.utils.temp_benchmark import temp_benchmark
+from benchopt.parallel_backends.local_scheduler import ResourcePool
+from benchopt.parallel_backends.local_scheduler import get_job_resources
+
+from benchopt.tests.utils import CaptureCmdOutput
+
+
+class Solver(TempSolver):
+    name = "solver"
+    n_threads = 2
+    memory_gb = 1
+
+
+class Dataset(TempDataset):
+    name = "dataset"
+    n_threads = 4
+    memory_gb = 2
+
+
+def test_get_job_resources():
+    solver = Solver.get_instance()
+    dataset = Dataset.get_instance()
+
+    class Objective:
+        _dataset = dataset
+
+    assert get_job_resources(dict(solver=solver)) == (2, 1)
+    assert get_job_resources(
+        dict(solver=solver, objective=Objective())
+    ) == (4, 3)
+    assert get_job_resources({}) == (1, 0)
+
+
+def test_resource_pool():
+    pool = ResourcePool(cpus=[0, 1, 2, 3], memory_gb=8)
+
+    first = pool.acquire(3, 2)
+    assert first == ([0, 1, 2], 2)
+    assert pool.acquire(2, 1) is None  # not enough cores
+    second = pool.acquire(1, 6)
+    assert second == ([3], 6)
+    assert pool.acquire(0, 1) is None  # not enough memory
+
+    pool.release(first)
+    assert pool.free_cpus == [0, 1, 2] and pool.free_memory_gb == 2
+
+    # Requests larger than the machine get the whole machine
+    pool.release(second)
+    assert pool.acquire(8, 16) == ([0, 1, 2, 3], 8)
+
+
+def test_local_scheduler_run(no_debug_log):
+    solvers = [
+        f"""from benchopt.utils.temp_benchmark import TempSolver
+        import os
+        import time
+
+        class Solver(TempSolver):
+            name = "solver{i}"
+            sampling_strategy = "run_once"
+            memory_gb = 1
+            def run(self, _):
+                print(f"#CPUS={{len(os.sched_getaffinity(0))}}")
+                time.sleep(0.5)
+        """ for i in range(2)
+    ]
+    parallel_config = """
+    backend: local
+    n_jobs: 2
+    local_n_cpus: 1
+    local_memory_gb: 1
+    """
+    with temp_benchmark(
+        solvers=solvers, config={"parallel_config.yml": parallel_config}
+    ) as bench:
+        config_file = bench.benchmark_dir / "parallel_config.yml"
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            run(f"{bench.benchmark_dir} -d test-dataset --no-plot --no-cache "
+                f"--parallel-config {config_file}".split(),
+                standalone_mode=False)
+
+        df = read_results(out.result_files[0])
+
+    # The jobs are pinned to their core and run one after the other as they
+    # do not fit in memory together.
+    out.check_output("#CPUS=1", repetition=2)
+    queue_wait = df.groupby('solver_name')['queue_wait'].first()
+    assert queue_wait.min() < 0.5 <= queue_wait.max()
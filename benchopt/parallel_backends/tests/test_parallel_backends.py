@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 
@@ -184,3 +186,81 @@ def test_submitit_backend(monkeypatch):
             ], standalone_mode=False)
 
     out.check_output("Distributed run with backend: submitit", repetition=1)
+
+
+def test_lazy_data(no_debug_log):
+    parallel_config = """backend: loky
+    n_jobs: 2
+    lazy_data: true
+    """
+    objective = """from benchopt.utils.temp_benchmark import TempObjective
+    import os
+
+    class Objective(TempObjective):
+        def skip(self, X, y):
+            print(f"#SKIP={os.getpid()}")
+            if X == 2:
+                return True, "X is too large"
+            return False, None
+    """
+    dataset = """from benchopt.utils.temp_benchmark import TempDataset
+    import os
+
+    class Dataset(TempDataset):
+        name = "test-dataset"
+        parameters = {'X': [1, 2]}
+
+        def get_data(self):
+            print(f"#GET_DATA={os.getpid()}")
+            return dict(X=self.X, y=0)
+    """
+
+    with temp_benchmark(
+            objective=objective, datasets=dataset,
+            config={"parallel_config.yml": parallel_config}
+    ) as bench:
+        parallel_config_file = bench.benchmark_dir / "parallel_config.yml"
+        with CaptureCmdOutput() as out:
+            run([
+                str(bench.benchmark_dir),
+                *"-s test-solver -d test-dataset -n 0 -r 2 --no-plot "
+                f"--no-cache --parallel-config {parallel_config_file}".split()
+            ], standalone_mode=False)
+
+    # The data is only loaded in the workers, which also check if the runs
+    # should be skipped, and report it for each repetition.
+    out.check_output(f"#GET_DATA={os.getpid()}", repetition=0)
+    out.check_output(f"#SKIP={os.getpid()}", repetition=0)
+    out.check_output("#SKIP=", repetition=4)
+    out.check_output("Reason: X is too large", repetition=2)
+
+
+def test_lazy_data_config_not_modified(no_debug_log):
+    from benchopt.runner import _run_benchmark
+
+    dataset = """from benchopt.utils.temp_benchmark import TempDataset
+    import os
+
+    class Dataset(TempDataset):
+        name = "test-dataset"
+
+        def get_data(self):
+            print(f"#GET_DATA={os.getpid()}")
+            return dict(X=1, y=0)
+    """
+
+    # The same config can be used for several runs.
+    parallel_config = dict(backend='loky', n_jobs=2, lazy_data=True)
+    with temp_benchmark(datasets=dataset) as bench:
+        for _ in range(2):
+            with CaptureCmdOutput() as out:
+                _run_benchmark(
+                    bench,
+                    solvers=bench.check_solver_patterns(["test-solver"]),
+                    datasets=bench.check_dataset_patterns(["test-dataset"]),
+                    objectives=bench.check_objective_filters([]),
+                    max_runs=0, plot_result=False,
+                    parallel_config=parallel_config
+                )
+            out.check_output(f"#GET_DATA={os.getpid()}", repetition=0)
+    assert parallel_config == dict(backend='loky', n_jobs=2, lazy_data=True)
@@ -0,0 +1,111 @@
+import numpy as np
+
+from benchopt.cli.main import run
+from benchopt.utils.temp_benchmark import TempDataset
+from benchopt.utils.temp_benchmark import temp_benchmark
+from benchopt.parallel_backends.shared_data import SharedDataStore
+
+from benchopt.tests.utils import CaptureCmdOutput
+
+
+class Dataset(TempDataset):
+    name = "shared-dataset"
+    parameters = {'z': [None]}
+
+    def get_data(self):
+        return dict(X=np.arange(10.), y=1, z=self.z)
+
+
+def test_shared_data_store(tmp_path):
+    dataset = Dataset.get_instance(z='small')
+
+    with SharedDataStore(folder=tmp_path) as store:
+        shared_data = store.share(dataset)
+        assert store.share(dataset) is shared_data
+        assert len(list(store.folder.glob('*.npy'))) == 1
+
+        # The data is loaded without calling get_data
+        other = Dataset.get_instance(z=None)
+        shared_data.load(other)
+        data = other._get_data()
+        assert list(data) == ['X', 'y', 'z']
+        assert isinstance(data['X'], np.memmap)
+        np.testing.assert_array_equal(data['X'], np.arange(10.))
+        assert data['y'] == 1 and data['z'] == 'small'
+
+        # The files are removed once all the jobs are completed
+        store.release(str(dataset))
+        assert len(list(store.folder.glob('*.npy'))) == 1
+        store.release(str(dataset))
+        assert len(list(store.folder.glob('*.npy'))) == 0
+    assert not store.folder.exists()
+
+
+def test_shared_data_store_large_values(tmp_path):
+    # Large values that are not numpy arrays are not sent with each job, so
+    # the data is loaded in the workers.
+    dataset = Dataset.get_instance(z=list(range(10 ** 6)))
+    with SharedDataStore(folder=tmp_path) as store:
+        assert store.share(dataset) is None
+
+
+def test_shared_data_run(no_debug_log):
+    dataset = """from benchopt.utils.temp_benchmark import TempDataset
+        import numpy as np
+
+        class Dataset(TempDataset):
+            name = "test-dataset"
+            def get_data(self):
+                print("#GET_DATA")
+                return dict(X=np.ones((10, 2)), y=np.ones(10))
+    """
+    objective = """from benchopt.utils.temp_benchmark import TempObjective
+        import numpy as np
+
+        class Objective(TempObjective):
+            def set_data(self, X, y):
+                print(f"#SHARED={isinstance(X, np.memmap)}")
+    """
+
+    with temp_benchmark(objective=objective, datasets=dataset) as bench:
+        with CaptureCmdOutput() as out:
+            run(f"{bench.benchmark_dir} -d test-dataset -s test-solver "
+                "-r 2 -j 2 -n 1 --no-plot --no-cache".split(),
+                standalone_mode=False)
+
+    # The data is only loaded in the main process, and the workers use the
+    # shared arrays.
+    out.check_output("#GET_DATA", repetition=1)
+    out.check_output("#SHARED=True", repetition=2)
+
+
+def test_shared_data_run_seeded(no_debug_log):
+    # The data depends on the repetition: it is loaded once per repetition
+    # in the main process, and each worker uses the data of its repetition.
+    dataset = """from benchopt.utils.temp_benchmark import TempDataset
+        import numpy as np
+
+        class Dataset(TempDataset):
+            name = "test-dataset"
+            def get_data(self):
+                seed = self.get_seed(use_repetition=True)
+                print(f"#GET_DATA={seed}")
+                return dict(X=np.full((10, 2), seed), y=np.ones(10))
+    """
+    objective = """from benchopt.utils.temp_benchmark import TempObjective
+        import numpy as np
+
+        class Objective(TempObjective):
+            def set_data(self, X, y):
+                seed = self._dataset.get_seed(use_repetition=True)
+                print(f"#SHARED={isinstance(X, np.memmap)},{X[0, 0] == seed}")
+    """
+
+    with temp_benchmark(objective=objective, datasets=dataset) as bench:
+        with CaptureCmdOutput() as out:
+            run(f"{bench.benchmark_dir} -d test-dataset -s test-solver "
+                "-r 2 -j 2 -n 1 --no-plot --no-cache".split(),
+                standalone_mode=False)
+
+    out.check_output("#GET_DATA=", repetition=2)
+    out.check_output("#SHARED=True,True", repetition=2)
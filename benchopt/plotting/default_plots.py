@@ -2,6 +2,39 @@ from .base import BasePlot
 
 EPS = 1e-8
 
+# Columns of the results summed to get each X axis of the objective curve,
+# apart from "Iteration" which uses the stop_val.
+X_AXIS_COLUMNS = {
+    "Time": ["time"],
+    "CPU time": ["cpu_time"],
+    "Context switches": [
+        "ctx_switches_voluntary", "ctx_switches_involuntary"
+    ],
+    "Page faults": ["page_faults_major", "page_faults_minor"],
+}
+
+# Columns of the peak memory of the solvers, for each memory measure.
+MEMORY_AXIS_COLUMNS = {
+    "Peak RSS": "memory_peak_rss",
+    "Peak allocations": "memory_peak_alloc",
+}
+
+
+def _get_x_axis_options(df):
+    "X axes of the objective curve, with the resources present in the results."
+    return ["Time", "Iteration"] + [
+        X_axis for X_axis, columns in X_AXIS_COLUMNS.items()
+        if X_axis != "Time" and all(col in df for col in columns)
+    ]
+
+
+def _get_memory_options(df):
+    "Memory measures present in the results, with a default if none are."
+    options = [
+        memory for memory, col in MEMORY_AXIS_COLUMNS.items() if col in df
+    ]
+    return options or ["Peak RSS"]
+
 
 class ObjectiveCurvePlot(BasePlot):
     name = "objective_curve"
@@ -10,7 +43,7 @@ class ObjectiveCurvePlot(BasePlot):
         "dataset": ...,
         "objective": ...,
         "objective_column": ...,
-        "X_axis": ["Time", "Iteration"],
+        "X_axis": _get_x_axis_options,
     }
 
     def plot(self, df, dataset, objective, objective_column, X_axis):
@@ -19,6 +52,10 @@ class ObjectiveCurvePlot(BasePlot):
         from pandas.api.types import is_numeric_dtype
         if not is_numeric_dtype(df[objective_column]):
             return plots
+        # Results from older versions do not have the resource columns.
+        x_columns = X_AXIS_COLUMNS.get(X_axis, [])
+        if any(col not in df for col in x_columns):
+            return plots
 
         df = df.query(
             "dataset_name == @dataset and objective_name == @objective"
@@ -42,7 +79,8 @@ class ObjectiveCurvePlot(BasePlot):
             if X_axis == "Iteration":
                 x = y.index
             else:
-                x = df_filtered.groupby('stop_val')['time'].median()
+                x_values = df_filtered[x_columns].sum(axis=1)
+                x = x_values.groupby(df_filtered['stop_val']).median()
 
             curve_data = {
                 "x": x.tolist(),
@@ -51,11 +89,11 @@ class ObjectiveCurvePlot(BasePlot):
                 **self.get_style(solver)
             }
 
-            if X_axis == "Time" and df_filtered['idx_rep'].nunique() > 1:
+            if X_axis != "Iteration" and df_filtered['idx_rep'].nunique() > 1:
                 # Compute the quantiles for runtime
                 q = (
-                    df_filtered.groupby('stop_val')['time'].quantile([.2, .8])
-                    .unstack()
+                    x_values.groupby(df_filtered['stop_val'])
+                    .quantile([.2, .8]).unstack()
                 )
                 curve_data['x_low'] = q[.2].tolist()
                 curve_data['x_high'] = q[.8].tolist()
@@ -75,6 +113,50 @@ class ObjectiveCurvePlot(BasePlot):
         }
 
 
+class ObjectiveMemoryPlot(BasePlot):
+    name = "objective_memory"
+    type = "scatter"
+    options = {
+        "dataset": ...,
+        "objective": ...,
+        "objective_column": ...,
+        "memory": _get_memory_options,
+    }
+
+    def plot(self, df, dataset, objective, objective_column, memory):
+        plots = []
+        # The memory is only measured when running with --memory.
+        from pandas.api.types import is_numeric_dtype
+        memory_column = MEMORY_AXIS_COLUMNS[memory]
+        if (memory_column not in df
+                or not is_numeric_dtype(df[objective_column])):
+            return plots
+
+        df = df.query(
+            "dataset_name == @dataset and objective_name == @objective"
+        )
+
+        for solver, df_filtered in df.groupby('solver_name'):
+            df_median = df_filtered.groupby('stop_val')[
+                [memory_column, objective_column]
+            ].median()
+            plots.append({
+                "x": (df_median[memory_column] / 1024 ** 2).tolist(),
+                "y": df_median[objective_column].tolist(),
+                "label": solver,
+                **self.get_style(solver)
+            })
+
+        return plots
+
+    def get_metadata(self, df, dataset, objective, objective_column, memory):
+        return {
+            "title": f"{objective}\nData: {dataset}",
+            "xlabel": f"{memory} [MB]",
+            "ylabel": "Objective Value",
+        }
+
+
 class BarChart(BasePlot):
     name = "bar_chart"
     type = "bar_chart"
@@ -30,7 +30,8 @@ SYS_INFO = {
              ],
     "sub": [('platform', 'platform'),
             ('system-processor', 'processor'),
-            ('env-OMP_NUM_THREADS', 'nb threads')
+            ('env-OMP_NUM_THREADS', 'nb threads'),
+            ('env-blas-threads', 'blas threads')
             ],
     "ter": [("version-numpy", "numpy"),
             ("version-scipy", "scipy")
@@ -23,6 +23,10 @@ def get_figures(benchmark, df, output_dir, kinds):
 def get_plot_figure(plot_datas, output_dir):
     figs = []
     for key, plot_data in plot_datas.items():
+        if len(plot_data["data"]) == 0:
+            # Do not save empty figures, e.g. for the objective_memory plot
+            # when the memory was not measured.
+            continue
         if plot_data["type"] == "scatter":
             fig = get_plot_scatter(plot_data)
         elif plot_data["type"] == "bar_chart":
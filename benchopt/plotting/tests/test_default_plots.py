@@ -2,6 +2,7 @@ import pytest
 import pandas as pd
 
 from benchopt.plotting.default_plots import ObjectiveCurvePlot
+from benchopt.plotting.default_plots import ObjectiveMemoryPlot
 
 
 def _make_df(idx_rep=0, n_steps=5, objective_column='objective_value',
@@ -141,3 +142,38 @@ def test_objective_curve_quantiles_ordered():
 
     for low, mid, high in zip(trace['x_low'], trace['x'], trace['x_high']):
         assert low <= mid <= high
+
+
+def test_objective_curve_resource_axis():
+    """The resource X axes sum their columns, and are skipped if missing."""
+    df = _make_df(n_steps=3)
+
+    plot = ObjectiveCurvePlot()
+    kwargs = dict(
+        dataset='d1', objective='obj1', objective_column='objective_value',
+        X_axis='Context switches'
+    )
+    assert plot.plot(df, **kwargs) == []
+
+    df['ctx_switches_voluntary'] = [1, 2, 3]
+    df['ctx_switches_involuntary'] = [0, 1, 4]
+    trace = plot.plot(df, **kwargs)[0]
+    assert trace['x'] == [1, 3, 7]
+
+
+def test_objective_memory_plot():
+    """The memory plot uses the peak memory in MB, and is empty without it."""
+    df = _make_df(n_steps=3)
+
+    plot = ObjectiveMemoryPlot()
+    assert plot.options['memory'](df) == ['Peak RSS']
+    kwargs = dict(
+        dataset='d1', objective='obj1', objective_column='objective_value',
+        memory='Peak RSS'
+    )
+    assert plot.plot(df, **kwargs) == []
+
+    df['memory_peak_rss'] = [1024 ** 2, 2 * 1024 ** 2, 4 * 1024 ** 2]
+    trace = plot.plot(df, **kwargs)[0]
+    assert trace['x'] == [1., 2., 4.]
+    assert trace['y'] == [0., 1., 2.]
@@ -1,24 +1,31 @@
 import warnings
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
 
-from .parquet import to_parquet, unpack, PICKLE_PREFIX, ST_PREFIX
+from .parquet import to_parquet, concat_parquet, get_metadata
+from .parquet import unpack, PICKLE_PREFIX, ST_PREFIX
 
-from .files_utils import uniquify_fname
+from .files_utils import rm_folder, uniquify_fname
 from ..utils.terminal_output import TerminalOutput
 
 
-def read_results(path):
+def read_results(path, columns=None):
     """Read a benchopt's result file given a path.
 
-    The file can be either a parquet file or a csv file.
+    The file can be either a parquet file or a csv file. It can also be the
+    folder of partial results written by a ``ResultWriter`` that was not
+    closed, e.g. when a run crashed.
     Column "data_name" is renamed to "dataset_name" for backward compatibility.
 
     Parameters
     ----------
     path: str | Path
         Path to the parquet file to read.
+    columns: list of str | None
+        If not None, only read these columns from the file.
 
     Returns
     -------
@@ -27,10 +34,15 @@ def read_results(path):
     """
     path = Path(path)
 
-    if path.suffix == '.parquet':
-        df = pd.read_parquet(path)
+    if path.is_dir():
+        df = pd.concat([
+            pd.read_parquet(f, columns=columns)
+            for f in ResultWriter.get_parts(path)
+        ], ignore_index=True)
+    elif path.suffix == '.parquet':
+        df = pd.read_parquet(path, columns=columns)
     elif path.suffix == '.csv':
-        df = pd.read_csv(path)
+        df = pd.read_csv(path, usecols=columns)
     else:
         raise ValueError(
             f"Unsupported file format: {path.suffix}. "
@@ -56,6 +68,20 @@ def read_results(path):
     return df
 
 
+def _check_result_suffix(path):
+    "Make sure the result path is a parquet or csv file."
+    path = Path(path)
+    if path.suffix not in [".parquet", ".csv"]:
+        if path.suffix != "":
+            warnings.warn(
+                f"Unsupported file format: {path.suffix}. "
+                "Only .parquet and .csv files are supported. "
+                "Defaulting to parquet."
+            )
+        path = path.with_suffix(".parquet")
+    return path
+
+
 def save_results(df, path, uniquify=True):
     """Save a DataFrame in a fila at the given path.
 
@@ -78,15 +104,7 @@ def save_results(df, path, uniquify=True):
     if "run_date" not in df.columns:
         df["run_date"] = pd.Timestamp.now().isoformat()
 
-    path = Path(path)
-    if path.suffix not in [".parquet", ".csv"]:
-        if path.suffix != "":
-            warnings.warn(
-                f"Unsupported file format: {path.suffix}. "
-                "Only .parquet and .csv files are supported. "
-                "Defaulting to parquet."
-            )
-        path = path.with_suffix(".parquet")
+    path = _check_result_suffix(path)
     if uniquify:
         path = uniquify_fname(path)
     if path.suffix == '.parquet':
@@ -102,3 +120,173 @@ def save_results(df, path, uniquify=True):
         f"Unsupported file format: {path.suffix}. "
         "Only .parquet and .csv files are supported."
     )
+
+
+class ResultWriter:
+    """Write the results of a benchmark incrementally.
+
+    Each call to ``write`` stores the given rows in a new parquet file in a
+    ``<output>.partial`` folder, so the memory used does not grow with the
+    number of runs and the results survive if the process is killed. This
+    folder can be read with ``read_results``. When the writer is closed, the
+    partial files are gathered in the final output file and the folder is
+    removed.
+
+    Parameters
+    ----------
+    path: str | Path
+        Path of the final output file. If it already exists, a suffix is
+        added to the filename to avoid overwriting it, unless ``resume`` is
+        set to True.
+    resume: bool, default=False
+        If True, the existing results in ``path`` and in its partial folder
+        are kept, and the new results are appended to them in ``path``. The
+        metadata of ``path`` are also kept.
+
+    Attributes
+    ----------
+    metadata: dict
+        Metadata stored in the output file when it is a parquet file. It can
+        be updated until the writer is closed.
+    """
+
+    def __init__(self, path, resume=False):
+        self.path = _check_result_suffix(path)
+        self.partial_dir = self.path.with_suffix(".partial")
+        self.run_date = pd.Timestamp.now().isoformat()
+        self.resume = resume
+        self.n_parts = 0
+        self.n_resumed = 0
+        self.output_file = None
+        self.metadata = {}
+
+        if not resume:
+            if self.partial_dir.exists():
+                self.partial_dir = uniquify_fname(self.partial_dir)
+            return
+
+        # Continue the numbering of the existing parts and move the existing
+        # output in the partial folder, so it is gathered with the new results.
+        parts = self.get_parts(self.partial_dir)
+        if len(parts) > 0:
+            self.n_parts = int(parts[-1].stem.split("-")[1]) + 1
+        if self.path.exists():
+            # Keep the metadata of the existing output, such as the runs that
+            # were not completed or the plot configs.
+            self.metadata = get_metadata(self.path)
+            if (self.path.suffix == '.parquet'
+                    and pq.read_metadata(self.path).num_rows == 0):
+                # The output only stores the metadata.
+                self.path.unlink()
+            elif self.path.suffix == '.parquet':
+                self.partial_dir.mkdir(parents=True, exist_ok=True)
+                self.path.replace(self._get_next_part())
+                self.n_parts += 1
+            else:
+                self.write(read_results(self.path))
+                self.path.unlink()
+        # Number of parts with the results being resumed.
+        self.n_resumed = self.n_parts
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif self.n_parts > 0:
+            print(f"Partial results are kept in: {self.partial_dir}")
+
+    @staticmethod
+    def get_parts(partial_dir):
+        "List the partial result files in a folder, in writing order."
+        return sorted(Path(partial_dir).glob("part-*.parquet"))
+
+    def write(self, rows, info=None):
+        """Append a list of result rows to the partial results.
+
+        Parameters
+        ----------
+        rows: list of dict | pd.DataFrame
+            Rows to add to the results, typically the curve of one run.
+        info: dict | None
+            Values shared by all the rows, such as the info on the system
+            where the run was performed. They are added as constant columns.
+        """
+        if len(rows) == 0:
+            return
+        df = pd.DataFrame(rows)
+        for key, value in (info or {}).items():
+            df[key] = value
+        if "run_date" not in df.columns:
+            df["run_date"] = self.run_date
+
+        # Write in a temporary file first, so a crash while writing never
+        # leaves a corrupted part in the folder.
+        self.partial_dir.mkdir(parents=True, exist_ok=True)
+        part = self._get_next_part()
+        tmp_part = part.with_suffix(".tmp")
+        to_parquet(df, tmp_part)
+        tmp_part.replace(part)
+        self.n_parts += 1
+
+    def drop_resumed_runs(self, keys, columns):
+        """Remove runs from the resumed results, before gathering them.
+
+        This is used to replace the results of the runs that were run again
+        in the new session.
+
+        Parameters
+        ----------
+        keys: set of tuple
+            Values of ``columns`` for the runs to remove.
+        columns: list of str
+            Columns identifying a run in the results.
+        """
+        if not self.resume or len(keys) == 0:
+            return
+        for part in self.get_parts(self.partial_dir):
+            if int(part.stem.split("-")[1]) >= self.n_resumed:
+                break
+            table = pq.read_table(part)
+            df = table.select(columns).to_pandas()
+            keep = [
+                run not in keys
+                for run in df.itertuples(index=False, name=None)
+            ]
+            if all(keep):
+                continue
+            tmp_part = part.with_suffix(".tmp")
+            pq.write_table(table.filter(pa.array(keep)), tmp_part)
+            tmp_part.replace(part)
+
+    def _get_next_part(self):
+        return self.partial_dir / f"part-{self.n_parts:06d}.parquet"
+
+    def close(self):
+        """Gather the partial results in the output file.
+
+        When no results were written, a parquet output file is still created
+        to store the metadata, if any.
+
+        Returns
+        -------
+        output_file: Path | None
+            Path of the output file, or None if nothing was written.
+        """
+        parts = self.get_parts(self.partial_dir)
+        path = self.path if self.resume else uniquify_fname(self.path)
+        if len(parts) == 0:
+            if not self.metadata or path.suffix != '.parquet':
+                return None
+            to_parquet(pd.DataFrame(), path, metadata=self.metadata)
+        elif path.suffix == '.parquet':
+            concat_parquet(parts, path, metadata=self.metadata or None)
+        else:
+            df = pd.concat([read_results(p) for p in parts], ignore_index=True)
+            df.to_csv(path, index=False)
+        if self.partial_dir.exists():
+            rm_folder(self.partial_dir)
+        TerminalOutput().savefile_status(path)
+        self.output_file = path
+        return path
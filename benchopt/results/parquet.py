@@ -93,19 +93,8 @@ PICKLE_PREFIX = _PKL_PREFIX
 ST_PREFIX = _ST_PREFIX
 
 
-def to_parquet(df, path, metadata=None):
-    """Write a ``pandas.DataFrame`` in a parquet file, with optional metadata.
-
-    Parameters
-    ----------
-    df: pd.DataFrame
-        DataFrame to write in the parquet file.
-    path: str | Path
-        Path to write the parquet file.
-    metadata: dict or None
-        Metadata to store in the parquet file. This metadata should be
-        serializable with json.
-    """
+def _to_table(df, metadata=None):
+    """Convert a ``pandas.DataFrame`` to a ``pyarrow.Table`` with metadata."""
     # Pack any non-primitive values (numpy arrays, etc.) so pyarrow can
     # store them as binary columns. After packing, columns that contain
     # sentinel bytes must be explicitly typed as binary so pyarrow does not
@@ -148,8 +137,67 @@ def to_parquet(df, path, metadata=None):
         JSON_KEY: json.dumps(metadata or {}).encode("utf-8"),
         **table.schema.metadata
     }
-    table = table.replace_schema_metadata(new_metadata)
-    pq.write_table(table, path)
+    return table.replace_schema_metadata(new_metadata)
+
+
+def to_parquet(df, path, metadata=None):
+    """Write a ``pandas.DataFrame`` in a parquet file, with optional metadata.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        DataFrame to write in the parquet file.
+    path: str | Path
+        Path to write the parquet file.
+    metadata: dict or None
+        Metadata to store in the parquet file. This metadata should be
+        serializable with json.
+    """
+    pq.write_table(_to_table(df, metadata=metadata), path)
+
+
+def concat_parquet(paths, path, metadata=None):
+    """Concatenate parquet files in a single file, with optional metadata.
+
+    The files are streamed through a ``pyarrow.parquet.ParquetWriter``, one
+    row group per input file, so only one of them is loaded in memory at a
+    time. Columns missing from some files are filled with nulls.
+
+    Parameters
+    ----------
+    paths: list of str | Path
+        Paths of the parquet files to concatenate.
+    path: str | Path
+        Path to write the parquet file.
+    metadata: dict or None
+        Metadata to store in the parquet file. This metadata should be
+        serializable with json.
+    """
+    try:
+        schema = pa.unify_schemas(
+            [pq.read_schema(p).remove_metadata() for p in paths],
+            promote_options="permissive"
+        )
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+        # Incompatible column types (e.g. int and str), or pyarrow<14 which
+        # does not support `promote_options`: fall back to pandas, which
+        # casts these columns to str in `to_parquet`.
+        df = pd.concat([pd.read_parquet(p) for p in paths], ignore_index=True)
+        to_parquet(df, path, metadata=metadata)
+        return
+
+    schema = schema.with_metadata(
+        {JSON_KEY: json.dumps(metadata or {}).encode("utf-8")}
+    )
+    with pq.ParquetWriter(path, schema) as writer:
+        for p in paths:
+            table = pq.read_table(p)
+            writer.write_table(pa.Table.from_arrays([
+                table.column(field.name).cast(field.type)
+                if field.name in table.column_names
+                else pa.nulls(len(table), type=field.type)
+                for field in schema
+            ], schema=schema))
 
 
 def update_metadata(path, metadata):
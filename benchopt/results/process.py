@@ -47,3 +47,57 @@ def merge(result_filenames, keep='last', output=None):
     df = merge_results(result_filenames, keep=keep)
     result_path = save_results(df, output)
     return result_path
+
+
+def summarize_overhead(df):
+    """Summarize the time spent by benchopt around the solvers.
+
+    For each solver, the time spent in each phase of the overhead, see
+    ``benchopt.utils.overhead.OVERHEAD_COLUMNS``, is summed over its runs and
+    divided by the total duration of its runs, including the transfer to the
+    workers.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        DataFrame containing the results of the benchmark.
+
+    Returns
+    -------
+    summary: pd.DataFrame
+        DataFrame indexed by the solver names, with the number of runs, their
+        total duration in seconds and the share of each phase of the overhead
+        in this duration. The ``overhead`` column is the share of all phases.
+    """
+    from ..utils.overhead import OVERHEAD_COLUMNS
+
+    if "run_duration" not in df.columns:
+        raise ValueError(
+            "The results do not contain the duration of the runs. They were "
+            "produced with a version of benchopt that does not measure its "
+            "overhead."
+        )
+    df = df.copy()
+    for col in OVERHEAD_COLUMNS:
+        if col not in df.columns:
+            df[col] = 0.
+        df[col] = df[col].fillna(0.)
+
+    # The duration of the run and the transfer to the worker are the same for
+    # all the rows of a run, while the other phases are measured per point.
+    run_columns = ["dataset_name", "objective_name", "solver_name", "idx_rep"]
+    if "run_date" in df.columns:
+        run_columns.append("run_date")
+    per_point = [c for c in OVERHEAD_COLUMNS if c != "overhead_ipc"]
+    runs = df.groupby(run_columns).agg({
+        **{col: "sum" for col in per_point},
+        "overhead_ipc": "first", "run_duration": "first",
+    })
+    runs["run_duration"] += runs["overhead_ipc"]
+
+    summary = runs.groupby("solver_name").sum()
+    shares = summary[OVERHEAD_COLUMNS].div(summary["run_duration"], axis=0)
+    shares["overhead"] = shares.sum(axis=1)
+    shares.insert(0, "run_duration", summary["run_duration"])
+    shares.insert(0, "n_runs", runs.groupby("solver_name").size())
+    return shares.sort_values("overhead", ascending=False)
@@ -8,11 +8,12 @@ import pytest
 import yaml
 from pathlib import Path
 
-from benchopt.results import read_results
+from benchopt.results import read_results, ResultWriter
 from benchopt.results.parquet import (
     JSON_KEY,
     _PKL_PREFIX,
     _SafeUnpickler,
+    concat_parquet,
     get_metadata,
     pack,
     to_parquet,
@@ -171,6 +172,92 @@ def test_to_parquet_metadata_roundtrip(tmp_path):
     assert stored == meta
 
 
+def test_concat_parquet(tmp_path):
+    """Files with different columns and dtypes are merged in one file."""
+    import pyarrow.parquet as pq
+
+    dfs = [
+        pd.DataFrame({"x": [1, 2], "p_solver_a": [None, None]}),
+        pd.DataFrame({"x": [1.5], "p_solver_a": ["auto"], "y": [[1]]}),
+        pd.DataFrame({"x": [3], "p_solver_b": [0.1]}),
+    ]
+    paths = []
+    for i, df in enumerate(dfs):
+        paths.append(tmp_path / f"part-{i}.parquet")
+        to_parquet(df, paths[-1])
+
+    path = tmp_path / "results.parquet"
+    concat_parquet(paths, path, metadata={"key": "val"})
+
+    # One row group per input file
+    assert pq.ParquetFile(path).num_row_groups == 3
+    assert get_metadata(path) == {"key": "val"}
+
+    df = read_results(path)
+    assert df["x"].tolist() == [1, 2, 1.5, 3]
+    assert df["p_solver_a"].tolist()[2] == "auto"
+    assert df["y"].iloc[2] == [1]
+    assert df["p_solver_b"].isna().sum() == 3
+
+    # Incompatible dtypes fall back to a str column
+    to_parquet(pd.DataFrame({"x": ["auto"]}), paths[-1])
+    concat_parquet(paths, path)
+    assert read_results(path)["x"].tolist() == ["1", "2", "1.5", "auto"]
+
+
+def test_concat_parquet_old_pyarrow(tmp_path, monkeypatch):
+    """With pyarrow<14, which has no `promote_options`, use pandas."""
+    import pyarrow as pa
+
+    def unify_schemas(schemas):
+        return pa.schema([])
+
+    monkeypatch.setattr(pa, "unify_schemas", unify_schemas)
+
+    paths = []
+    for i, x in enumerate([[1, 2], [1.5]]):
+        paths.append(tmp_path / f"part-{i}.parquet")
+        to_parquet(pd.DataFrame({"x": x}), paths[-1])
+
+    path = tmp_path / "results.parquet"
+    concat_parquet(paths, path, metadata={"key": "val"})
+    assert get_metadata(path) == {"key": "val"}
+    assert read_results(path)["x"].tolist() == [1, 2, 1.5]
+
+
+@pytest.mark.parametrize("suffix", ["parquet", "csv"])
+def test_result_writer(tmp_path, suffix):
+    """Results are readable while written, and gathered when closed."""
+    path = tmp_path / f"results.{suffix}"
+    writer = ResultWriter(path)
+    writer.write([dict(solver_name="s1", time=0.1)])
+    writer.write([])
+    writer.write([dict(solver_name="s2", time=0.2, final_results=[1])])
+
+    # The partial results can be read before the writer is closed
+    df = read_results(writer.partial_dir)
+    assert df["solver_name"].tolist() == ["s1", "s2"]
+    assert df["run_date"].nunique() == 1
+
+    assert writer.close() == path
+    assert not writer.partial_dir.exists()
+    df = read_results(path)
+    assert df["solver_name"].tolist() == ["s1", "s2"]
+
+    # Nothing written: no output file is created
+    with ResultWriter(tmp_path / "empty.parquet") as writer:
+        pass
+    assert writer.output_file is None
+
+    # The partial results are kept if the run fails
+    with pytest.raises(KeyboardInterrupt):
+        with ResultWriter(path) as writer:
+            writer.write([dict(solver_name="s1", time=0.1)])
+            raise KeyboardInterrupt
+    assert writer.output_file is None
+    assert len(read_results(writer.partial_dir)) == 1
+
+
 def test_parquet_metadata(tmp_path):
     df = pd.DataFrame({
         'a': range(4),
@@ -1,21 +1,53 @@
+import os
 import time
+import warnings
+import contextlib
+from math import ceil, inf
+from functools import partial
+from itertools import groupby
 from datetime import datetime
 from pathlib import Path
 
+from joblib import effective_n_jobs
+
 from .callback import _Callback
+from .config import get_setting
 from .benchmark import Benchmark
+from .stopping_criterion import SingleRunCriterion
+from .stopping_criterion import STOP_VAL_SCHEDULES
 from .utils.sys_info import get_sys_info
+from .utils.set_data_cache import SET_DATA_CACHE
 from .utils.pdb_helpers import exception_handler
+from .utils.resource_usage import RESOURCE_COLUMNS
+from .utils.resource_usage import get_resource_usage
+from .utils.resource_usage import diff_resource_usage
+from .utils.resource_usage import MemorySampler
+from .utils.resource_usage import MEMORY_COLUMNS
+from .utils.overhead import DispatchTimer
+from .utils.thread_limits import limit_threads
+from .utils.thread_limits import pin_cpus
+from .utils.thread_limits import WorkerPinning
+from .utils.thread_limits import get_available_cpus
+from .utils.thread_limits import get_n_threads_per_worker
 from .utils.terminal_output import TerminalOutput
 from .parallel_backends import parallel_run
+from .parallel_backends import is_parallel
+from .parallel_backends import is_local_parallel
 from .parallel_backends import check_parallel_config
-from .results import save_results
+from .parallel_backends.shared_data import SharedDataStore
+from .results import read_results, ResultWriter
 from ._generate_runs import generate_run_kwargs
+from ._generate_runs import DataReleaser
+from ._generate_runs import order_runs_by_cost
+from ._generate_runs import apply_time_budget
 
 
 FAILURE_STATUS = ['diverged', 'error', 'interrupted']
 SUCCESS_STATUS = ['done', 'max_runs', 'timeout']
 
+# Columns identifying one run in the results
+RUN_KEY_COLUMNS = ['dataset_name', 'objective_name', 'solver_name', 'idx_rep']
+
 
 class FailedRun(RuntimeError):
     """Exception raised when a solver run fails."""
@@ -29,7 +61,31 @@ class FailedRun(RuntimeError):
 ##################################
 
 
-def run_one_resolution(objective, solver, meta, stop_val):
+def get_timing_stats(times):
+    """Aggregate the durations of repeated runs of a solver.
+
+    Parameters
+    ----------
+    times : list of float
+        Duration of each run, in seconds.
+
+    Returns
+    -------
+    timing_stats : dict
+        The minimum, median and inter-quartile range of the durations, and
+        their number. The median is also used as the ``time`` of the point.
+    """
+    import numpy as np
+
+    q1, median, q3 = np.percentile(times, [25, 50, 75])
+    return dict(
+        time=median, time_min=min(times), time_median=median,
+        time_iqr=q3 - q1, time_repeat=len(times),
+    )
+
+
+def run_one_resolution(objective, solver, meta, stop_val, timing=None,
+                       memory=None, expensive_after=None):
     """Run one resolution of the solver.
 
     Parameters
@@ -45,11 +101,28 @@ def run_one_resolution(objective, solver, meta, stop_val):
         Corresponds to stopping criterion, such as
         tol or max_iter for the solver. It depends
         on the sampling_strategy for the solver.
+    timing : tuple of (int, float) | None
+        If not None, ``(n_repeat, min_time)``: the solver is run at least
+        ``n_repeat`` times, and until the total duration of the runs reaches
+        ``min_time`` seconds, as with ``timeit``. The result of the last run
+        is evaluated, and the durations are aggregated with
+        ``get_timing_stats``.
+    memory : 'rss' | 'tracemalloc' | None
+        If not None, measure the peak memory of the solver runs with a
+        ``MemorySampler`` in this mode.
+    expensive_after : float | None
+        If not None, only compute the metrics of
+        ``Objective.evaluate_expensive_result`` if the time of the run is at
+        least ``expensive_after``, see ``ExpensiveMetricsSchedule``.
 
     Returns
     -------
     cost : dict
-        Details on the run and the objective value obtained.
+        Details on the run and the objective value obtained. The resources
+        used by the solver, see ``get_resource_usage``, are also reported,
+        averaged over the runs when the timing is repeated, as well as the
+        largest peak memory of the runs when it is measured, and the time
+        to get the result of the solver and evaluate it.
     """
     # check if the module caught a failed import
     if not solver.is_installed():
@@ -57,24 +130,287 @@ def run_one_resolution(objective, solver, meta, stop_val):
             f"Failure during import in {solver.__module__}."
         )
 
-    solver.pre_run_hook(stop_val)
-    t_start = time.perf_counter()
-    solver.run(stop_val)
-    delta_t = time.perf_counter() - t_start
-    result = solver.get_result()
-    objective_list = objective(result)
+    n_repeat, min_time = timing or (1, 0)
+    times, usage, memory_peak = [], {}, {}
+    while len(times) < n_repeat or sum(times) < min_time:
+        solver.pre_run_hook(stop_val)
+        sampler = contextlib.nullcontext()
+        if memory is not None:
+            sampler = MemorySampler(memory)
+        with sampler:
+            usage_start = get_resource_usage()
+            t_start = time.perf_counter()
+            solver.run(stop_val)
+            times.append(time.perf_counter() - t_start)
+        if memory is not None:
+            memory_peak[sampler.column] = max(
+                memory_peak.get(sampler.column, 0), sampler.peak
+            )
+        usage_run = diff_resource_usage(usage_start, get_resource_usage())
+        for k, v in usage_run.items():
+            usage[k] = usage.get(k, 0) + v
+    timing_stats = dict(time=times[0])
+    if timing is not None:
+        timing_stats = get_timing_stats(times)
+        usage = {k: v / len(times) for k, v in usage.items()}
 
-    # Add system info in results
-    info = get_sys_info()
+    expensive = (
+        expensive_after is None or timing_stats['time'] >= expensive_after
+    )
+    t_eval = time.perf_counter()
+    result = solver.get_result()
+    objective_list = objective(result, expensive=expensive)
+    overhead_eval = time.perf_counter() - t_eval
 
     return [
-        dict(**meta, stop_val=stop_val, time=delta_t, **objective_dict, **info)
+        dict(
+            **meta, stop_val=stop_val, **timing_stats, **usage,
+            **memory_peak, overhead_eval=overhead_eval, **objective_dict
+        )
         for objective_dict in objective_list
     ], result
 
 
+def _run_one_resolution_rows(objective, solver, meta, stop_val, last_run,
+                             timing=None, memory=None, expensive_after=None,
+                             with_result=False, force=False):
+    """Run one resolution of the solver and only return the metric rows.
+
+    The output of the solver is stored in ``last_run`` instead of being
+    returned, so it is not stored in the cache, unless ``with_result`` is
+    True. The duration of the call is also stored in ``last_run``, to measure
+    the overhead of the cache. The rows are returned with whether the
+    expensive metrics were computed, as ``expensive_after`` is not in the
+    cache key. ``force`` is only used by ``Benchmark.cache``.
+    """
+    t_start = time.perf_counter()
+    objective_list, last_run['result'] = run_one_resolution(
+        objective, solver, meta, stop_val, timing=timing, memory=memory,
+        expensive_after=expensive_after
+    )
+    last_run['duration'] = time.perf_counter() - t_start
+    output = (objective_list, _is_expensive(objective_list, expensive_after))
+    if with_result:
+        return (*output, last_run['result'])
+    return output
+
+
+def _is_expensive(objective_list, expensive_after):
+    "Whether the expensive metrics are due for the rows of a resolution."
+    return expensive_after is None or any(
+        objective_dict['time'] >= expensive_after
+        for objective_dict in objective_list
+    )
+
+
+def cache_run_one_resolution(benchmark, force=False):
+    """Return a cached version of ``run_one_resolution``.
+
+    Only the metric rows are stored in the cache for each ``stop_val``, unless
+    the ``cache_solver_results`` setting is True. With a cache hit, the output
+    of the solver is then returned as None.
+
+    The ``expensive_after`` threshold depends on the times of the previous
+    points, so it is not part of the cache key. When the expensive metrics
+    are due for the cached rows but were not computed, the resolution is run
+    again and the cache is updated.
+
+    Parameters
+    ----------
+    benchmark : benchopt.Benchmark object
+        Object to represent the benchmark.
+    force : bool
+        If force is set to True, ignore the cache and run the computations.
+
+    Returns
+    -------
+    run_one_resolution_cached : callable
+        Function with the same signature and outputs as
+        ``run_one_resolution``. The time spent in the cache, to hash the
+        inputs and load or store the outputs, is added to the rows as
+        ``overhead_cache``.
+    """
+    with_result = get_setting('cache_solver_results')
+    run_one_resolution_rows = benchmark.cache(
+        _run_one_resolution_rows, force,
+        ignore=['last_run', 'expensive_after', 'force']
+    )
+
+    def run_one_resolution_cached(**kwargs):
+        last_run = {}
+        t_start = time.perf_counter()
+        output = run_one_resolution_rows(
+            last_run=last_run, with_result=with_result, **kwargs
+        )
+        if not output[1] and _is_expensive(
+            output[0], kwargs.get('expensive_after')
+        ):
+            last_run = {}
+            output = run_one_resolution_rows(
+                last_run=last_run, with_result=with_result, force=True,
+                **kwargs
+            )
+        overhead_cache = (
+            time.perf_counter() - t_start - last_run.get('duration', 0)
+        )
+        objective_list, _, result = output if with_result else (
+            *output, last_run.get('result')
+        )
+        for objective_dict in objective_list:
+            objective_dict['overhead_cache'] = overhead_cache
+        return objective_list, result
+
+    return run_one_resolution_cached
+
+
+# State of the fan-out worker processes, set once per process by
+# ``_init_fan_out_worker``.
+_FAN_OUT_WORKER = {}
+
+
+def _init_fan_out_worker(benchmark, force, objective, solver, run_context,
+                         n_threads, cpu_pinning, call_kwargs):
+    """Set the objective and the solver once in a worker of the fan-out pool.
+
+    The objective and the solver are copies, so their data is set again and
+    the solver is warmed up, once per worker. The worker is limited to its
+    share of the threads of the run and, if the run is pinned, to its own
+    cores, for the lifetime of the process.
+    """
+    stack = contextlib.ExitStack()
+    if cpu_pinning is not None:
+        stack.enter_context(pin_cpus(cpu_pinning.claim()))
+    stack.enter_context(limit_threads(n_threads))
+
+    dataset = getattr(objective, '_dataset', None)
+    run_context.attach(objective, dataset, solver)
+    if run_context.shared_data is not None:
+        run_context.shared_data.load(dataset)
+    objective._restore_dataset()
+    solver._set_objective(objective)
+    solver._warm_up()
+    _FAN_OUT_WORKER.update(
+        stack=stack,
+        run_one_resolution=cache_run_one_resolution(benchmark, force),
+        kwargs=dict(objective=objective, solver=solver, **call_kwargs),
+    )
+
+
+def _run_one_resolution_ahead(stop_val, expensive_after):
+    """Run one resolution of the solver in a worker of the fan-out pool.
+
+    Only the metric rows are returned, as the output of the solver can be
+    large.
+    """
+    objective_list, _ = _FAN_OUT_WORKER['run_one_resolution'](
+        stop_val=stop_val, expensive_after=expensive_after,
+        **_FAN_OUT_WORKER['kwargs']
+    )
+    return objective_list
+
+
+class _FanOutRuns:
+    """Run the next resolutions of a solver ahead, in a pool of processes.
+
+    The runs of the 'iteration' and 'tolerance' strategies are independent,
+    so the next ``n_workers`` stop values, predicted with the current state
+    of the stopping criterion, are run at the same time. When the schedule
+    changes, e.g. when the curve is flat, the predicted runs that are not in
+    it anymore are cancelled or their results are discarded, as well as the
+    runs after the stopping point.
+
+    The pool is created for the run and shut down in ``close``. The threads
+    of the run are shared among its workers and, if the run is pinned to
+    some cores, each worker is pinned to a disjoint subset of them.
+
+    Parameters
+    ----------
+    n_workers : int
+        Number of resolutions run at the same time.
+    stopping_criterion : StoppingCriterion
+        The stopping criterion of the run, used to predict the stop values.
+    metrics_schedule : ExpensiveMetricsSchedule | None
+        The schedule of the expensive metrics of the objective, if any.
+    benchmark, force, objective, solver, run_context
+        The arguments to set the objective and the solver in the workers,
+        see ``_init_fan_out_worker``.
+    n_threads : int | None
+        Number of threads of the run, shared among the workers. If None, use
+        all the cores available to the run.
+    cpus : list of int | None
+        The cores the run is pinned to, if any.
+    **call_kwargs : dict
+        The other arguments of ``run_one_resolution``, except ``stop_val``
+        and ``expensive_after``.
+    """
+
+    def __init__(self, n_workers, stopping_criterion, metrics_schedule,
+                 benchmark, force, objective, solver, run_context,
+                 n_threads=None, cpus=None, **call_kwargs):
+        from joblib.externals.loky import ProcessPoolExecutor
+
+        self.n_workers = n_workers
+        self.stopping_criterion = stopping_criterion
+        self.metrics_schedule = metrics_schedule
+        n_threads = max(
+            1, (n_threads or len(get_available_cpus())) // n_workers
+        )
+        self.cpu_pinning = None
+        if cpus is not None:
+            self.cpu_pinning = WorkerPinning(n_workers)
+        self.executor = ProcessPoolExecutor(
+            max_workers=n_workers, initializer=_init_fan_out_worker,
+            initargs=(
+                benchmark, force, objective, solver, run_context, n_threads,
+                self.cpu_pinning, call_kwargs
+            )
+        )
+        self.pending = {}
+
+    def get(self, stop_val):
+        """Return the rows for ``stop_val`` and submit the next runs.
+
+        Returns
+        -------
+        objective_list : list of dict
+            The rows of the resolution.
+        threshold : float | None
+            The time threshold used for the expensive metrics, if any.
+        """
+        stop_vals = [stop_val]
+        for _ in range(self.n_workers - 1):
+            stop_vals.append(
+                self.stopping_criterion.get_next_stop_val(stop_vals[-1])
+            )
+        for s in list(self.pending):
+            if s not in stop_vals:
+                self.pending.pop(s)[0].cancel()
+        for offset, s in enumerate(stop_vals):
+            if s in self.pending:
+                continue
+            threshold = None
+            if self.metrics_schedule is not None:
+                threshold = self.metrics_schedule.time_threshold(offset)
+            future = self.executor.submit(
+                _run_one_resolution_ahead, stop_val=s,
+                expensive_after=threshold
+            )
+            self.pending[s] = (future, threshold)
+        future, threshold = self.pending.pop(stop_val)
+        return future.result(), threshold
+
+    def close(self):
+        "Cancel the runs that are not needed anymore and stop the workers."
+        self.executor.shutdown(wait=True, kill_workers=True)
+        self.pending = {}
+        if self.cpu_pinning is not None:
+            self.cpu_pinning.close()
+
+
 def run_one_to_cvg(benchmark, objective, solver, meta, timeout, max_runs,
-                   force=False, terminal=None, run_context=None):
+                   force=False, terminal=None, run_context=None, timing=None,
+                   memory=None, async_eval=None, fan_out=None,
+                   stop_val_schedule='geometric'):
     """Run all repetitions of the solver for a value of stopping criterion.
 
     Parameters
@@ -102,6 +438,25 @@ def run_one_to_cvg(benchmark, objective, solver, meta, timeout, max_runs,
         Per-run context (seeds, artifact path). Ignored by the cache;
         set on objective and solver so user methods can call
         ``get_seed()`` and ``get_run_output_path()``.
+    timing : tuple of (int, float) | None
+        If not None, ``(n_repeat, min_time)`` to repeat the runs of the
+        solver for each ``stop_val``, see ``run_one_resolution``. It is not
+        used for the 'callback' strategy and for solvers supporting
+        continuation, as their runs cannot be repeated.
+    memory : 'rss' | 'tracemalloc' | None
+        If not None, measure the peak memory of the solver for each
+        ``stop_val`` with a ``MemorySampler`` in this mode.
+    async_eval : int | None
+        If not None, evaluate the objective in a background thread with at
+        most ``async_eval`` pending evaluations, for the 'callback' strategy
+        only. See ``_Callback``.
+    fan_out : int | None
+        If not None, run the next ``fan_out`` resolutions of the solver at the
+        same time in a pool of processes, for the 'iteration' and
+        'tolerance' strategies without continuation. See ``_FanOutRuns``.
+    stop_val_schedule : 'geometric' | 'time'
+        How the stop values are chosen, see
+        ``StoppingCriterion.get_runner_instance``.
 
     Returns
     -------
@@ -111,13 +466,48 @@ def run_one_to_cvg(benchmark, objective, solver, meta, timeout, max_runs,
         The key to identify the run in the benchmark results.
     status : 'done' | 'diverged' | 'timeout' | 'max_runs'
         The status on which the solver was stopped.
+    reason : str
+        The reason why the run was skipped, if any.
+    info : dict | None
+        Info on the system where the solver was run, and the duration of the
+        run in ``run_duration``. It is shared by all the rows of the curve and
+        added to them when storing the results.
     """
+    # With --time-budget, do not start the run once the deadline has passed,
+    # and stop it after its share of the time left otherwise.
+    deadline = getattr(run_context, 'deadline', None)
+    if deadline is not None:
+        time_left = deadline - time.time()
+        if time_left <= 0:
+            raise FailedRun('budget')
+        timeout = min(
+            t for t in (timeout, time_left, run_context.time_share)
+            if t is not None
+        )
+
     # Re-attach the run context after deserialization (it is excluded from
     # pickle via __getstate__ so workers receive components without it).
-    run_context.attach(objective, getattr(objective, '_dataset', None), solver)
+    dataset = getattr(objective, '_dataset', None)
+    run_context.attach(objective, dataset, solver)
+
+    # Load the data shared by the main process, if any.
+    if run_context.shared_data is not None:
+        run_context.shared_data.load(dataset)
 
     pdb = run_context.pdb if run_context is not None else False
 
+    # With --pin-cpus, bind the run to the core set of its worker, claimed
+    # on its first run. The affinity is restored at the end of the run.
+    cpus = None
+    if run_context.cpu_pinning is not None:
+        cpus = run_context.cpu_pinning.claim()
+
+    # Limit the threads of the native libraries, to the solver's n_threads
+    # or to the share of the CPUs of each local worker.
+    n_threads = getattr(solver, 'n_threads', None)
+    if n_threads is None and run_context is not None:
+        n_threads = run_context.n_threads
+
     curve = []
 
     run_key = (
@@ -126,69 +516,192 @@ def run_one_to_cvg(benchmark, objective, solver, meta, timeout, max_runs,
         meta['solver_name']
     )
 
-    with exception_handler(terminal, pdb=pdb) as ctx:
+    with pin_cpus(cpus), limit_threads(n_threads), \
+            exception_handler(terminal, pdb=pdb) as ctx:
+        # The system info records the number of threads used in the run.
+        sys_info = get_sys_info()
+        t_run_start = time.perf_counter()
+
+        # Set the data in the objective, which is not done when copying it.
+        # With lazy_data, this is also where it is checked if the objective
+        # should be skipped for this dataset.
+        skip, reason = objective._restore_dataset()
+        if skip:
+            return [], run_key, 'skip', reason, None
 
         skip, reason = solver._set_objective(objective)
         if skip:
-            return [], run_key, 'skip', reason
+            return [], run_key, 'skip', reason, None
 
+        progress_callback = None
+        if terminal is not None:
+            progress_callback = partial(terminal.progress, key=run_key)
         stopping_criterion = (
             solver._stopping_criterion.get_runner_instance(
                 solver=solver,
                 max_runs=max_runs,
                 timeout=timeout,
-                terminal=terminal,
                 run_key=run_key,
+                progress_callback=progress_callback,
+                schedule=stop_val_schedule,
             )
         )
 
         # The warm-up step called for each repetition bit only run once.
         solver._warm_up()
 
+        # Select the points of the curve where the expensive metrics of the
+        # objective are computed, if any.
+        metrics_schedule = objective._get_expensive_metrics_schedule()
+
         if solver._solver_strategy == "callback":
 
             # If sampling_strategy is 'callback', only call once to get the
             # results up to convergence.
             callback = _Callback(
-                objective, solver, meta, stopping_criterion
+                objective, solver, meta, stopping_criterion, memory=memory,
+                async_eval=async_eval, metrics_schedule=metrics_schedule
             )
             solver.pre_run_hook(callback)
             callback.start()
-            solver.run(callback)
-            curve, ctx.status, last_result = callback.get_results()
+            try:
+                solver.run(callback)
+                curve, ctx.status, last_result = callback.get_results()
+            finally:
+                callback.stop()
         else:
 
-            # Create a Memory object to cache the computations in the
-            # benchmark folder and handle cases where we force the run.
-            # TODO: Skip caching if the sampling strategy is 'run_once'
-            # since the call to this function is a single call to
-            # run_one_resolution. This needs to be done once stopping
-            # criterion does not depend on the terminal anymore.
-            run_one_resolution_cached = benchmark.cache(
-                run_one_resolution, force,
+            continuation = solver.supports_continuation and (
+                solver._solver_strategy in ['iteration', 'tolerance']
             )
+            if continuation:
+                # Each run continues from the previous one, so they cannot be
+                # cached individually. Start from the reset state and
+                # accumulate the run times along the curve.
+                run_one_resolution_cached = run_one_resolution
+                solver.reset_state()
+            elif isinstance(stopping_criterion, SingleRunCriterion):
+                # Only one call to run_one_resolution is made, and its result
+                # is already cached with the one of run_one_to_cvg.
+                run_one_resolution_cached = run_one_resolution
+            else:
+                # Create a Memory object to cache the computations in the
+                # benchmark folder and handle cases where we force the run.
+                run_one_resolution_cached = cache_run_one_resolution(
+                    benchmark, force
+                )
+            cumulative = {}
 
             # compute initial value
-            call_args = dict(objective=objective, solver=solver, meta=meta)
+            call_args = dict(
+                objective=objective, solver=solver, meta=meta,
+                timing=None if continuation else timing, memory=memory
+            )
+
+            # The resolutions are independent without continuation, so they
+            # can be run ahead in parallel.
+            fan_out_runs = None
+            if fan_out is not None and fan_out > 1 and (
+                run_one_resolution_cached is not run_one_resolution
+            ):
+                fan_out_runs = _FanOutRuns(
+                    fan_out, stopping_criterion, metrics_schedule,
+                    benchmark=benchmark, force=force, run_context=run_context,
+                    n_threads=n_threads, cpus=cpus, **call_args
+                )
 
             stop = False
             stop_val = stopping_criterion.init_stop_val()
-            while not stop:
+            try:
+                while not stop:
 
-                objective_list, last_result = run_one_resolution_cached(
-                    stop_val=stop_val, **call_args
-                )
-                curve.extend(objective_list)
+                    last_stop_val = stop_val
+                    threshold = expensive_after = None
+                    if metrics_schedule is not None:
+                        threshold = metrics_schedule.time_threshold()
+                        expensive_after = threshold - cumulative.get('time', 0)
+                    if fan_out_runs is not None:
+                        objective_list, threshold = fan_out_runs.get(stop_val)
+                        last_result = None
+                    else:
+                        objective_list, last_result = (
+                            run_one_resolution_cached(
+                                stop_val=stop_val,
+                                expensive_after=expensive_after, **call_args
+                            )
+                        )
+                    if continuation:
+                        # Accumulate the time and the resources of the runs,
+                        # and keep the largest peak memory.
+                        cumulative_cols = ['time'] + [
+                            col for col in RESOURCE_COLUMNS
+                            if col in objective_list[0]
+                        ]
+                        memory_cols = [
+                            col for col in MEMORY_COLUMNS.values()
+                            if col in objective_list[0]
+                        ]
+                        for objective_dict in objective_list:
+                            for col in cumulative_cols:
+                                objective_dict[col] += cumulative.get(col, 0)
+                            for col in memory_cols:
+                                objective_dict[col] = max(
+                                    objective_dict[col], cumulative.get(col, 0)
+                                )
+                        cumulative = {
+                            col: objective_list[0][col]
+                            for col in cumulative_cols + memory_cols
+                        }
+                    if metrics_schedule is not None:
+                        metrics_schedule.update(
+                            objective_list[0]['time'], threshold=threshold
+                        )
+                    curve.extend(objective_list)
+                    stopping_criterion.record_time(
+                        stop_val, objective_list[0]['time']
+                    )
+
+                    # Check the stopping criterion and update rho if
+                    # necessary.
+                    t_stop = time.perf_counter()
+                    stop, ctx.status, stop_val = (
+                        stopping_criterion.should_stop(stop_val, curve)
+                    )
+                    overhead_stop = time.perf_counter() - t_stop
+                    for objective_dict in objective_list:
+                        objective_dict['overhead_stop'] = overhead_stop
+            finally:
+                if fan_out_runs is not None:
+                    fan_out_runs.close()
+
+            # The expensive metrics are always computed for the final point.
+            add_metrics = (
+                metrics_schedule is not None and not metrics_schedule.last_due
+            )
 
-                # Check the stopping criterion and update rho if necessary.
-                stop, ctx.status, stop_val = (
-                    stopping_criterion.should_stop(stop_val, curve)
+            # The solver output is not cached, so if the final run was
+            # retrieved from the cache, run it again if it needs to be saved
+            # or evaluated.
+            if last_result is None and (
+                add_metrics or objective._saves_final_results()
+            ):
+                _, last_result = run_one_resolution(
+                    stop_val=last_stop_val, expensive_after=inf, **call_args
+                )
+            if add_metrics:
+                metrics_list = objective._evaluate_expensive(
+                    last_result, len(objective_list)
                 )
+                for objective_dict, metrics in zip(
+                    objective_list, metrics_list
+                ):
+                    objective_dict.update(metrics)
 
         # Save final results if the run did not fail.
-        to_save = objective.save_final_results(**last_result)
-        if to_save is not None:
-            curve[-1]["final_results"] = to_save
+        if last_result is not None:
+            to_save = objective.save_final_results(**last_result)
+            if to_save is not None:
+                curve[-1]["final_results"] = to_save
 
     # Make sure to flush so the parallel output is properly display
     print(end='', flush=True)
@@ -198,15 +711,293 @@ def run_one_to_cvg(benchmark, objective, solver, meta, timeout, max_runs,
     if ctx.status in FAILURE_STATUS:
         raise FailedRun(ctx.status)
 
-    return curve, run_key, ctx.status, ""
+    # The system info is computed once per process and sent only once per
+    # run, rather than being copied in each row of the curve. The duration of
+    # the run is added to compare it with the overhead of benchopt.
+    sys_info = dict(sys_info, run_duration=time.perf_counter() - t_run_start)
+    return curve, run_key, ctx.status, "", sys_info
+
+
+def get_resume_file(output_dir, resume):
+    """Find the result file, or its partial results, to resume a run from.
+
+    Parameters
+    ----------
+    output_dir : Path
+        Output folder of the benchmark.
+    resume : str | Path
+        Path of the result file, or its name in ``output_dir``. The suffix
+        can be omitted.
+
+    Returns
+    -------
+    resume_file : Path
+        Path of the result file, or of its ``.partial`` folder if the run
+        that produced it did not complete.
+    """
+    for path in [Path(resume), output_dir / resume]:
+        for ext in ['.parquet', '.csv', '.partial']:
+            candidate = path.with_suffix(ext) if path.suffix != ext else path
+            if candidate.exists():
+                return candidate
+    raise FileNotFoundError(
+        f"Could not find result file {resume} to resume the run from."
+    )
+
+
+def get_completed_runs(resume_file):
+    """Return the keys of the runs completed in a result file.
+
+    Only successful runs are stored in the results, so all the runs found in
+    the file are considered completed, except the ones dropped from a race
+    whose ``run_status`` is ``'dominated'``.
+
+    Parameters
+    ----------
+    resume_file : Path
+        Path of a result file or of a folder with partial results.
+
+    Returns
+    -------
+    completed_runs : set of tuple
+        Set of ``(dataset_name, objective_name, solver_name, idx_rep)``.
+    """
+    # The file only stores metadata when no run produced results.
+    if resume_file.suffix == '.parquet':
+        import pyarrow.parquet as pq
+        if pq.read_metadata(resume_file).num_rows == 0:
+            return set()
+
+    try:
+        df = read_results(
+            resume_file, columns=[*RUN_KEY_COLUMNS, 'run_status']
+        )
+        df = df[df['run_status'] != 'dominated']
+    except ValueError:
+        # The results of older versions do not store the status of the runs.
+        df = read_results(resume_file, columns=RUN_KEY_COLUMNS)
+    return set(
+        df[RUN_KEY_COLUMNS].drop_duplicates()
+        .itertuples(index=False, name=None)
+    )
+
+
+def update_run_lists(metadata, run_keys, done_runs):
+    """Update the lists of the runs not completed in the results' metadata.
+
+    With ``--resume``, the metadata of the resumed file are kept and the runs
+    of the new session are appended to its ``dominated_runs`` and
+    ``budget_runs``. The runs that were started since are removed from
+    ``budget_runs``, and the ones completed since from ``dominated_runs``.
+
+    Parameters
+    ----------
+    metadata : dict
+        Metadata of the results, updated inplace.
+    run_keys : set of tuple
+        Keys of the runs with results in the new session.
+    done_runs : set of tuple
+        Keys of the runs completed in the new session.
+    """
+    for name, removed in [('dominated_runs', done_runs),
+                          ('budget_runs', run_keys)]:
+        if name not in metadata:
+            continue
+        # Use a dict as an ordered set to remove the duplicates.
+        runs = dict.fromkeys(
+            run for run in map(tuple, metadata[name]) if run not in removed
+        )
+        metadata[name] = [list(run) for run in runs]
+
+
+def get_run_costs(benchmark):
+    """Estimate the duration of each run from the previous result files.
+
+    The duration of a run is estimated as the sum of the solver's time over
+    the points of its curve, averaged over the repetitions. When a run is
+    found in several files, the most recent one is used.
+
+    Parameters
+    ----------
+    benchmark : benchopt.Benchmark object
+        Object to represent the benchmark.
+
+    Returns
+    -------
+    costs : dict
+        Mapping from ``(dataset_name, objective_name, solver_name)`` to the
+        estimated duration of one run, in seconds.
+    """
+    try:
+        result_files = benchmark.get_result_files("all")
+    except RuntimeError:
+        return {}
+
+    costs = {}
+    for result_file in result_files:
+        try:
+            df = read_results(result_file, columns=[*RUN_KEY_COLUMNS, 'time'])
+        except Exception:
+            # Skip the files that cannot be read, e.g. produced by an older
+            # version of benchopt.
+            continue
+        run_costs = df.groupby(RUN_KEY_COLUMNS)['time'].sum()
+        costs.update(run_costs.groupby(level=[0, 1, 2]).mean().to_dict())
+    return costs
+
+
+def _is_cut_by_budget(run_kwargs):
+    "Check if the time share of a run is shorter than its timeout."
+    run_context = run_kwargs['run_context']
+    if run_context.deadline is None:
+        return False
+    timeout = run_kwargs['timeout']
+    time_left = min(run_context.time_share, run_context.deadline - time.time())
+    return timeout is None or time_left < timeout
+
+
+def _is_in_cache(func_cached, run_kwargs):
+    "Check if the result of a run is in the cache of the cached function."
+    check_call_in_cache = getattr(func_cached, 'check_call_in_cache', None)
+    return check_call_in_cache is not None and check_call_in_cache(
+        **run_kwargs
+    )
+
+
+def _get_race_score(curve, solver, budget):
+    """Score of a run in a race, at a given time. Lower is better.
+
+    The score is the best value of the key monitored by the solver's stopping
+    criterion among the points of the curve computed in less than ``budget``
+    seconds, or ``inf`` if there is no such point.
+    """
+    criterion = solver._stopping_criterion
+    key = getattr(criterion, 'key_to_monitor_', None)
+    if key is None:
+        key = next(
+            (k for k in curve[0] if k.startswith('objective_')), None
+        ) if len(curve) > 0 else None
+    sign = 1 if getattr(criterion, 'minimize', True) else -1
+    values = [
+        sign * row[key] for row in curve
+        if row['time'] <= budget and row.get(key) is not None
+        and row[key] == row[key]  # ignore NaN values
+    ]
+    return min(values, default=float('inf'))
+
+
+def race_runs(benchmark, run, all_run_kwargs, parallel_config=None,
+              fraction=0.5, collect=False):
+    """Run the solvers with successive halving races.
+
+    For each dataset, objective and repetition, all the solvers are first run
+    with a small timeout. They are ranked on the value of the monitored key
+    reached at this time, the ``fraction`` of the worst ones is dropped and
+    the others are run again with a larger timeout, until only one remains.
+    The timeout of the last round is the timeout of the runs, and each round
+    multiplies it by ``1 - fraction``. The dropped runs keep the curve of
+    their last round, with the status ``'dominated'``.
+
+    Parameters
+    ----------
+    benchmark : benchopt.Benchmark object
+        Object to represent the benchmark.
+    run : callable
+        Function running one solver, with the same signature and outputs as
+        ``run_one_to_cvg``.
+    all_run_kwargs : iterable of dict
+        The kwargs of each ``run_one_to_cvg`` call, as generated by
+        ``generate_run_kwargs``.
+    parallel_config : dict | None
+        Config used to run the solvers of each round in parallel.
+    fraction : float
+        Fraction of the solvers dropped at each round, in ``(0, 1)``.
+    collect : bool
+        If set to True, only collect the results in cache.
+
+    Yields
+    ------
+    result : tuple
+        The outputs of ``run`` for the final round of each solver.
+    """
+    def get_race(kwargs):
+        meta = kwargs['meta']
+        return meta['dataset_name'], meta['objective_name'], meta['idx_rep']
+
+    # The runs are generated by dataset and objective, so the runs of each
+    # race are grouped together once sorted by repetition.
+    for _, group in groupby(all_run_kwargs, key=lambda k: get_race(k)[:2]):
+        group = sorted(group, key=lambda k: k['meta']['idx_rep'])
+        for _, race in groupby(group, key=get_race):
+            yield from _race(benchmark, run, list(race), parallel_config,
+                             fraction, collect)
+
+
+def _race(benchmark, run, race, parallel_config, fraction, collect):
+    timeout = race[0]['timeout']
+    if timeout is None:
+        raise ValueError("Racing requires a timeout for the solvers.")
+
+    # Number of runs kept at each round and timeout of each round.
+    n_kept = [len(race)]
+    while n_kept[-1] > 1:
+        n_kept.append(min(n_kept[-1] - 1, ceil(n_kept[-1] * (1 - fraction))))
+    budgets = [
+        timeout * (1 - fraction) ** (len(n_kept) - 1 - i)
+        for i in range(len(n_kept))
+    ]
+
+    results = {}
+    racing = [kwargs['meta']['solver_name'] for kwargs in race]
+    all_kwargs = {kwargs['meta']['solver_name']: kwargs for kwargs in race}
+    for i, budget in enumerate(budgets):
+        # Only run again the solvers stopped by the timeout of last round.
+        round_kwargs = [
+            dict(all_kwargs[name], timeout=budget) for name in racing
+            if name not in results or results[name][2] == 'timeout'
+        ]
+        config = dict(parallel_config) if parallel_config else None
+        for result in parallel_run(benchmark, run, round_kwargs,
+                                   config=config, collect=collect):
+            results[result[1][2]] = result
+
+        # The failed runs are out of the race.
+        for name in list(racing):
+            curve, _, status, _, _ = results[name]
+            if status not in SUCCESS_STATUS or len(curve) == 0:
+                racing.remove(name)
+                yield results[name]
+        if i == len(budgets) - 1:
+            break
+
+        racing.sort(key=lambda name: _get_race_score(
+            results[name][0], all_kwargs[name]['solver'], budget
+        ))
+        for name in racing[n_kept[i + 1]:]:
+            yield (*results[name][:2], 'dominated', *results[name][3:])
+        racing = racing[:n_kept[i + 1]]
+
+    for name in racing:
+        yield results[name]
+
+
+def _add_dispatch_timer(kwargs):
+    # The timer is pickled first and its end marker last, to measure the time
+    # to pickle all the kwargs of the run.
+    timer = DispatchTimer()
+    return dict(dispatch_timer=timer, **kwargs, dispatch_end=timer.end)
 
 
 def _run_benchmark(benchmark, solvers=None, forced_solvers=None,
                    datasets=None, objectives=None, max_runs=10,
-                   n_repetitions=1, timeout=100,
+                   n_repetitions=1, timeout=100, time_budget=None,
+                   racing=None, timing=None, memory=None, async_eval=None,
+                   fan_out=None, stop_val_schedule='geometric',
                    plot_result=True, display=True, html=True, collect=False,
-                   output_file="None", parallel_config=None,
-                   show_progress=True, pdb=False):
+                   output_file="None",
+                   resume=None,
+                   parallel_config=None, pin_cpus=False, show_progress=True,
+                   pdb=False):
     """Run full benchmark.
 
     Parameters
@@ -232,10 +1023,48 @@ def _run_benchmark(benchmark, solvers=None, forced_solvers=None,
         The number of repetitions to run. Defaults to 1.
     timeout : float
         The maximum duration in seconds of the solver run.
+    time_budget : float | None
+        If not None, maximal duration in seconds of the whole benchmark. The
+        time left is shared among the pending runs, whose timeout is reduced
+        accordingly, and the runs that cannot start before the deadline get
+        the status 'budget'.
+    racing : float | None
+        If not None, run the solvers of each dataset and objective in
+        successive halving races, dropping this fraction of the solvers at
+        each round. The dropped runs get the status 'dominated'. See
+        ``race_runs``.
+    timing : tuple of (int, float) | None
+        If not None, ``(n_repeat, min_time)``: the solver is run at least
+        ``n_repeat`` times for each ``stop_val``, and until these runs last
+        ``min_time`` seconds. The minimum, median and inter-quartile range of
+        the durations are stored, and the median is used as ``time``.
+    memory : 'rss' | 'tracemalloc' | None
+        If not None, measure the peak memory of the solver for each
+        ``stop_val``, by sampling the resident memory of the process or by
+        tracing the Python allocations. See ``MemorySampler``.
+    async_eval : int | None
+        If not None, evaluate the objective in a background thread for the
+        solvers with the 'callback' strategy, so that they continue while
+        their results are evaluated, with at most ``async_eval`` pending
+        evaluations. The solver waits when more evaluations are pending.
+    fan_out : int | None
+        If not None, run the next ``fan_out`` resolutions of each curve at the
+        same time in a pool of local processes, for the solvers with the
+        'iteration' or 'tolerance' strategy that do not support continuation.
+        The resolutions after the stopping point are discarded.
+    stop_val_schedule : 'geometric' | 'time'
+        How the stop values of the curves are chosen. With 'geometric', they
+        grow geometrically. With 'time', they are chosen from the times
+        measured on the previous points to get points evenly spaced in log
+        scale of the time, up to the timeout.
     parallel_config : dict | None
         If not None, launch the job in parallel. The provided config serves to
         set up parallelism using ``joblib.parallel_backend`` or ``submitit``.
         See :ref:`parallel_run` for detailed description.
+    pin_cpus : bool
+        If set to True, bind each local worker process to a disjoint set of
+        cores, to avoid the timing variations due to the migrations of the
+        processes. Only supported on Linux, with the ``loky`` backend.
     plot_result : bool
         If set to True (default), generate the result plot and save them in
         the benchmark directory.
@@ -255,6 +1084,11 @@ def _run_benchmark(benchmark, solvers=None, forced_solvers=None,
     output_file : str
         Filename for the parquet output. If given, the results will
         be stored at <BENCHMARK>/outputs/<filename>.parquet.
+    resume : str | Path | None
+        If not None, path or name in <BENCHMARK>/outputs of a result file,
+        possibly partial. The runs already stored in this file are skipped
+        and the new results are appended to it. Not compatible with
+        ``output_file``.
 
     Returns
     -------
@@ -264,73 +1098,265 @@ def _run_benchmark(benchmark, solvers=None, forced_solvers=None,
     output_file : Path
         Path to the output file where the results have been saved.
     """
+    if timing is not None and (timing[0] < 1 or timing[1] < 0):
+        raise ValueError(
+            "timing should be (n_repeat, min_time) with n_repeat >= 1 and "
+            f"min_time >= 0. Got {timing}."
+        )
+    if async_eval is not None and async_eval < 1:
+        raise ValueError(
+            f"async_eval should be a positive integer. Got {async_eval}."
+        )
+    if fan_out is not None and fan_out < 1:
+        raise ValueError(
+            f"fan_out should be a positive integer. Got {fan_out}."
+        )
+    if stop_val_schedule not in STOP_VAL_SCHEDULES:
+        raise ValueError(
+            f"stop_val_schedule should be in {STOP_VAL_SCHEDULES}. "
+            f"Got {stop_val_schedule}."
+        )
+    if racing is not None:
+        if not 0 < racing < 1:
+            raise ValueError(
+                f"racing should be a fraction in (0, 1). Got {racing}."
+            )
+        if time_budget is not None:
+            raise ValueError("Cannot set both racing and time_budget.")
+
     exit_code = 0
     terminal = TerminalOutput(n_repetitions, show_progress)
+    if time_budget is not None:
+        deadline = time.time() + time_budget
 
     # Resolve the output filename stem before runs start so that
     # run_output_base is stable across all workers.
     output_dir = benchmark.get_output_folder()
-    if output_file == "None":
-        timestamp = datetime.now().strftime('%Y-%m-%d_%Hh%Mm%S')
-        output_file = f'benchopt_run_{timestamp}.parquet'
+    completed_runs = None
+    if resume is not None:
+        if output_file != "None":
+            raise ValueError("Cannot set both output_file and resume.")
+        resume_file = get_resume_file(output_dir, resume)
+        completed_runs = get_completed_runs(resume_file)
+        output_path = resume_file
+        if resume_file.is_dir():
+            output_path = resume_file.with_suffix('.parquet')
+    else:
+        if output_file == "None":
+            timestamp = datetime.now().strftime('%Y-%m-%d_%Hh%Mm%S')
+            output_file = f'benchopt_run_{timestamp}.parquet'
+        output_path = output_dir / output_file
     from .utils.run_context import RunContext
+    # With local parallel workers, share the CPUs among the workers to avoid
+    # over-subscription from the native libraries' threads.
+    n_threads = None
+    if is_local_parallel(parallel_config):
+        n_threads = get_n_threads_per_worker(parallel_config.get('n_jobs'))
+    # With pin_cpus, bind each loky worker to a disjoint set of cores. The
+    # local backend already pins each run to the cores it reserves.
+    cpu_pinning = None
+    if pin_cpus:
+        if not is_local_parallel(parallel_config):
+            warnings.warn(
+                "Pinning the CPUs requires local workers, with n_jobs > 1 or "
+                "the local backend. The CPUs are not pinned."
+            )
+        elif not hasattr(os, 'sched_setaffinity'):
+            warnings.warn("Pinning the CPUs is only supported on Linux.")
+        elif parallel_config.get('backend', 'loky') == 'loky':
+            cpu_pinning = WorkerPinning(
+                effective_n_jobs(parallel_config.get('n_jobs'))
+            )
     base_run_context = RunContext(
         pdb=pdb,
-        run_output_base=output_dir / Path(output_file).stem,
+        run_output_base=output_path.parent / output_path.stem,
+        n_threads=n_threads,
+        cpu_pinning=cpu_pinning,
     )
 
     run_one_to_cvg_cached = benchmark.cache(
         run_one_to_cvg,
-        ignore=['force', 'terminal', 'run_context'],
+        ignore=['force', 'terminal', 'run_context', 'fan_out'],
         collect=collect
     )
 
-    def run_one_to_cvg_final(**kwargs):
+    def run_one_to_cvg_final(dispatch_timer=None, dispatch_end=None,
+                             **kwargs):
+        overhead_ipc = 0.
+        if dispatch_timer is not None:
+            overhead_ipc = dispatch_timer.elapsed()
+        run_one = run_one_to_cvg_cached
+        # The runs whose timeout is reduced by the time budget are not cached
+        # as their curve can be truncated, unless the full run is in cache.
+        if _is_cut_by_budget(kwargs) and not _is_in_cache(
+            run_one_to_cvg_cached, kwargs
+        ):
+            run_one = run_one_to_cvg
         try:
-            return run_one_to_cvg_cached(**kwargs)
+            curve, key, status, reason, info = run_one(**kwargs)
         except FailedRun as e:
             # If the run fails, return an empty result with the failure status
-            # This is done to avoid caching failed runs.
+            # This is done to avoid caching failed runs. As there are no rows,
+            # the info holds the run key to report the runs out of budget.
+            meta = kwargs['meta']
             key = (
-                kwargs['meta']['dataset_name'],
-                kwargs['meta']['objective_name'],
-                kwargs['meta']['solver_name']
+                meta['dataset_name'], meta['objective_name'],
+                meta['solver_name']
             )
-            return ([], key, e.status, "")
+            return ([], key, e.status, "", {
+                k: meta[k] for k in RUN_KEY_COLUMNS
+            })
+        if info is not None:
+            info = dict(info, overhead_ipc=overhead_ipc)
+        return curve, key, status, reason, info
+
+    # With lazy_data, the data is only loaded in the runs, e.g. to avoid
+    # holding all the datasets in memory on the frontal of a cluster.
+    lazy_data = False
+    if parallel_config is not None:
+        parallel_config = dict(parallel_config)
+        lazy_data = parallel_config.pop('lazy_data', False)
+
+    # Share the data of the datasets with the local workers, so that they
+    # do not each load their own copy of the data.
+    shared_data = None
+    if is_local_parallel(parallel_config) and not (collect or lazy_data):
+        shared_data = SharedDataStore()
+
+    # Keep the data of each dataset in this process until all its runs have
+    # completed, as they may all be generated before the first one starts.
+    data_releaser = DataReleaser()
 
     total_cvg_kwargs_generator = generate_run_kwargs(
         benchmark, solvers=solvers, forced_solvers=forced_solvers,
         datasets=datasets, objectives=objectives,
         n_repetitions=n_repetitions, max_runs=max_runs, timeout=timeout,
         collect=collect, terminal=terminal, run_context=base_run_context,
+        completed_runs=completed_runs, shared_data=shared_data,
+        lazy_data=lazy_data, timing=timing, memory=memory,
+        async_eval=async_eval, fan_out=fan_out,
+        stop_val_schedule=stop_val_schedule, data_releaser=data_releaser,
     )
 
-    run_statistics = []
+    # In parallel runs, submit the most expensive runs first so that they do
+    # not delay the end of the benchmark. This is only done when some costs
+    # are known, as it requires to generate all the runs before submitting.
+    # With racing, the runs are submitted by dataset and objective instead.
+    if is_parallel(parallel_config) and not collect and racing is None:
+        costs = get_run_costs(benchmark)
+        has_hint = any(
+            getattr(klass, 'cost_hint', None) is not None
+            for klass, _ in solvers or []
+        )
+        if costs or has_hint:
+            total_cvg_kwargs_generator = order_runs_by_cost(
+                total_cvg_kwargs_generator, costs, is_cached=getattr(
+                    run_one_to_cvg_cached, 'check_call_in_cache', None
+                )
+            )
 
-    results_generator = parallel_run(
-        benchmark, run_one_to_cvg_final, total_cvg_kwargs_generator,
-        config=parallel_config, collect=collect
-    )
-    try:
-        for result, key, status, reason in results_generator:
-            run_statistics.extend(result)
-            terminal.set(dataset=key[0], objective=key[1], solver=key[2])
-            terminal.show_status(status=status, reason=reason)
-            if status == 'interrupted':
-                raise SystemExit(1)
-    except KeyboardInterrupt:
-        print(end='', flush=True)
-        terminal.show_status('interrupted')
-        raise
-
-    import pandas as pd
-    df = pd.DataFrame(run_statistics)
-    if df.empty:
+    # With a time budget, share the time left among the pending runs and do
+    # not submit the runs once the deadline is reached.
+    out_of_budget = []
+    if time_budget is not None and not collect:
+        n_workers = 1
+        if is_local_parallel(parallel_config):
+            n_workers = effective_n_jobs(parallel_config.get('n_jobs'))
+        total_cvg_kwargs_generator = apply_time_budget(
+            total_cvg_kwargs_generator, deadline, n_workers=n_workers,
+            out_of_budget=out_of_budget
+        )
+
+    # Measure the time to send each run to the local workers.
+    if is_local_parallel(parallel_config) and not collect:
+        total_cvg_kwargs_generator = map(
+            _add_dispatch_timer, total_cvg_kwargs_generator
+        )
+
+    if racing is not None:
+        results_generator = race_runs(
+            benchmark, run_one_to_cvg_final, total_cvg_kwargs_generator,
+            parallel_config=parallel_config, fraction=racing, collect=collect
+        )
+    else:
+        results_generator = parallel_run(
+            benchmark, run_one_to_cvg_final, total_cvg_kwargs_generator,
+            config=parallel_config, collect=collect
+        )
+
+    # Stream the results to the output file in the benchmark folder as the
+    # runs complete, so they are not all kept in memory and survive a crash.
+    with ResultWriter(output_path, resume=resume is not None) as writer:
+        # Runs with results in this session, to update the lists of runs not
+        # completed in the metadata of a resumed file.
+        run_keys, done_runs = set(), set()
+        try:
+            for result, key, status, reason, info in results_generator:
+                # Store the status with the rows, to tell the runs dropped
+                # from a race apart from the completed ones.
+                writer.write(result, info=dict(info or {}, run_status=status))
+                if len(result) > 0:
+                    run_key = tuple(result[0][k] for k in RUN_KEY_COLUMNS)
+                    run_keys.add(run_key)
+                    if status != 'dominated':
+                        done_runs.add(run_key)
+                if shared_data is not None:
+                    shared_data.release(key[0])
+                data_releaser.release(key[0])
+                terminal.set(dataset=key[0], objective=key[1], solver=key[2])
+                terminal.show_status(status=status, reason=reason)
+                if status == 'interrupted':
+                    raise SystemExit(1)
+                if status == 'dominated':
+                    writer.metadata.setdefault('dominated_runs', []).append(
+                        list(run_key)
+                    )
+                elif status == 'budget':
+                    # The run reached its worker after the deadline.
+                    writer.metadata.setdefault('budget_runs', []).append(
+                        [info[k] for k in RUN_KEY_COLUMNS]
+                    )
+            for kwargs in out_of_budget:
+                meta = kwargs['meta']
+                data_releaser.release(meta['dataset_name'])
+                terminal.set(
+                    dataset=meta['dataset_name'],
+                    objective=meta['objective_name'],
+                    solver=meta['solver_name']
+                )
+                terminal.show_status(status='budget')
+            if len(out_of_budget) > 0:
+                # Record the runs that were not started in the result file,
+                # so they can be run later with --resume.
+                writer.metadata.setdefault('budget_runs', []).extend(
+                    [kwargs['meta'][k] for k in RUN_KEY_COLUMNS]
+                    for kwargs in out_of_budget
+                )
+            update_run_lists(writer.metadata, run_keys, done_runs)
+            # The runs of a resumed file that were run again, as they were
+            # dropped from a race, are replaced by their new results.
+            if resume is not None:
+                writer.drop_resumed_runs(run_keys, RUN_KEY_COLUMNS)
+        except KeyboardInterrupt:
+            print(end='', flush=True)
+            terminal.show_status('interrupted')
+            raise
+        finally:
+            if shared_data is not None:
+                shared_data.close()
+            if cpu_pinning is not None:
+                cpu_pinning.close()
+            # Do not keep the objectives' states after the run, in case the
+            # data used by the benchmark changes before the next one.
+            SET_DATA_CACHE.clear()
+
+    output_file = writer.output_file
+    if output_file is None:
         terminal.savefile_status()
         return 1, None
-
-    # Save output in parquet file in the benchmark folder
-    output_file = save_results(df, output_dir / output_file)
+    if writer.n_parts == 0:
+        # Only the metadata are stored, e.g. with the runs out of budget.
+        return 1, output_file
 
     if plot_result:
         try:
@@ -345,11 +1371,12 @@ def _run_benchmark(benchmark, solvers=None, forced_solvers=None,
 
 def run_benchmark(benchmark_path, solver_names=None, forced_solvers=(),
                   dataset_names=None, objective_filters=None, max_runs=10,
-                  n_repetitions=1, timeout=None,
-                  n_jobs=None, parallel_config=None,
-                  plot_result=True, display=True, html=True,  collect=False,
-                  show_progress=True, pdb=False, no_cache=False,
-                  output_file="None"):
+                  n_repetitions=1, timeout=None, time_budget=None,
+                  racing=None, timing=None, memory=None, async_eval=None,
+                  fan_out=None, stop_val_schedule='geometric', n_jobs=None,
+                  parallel_config=None, pin_cpus=False, plot_result=True,
+                  display=True, html=True, collect=False, show_progress=True,
+                  pdb=False, no_cache=False, output_file="None", resume=None):
     """Run full benchmark.
 
     Parameters
@@ -375,12 +1402,49 @@ def run_benchmark(benchmark_path, solver_names=None, forced_solvers=(),
         The number of repetitions to run. Defaults to 1.
     timeout : float
         The maximum duration in seconds of the solver run.
+    time_budget : float | None
+        If not None, maximal duration in seconds of the whole benchmark. The
+        time left is shared among the pending runs, whose timeout is reduced
+        accordingly, and the runs that cannot start before the deadline get
+        the status 'budget'.
+    racing : float | None
+        If not None, run the solvers of each dataset and objective in
+        successive halving races, dropping this fraction of the solvers at
+        each round. The dropped runs get the status 'dominated'.
+    timing : tuple of (int, float) | None
+        If not None, ``(n_repeat, min_time)``: the solver is run at least
+        ``n_repeat`` times for each ``stop_val``, and until these runs last
+        ``min_time`` seconds. The minimum, median and inter-quartile range of
+        the durations are stored, and the median is used as ``time``.
+    memory : 'rss' | 'tracemalloc' | None
+        If not None, measure the peak memory of the solver for each
+        ``stop_val``, by sampling the resident memory of the process or by
+        tracing the Python allocations. See ``MemorySampler``.
+    async_eval : int | None
+        If not None, evaluate the objective in a background thread for the
+        solvers with the 'callback' strategy, so that they continue while
+        their results are evaluated, with at most ``async_eval`` pending
+        evaluations. The solver waits when more evaluations are pending.
+    fan_out : int | None
+        If not None, run the next ``fan_out`` resolutions of each curve at the
+        same time in a pool of local processes, for the solvers with the
+        'iteration' or 'tolerance' strategy that do not support continuation.
+        The resolutions after the stopping point are discarded.
+    stop_val_schedule : 'geometric' | 'time'
+        How the stop values of the curves are chosen. With 'geometric', they
+        grow geometrically. With 'time', they are chosen from the times
+        measured on the previous points to get points evenly spaced in log
+        scale of the time, up to the timeout.
     n_jobs : int
         Maximal number of workers to use to run the benchmark in parallel.
     parallel_config : dict | None
         If not None, launch the job in parallel. The provided config serves to
         set up parallelism using ``joblib.parallel_backend`` or ``submitit``.
         See :ref:`parallel_run` for detailed description.
+    pin_cpus : bool
+        If set to True, bind each local worker process to a disjoint set of
+        cores, to avoid the timing variations due to the migrations of the
+        processes. Only supported on Linux, with the ``loky`` backend.
     plot_result : bool
         If set to True (default), generate the result plot and save them in
         the benchmark directory.
@@ -404,6 +1468,11 @@ def run_benchmark(benchmark_path, solver_names=None, forced_solvers=(),
     output_file : str
         Filename for the parquet output. If given, the results will
         be stored at <BENCHMARK>/outputs/<filename>.parquet.
+    resume : str | Path | None
+        If not None, path or name in <BENCHMARK>/outputs of a result file,
+        possibly partial. The runs already stored in this file are skipped
+        and the new results are appended to it. Not compatible with
+        ``output_file``.
 
     Returns
     -------
@@ -433,14 +1502,23 @@ def run_benchmark(benchmark_path, solver_names=None, forced_solvers=(),
         max_runs=max_runs,
         n_repetitions=n_repetitions,
         timeout=timeout,
+        time_budget=time_budget,
+        racing=racing,
+        timing=timing,
+        memory=memory,
+        async_eval=async_eval,
+        fan_out=fan_out,
+        stop_val_schedule=stop_val_schedule,
         plot_result=plot_result,
         display=display,
         html=html,
         collect=collect,
         show_progress=show_progress,
         parallel_config=parallel_config,
+        pin_cpus=pin_cpus,
         pdb=pdb,
-        output_file=output_file
+        output_file=output_file,
+        resume=resume,
     )
     if exit_code != 0:
         raise RuntimeError("Benchmark failed, check the terminal output.")
@@ -1,6 +1,8 @@
 import time
 import math
 
+from .utils.terminal_output import print_debug
+
 # Possible curve sampling strategies
 SAMPLING_STRATEGIES = ['iteration', 'tolerance', 'callback', 'run_once']
 
@@ -17,6 +19,15 @@ INFINITY = 3e38  # see: np.finfo('float32').max
 RHO = 1.5
 RHO_INC = 1.2  # multiplicative update if rho is too small
 
+# Schedules of the stop values: 'geometric' multiplies them by ``rho``, and
+# 'time' targets times evenly spaced in log scale.
+STOP_VAL_SCHEDULES = ['geometric', 'time']
+TIME_FIT_POINTS = 3  # number of last points used to fit the time
+MIN_GROWTH = 1.01  # bounds on the growth of the work between two points
+MAX_GROWTH = 100
+MIN_TIME_RATIO = 1.1  # minimal ratio between two target times
+MIN_TIME_EXPONENT = 0.2  # below, the time does not depend on the stop value
+
 
 COMMON_ARGS_DOC = """
     strategy : str in {'iteration', 'tolerance', 'callback'}
@@ -41,8 +52,8 @@ class StoppingCriterion():
     This base class will check for the timeout and the max_run.
     It should be sub-classed to check for the convergence of the algorithm.
 
-    This class also handles the detection of diverging solvers and prints the
-    progress if given a ``progress_str``.
+    This class also handles the detection of diverging solvers and reports
+    the progress if given a ``progress_callback``.
 
     Instances of this class should only be created with class method
     `cls.get_runner_instance`, to make sure the class holds the proper
@@ -85,8 +96,9 @@ class StoppingCriterion():
         else:
             self.key_to_monitor_ = None
 
-    def get_runner_instance(self, max_runs=1, timeout=None, terminal=None,
-                            solver=None, run_key=None):
+    def get_runner_instance(self, max_runs=1, timeout=None, solver=None,
+                            run_key=None, progress_callback=None,
+                            schedule='geometric'):
         """Copy the stopping criterion and set the parameters that depends on
         how benchopt runner is called.
 
@@ -97,13 +109,22 @@ class StoppingCriterion():
             the convergence curve.
         timeout : float
             The maximum duration in seconds of the solver run.
-        terminal : TerminalOutput or None
-            Object to format string to display the progress of the solver.
         solver : BaseSolver
             The solver for which this stopping criterion is called. Used to get
             overridden ``sampling_strategy`` and ``get_next``.
         run_key : tuple
             The key to identify the run in the benchmark results.
+        progress_callback : callable | None
+            Function called with the progress of the solver, as a float in
+            [0, 1] or a str, to display it. If None, the progress is not
+            reported.
+        schedule : 'geometric' | 'time'
+            How the stop values are chosen. With 'geometric', they grow by a
+            factor ``rho``, which is increased when the curve is flat. With
+            'time', the time of the solver is fitted as a function of the
+            stop value on the points measured with ``record_time``, to reach
+            times evenly spaced in log scale between the first point and the
+            timeout. See ``get_next_stop_val``.
 
         Returns
         -------
@@ -133,6 +154,10 @@ class StoppingCriterion():
                 'its criterion, and it does not match. Only set it once.'
             )
 
+        assert schedule in STOP_VAL_SCHEDULES, (
+            f"schedule should be in {STOP_VAL_SCHEDULES}. Got '{schedule}'."
+        )
+
         # Create a new instance of the class
         stopping_criterion = self.__class__(
             strategy=self.strategy, key_to_monitor=self.key_to_monitor,
@@ -143,12 +168,14 @@ class StoppingCriterion():
         stopping_criterion.rho = RHO
         stopping_criterion.timeout = timeout
         stopping_criterion.max_runs = max_runs
-        stopping_criterion.terminal = terminal
         stopping_criterion.solver = solver
         stopping_criterion.run_key = run_key
+        stopping_criterion.progress_callback = progress_callback
+        stopping_criterion.schedule = schedule
 
         # Initialize the number of evaluation for iterative tracking
         stopping_criterion.n_eval = 0
+        stopping_criterion._times = []
         # Override get_next_stop_val if ``get_next`` is implemented for solver.
         if hasattr(solver, 'get_next'):
             if not callable(solver.get_next):
@@ -226,10 +253,10 @@ class StoppingCriterion():
 
         if self.key_to_monitor_ is not None:
             # Compatibility with the objective
-            if self.key_to_monitor_ not in objective_list[0]:
+            if self.key_to_monitor_ not in objective_list[-1]:
                 key = self.key_to_monitor_.replace("objective_", "")
                 key_ok = [
-                    k.replace("objective_", "") for k in objective_list[0]
+                    k.replace("objective_", "") for k in objective_list[-1]
                     if k.startswith("objective_") and k != 'objective_name'
                 ]
                 raise ValueError(
@@ -310,13 +337,13 @@ class StoppingCriterion():
 
     def debug(self, msg):
         """Helper to print debug messages."""
-        if self.terminal is not None:
-            self.terminal.debug(msg)
+        if self.run_key is not None:
+            print_debug(msg, self.run_key[2])
 
     def progress(self, progress):
-        """Helper to print progress messages."""
-        if self.terminal is not None:
-            self.terminal.progress(progress, self.run_key)
+        """Helper to report the progress of the solver."""
+        if self.progress_callback is not None:
+            self.progress_callback(progress)
 
     @classmethod
     def _reconstruct(cls, kwargs, runner_kwargs):
@@ -333,18 +360,96 @@ class StoppingCriterion():
         if getattr(self, 'max_runs', None):
             runner_kwargs = dict(
                 max_runs=self.max_runs, timeout=self.timeout,
-                terminal=self.terminal, solver=self.solver
+                solver=self.solver, run_key=self.run_key,
+                progress_callback=self.progress_callback,
+                schedule=self.schedule
             )
         else:
             runner_kwargs = None
         return self._reconstruct, (self.__class__, kwargs, runner_kwargs)
 
+    def record_time(self, stop_val, time):
+        """Record the time of the solver for a stop value.
+
+        The times are used to choose the next stop values with the 'time'
+        schedule.
+        """
+        self._times.append((stop_val, time))
+
     def get_next_stop_val(self, stop_val):
+        if self.schedule == 'time':
+            next_stop_val = self._get_time_targeted_stop_val(stop_val)
+            if next_stop_val is not None:
+                return next_stop_val
         if self.strategy == "tolerance":
             return min(1, max(stop_val / self.rho, MIN_TOL))
         else:
             return max(stop_val + 1, min(int(self.rho * stop_val), MAX_ITER))
 
+    def _get_work(self, stop_val):
+        "Amount of work of the solver for a stop value, growing with it."
+        if self.strategy == "tolerance":
+            # The initial tolerance does not run the solver.
+            return 1 / stop_val if stop_val < INFINITY else 0
+        return stop_val
+
+    def _get_time_targeted_stop_val(self, stop_val):
+        """Return the stop value reaching the next target time.
+
+        The time is fitted as a power of the work of the solver, i.e. the
+        number of iterations or the inverse of the tolerance, on the last
+        ``TIME_FIT_POINTS`` points. The target times are spaced in log scale
+        between the time of the first point and the timeout, so that
+        ``max_runs`` points span the time of the run, or by a factor ``rho``
+        without timeout.
+
+        Returns None if the fit is not possible, e.g. with less than two
+        points or when the time barely increases with the work, so that the
+        geometric schedule is used.
+        """
+        points = [
+            (math.log(self._get_work(s)), math.log(t))
+            for s, t in self._times if t > 0 and self._get_work(s) > 0
+        ]
+        work = self._get_work(stop_val)
+        if len(points) < 2 or work <= 0:
+            return None
+
+        # Least-squares fit of log(time) = log_a + b * log(work)
+        fit_points = points[-TIME_FIT_POINTS:]
+        mean_x = sum(x for x, _ in fit_points) / len(fit_points)
+        mean_y = sum(y for _, y in fit_points) / len(fit_points)
+        var_x = sum((x - mean_x) ** 2 for x, _ in fit_points)
+        if var_x == 0:
+            return None
+        b = sum(
+            (x - mean_x) * (y - mean_y) for x, y in fit_points
+        ) / var_x
+        if b < MIN_TIME_EXPONENT:
+            return None
+        log_a = mean_y - b * mean_x
+
+        # Next time of the log grid after the time of stop_val.
+        log_t_first = points[0][1]
+        log_ratio = math.log(self.rho)
+        if self.timeout is not None:
+            log_ratio = (
+                (math.log(self.timeout) - log_t_first)
+                / max(self.max_runs - 1, 1)
+            )
+        log_ratio = max(log_ratio, math.log(MIN_TIME_RATIO))
+        log_t = log_a + b * math.log(work)
+        k = math.floor((log_t - log_t_first) / log_ratio) + 1
+        log_target = log_t_first + max(k, 1) * log_ratio
+
+        next_work = math.exp(min(
+            max((log_target - log_a) / b, math.log(work * MIN_GROWTH)),
+            math.log(work * MAX_GROWTH)
+        ))
+        if self.strategy == "tolerance":
+            return min(1, max(1 / next_work, MIN_TOL))
+        return max(stop_val + 1, min(math.ceil(next_work), MAX_ITER))
+
 
 class SufficientDescentCriterion(StoppingCriterion):
     f"""Stopping criterion based on sufficient descent.
@@ -392,6 +392,62 @@ def test_save_final_results_with_caching(no_debug_log, sampling_strategy):
     assert len(final_results) >= 1
 
 
+@pytest.mark.parametrize("cache_solver_results", [False, True])
+@pytest.mark.parametrize("save_final_results", [False, True])
+def test_solver_results_not_cached(
+    no_debug_log, monkeypatch, cache_solver_results, save_final_results
+):
+    """The solver output is only stored in the cache when requested.
+
+    When the final run is retrieved from the cache without its output, the
+    solver is run again only if save_final_results needs this output.
+    """
+    monkeypatch.setenv(
+        "BENCHOPT_CACHE_SOLVER_RESULTS", str(cache_solver_results)
+    )
+    objective = f"""
+    from benchopt.utils.temp_benchmark import TempObjective
+
+    class Objective(TempObjective):
+        if {save_final_results}:
+            def save_final_results(self, beta):
+                return "saved"
+    """
+
+    solver = """
+    from benchopt.utils.temp_benchmark import TempSolver
+
+    class Solver(TempSolver):
+        name = "test-solver"
+        sampling_strategy = 'iteration'
+
+        def run(self, n_iter):
+            print(f"#RUN{n_iter}")
+            super().run(n_iter)
+    """
+
+    common_args = [
+        '-s', 'test-solver', '-d', 'test-dataset', '-n', '3', '--no-plot'
+    ]
+    with temp_benchmark(objective=objective, solvers=solver) as bench:
+        with CaptureCmdOutput() as out:
+            run([str(bench.benchmark_dir), "--timeout", "100"] + common_args,
+                standalone_mode=False)
+        out.check_output("#RUN", repetition=4)
+
+        # Changing the timeout makes the full run miss the cache, but all
+        # the stop_val are retrieved from the cache.
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            run([str(bench.benchmark_dir), "--timeout", "200"] + common_args,
+                standalone_mode=False)
+        data = read_results(out.result_files[0])
+
+    rerun = save_final_results and not cache_solver_results
+    out.check_output("#RUN", repetition=int(rerun))
+    if save_final_results:
+        assert data["final_results"].dropna().tolist() == ["saved"]
+
+
 @pytest.mark.parametrize("n_iter", [1, 2, 5])
 def test_run_once_iteration(n_iter):
 
@@ -514,15 +570,17 @@ def test_paths_config_key(test_case, n_jobs):
                 standalone_mode=False
             )
 
+        # With n_jobs > 1, the data is shared with the workers by the main
+        # process, so get_data is only called once.
         expected_home = Path(
             expected_home.format(bench_dir=bench.benchmark_dir.as_posix())
         ).resolve()
-        out.check_output(re.escape(f"HOME:{expected_home}"), repetition=n_jobs)
+        out.check_output(re.escape(f"HOME:{expected_home}"), repetition=1)
 
         expected_path = Path(
             expected_path.format(bench_dir=bench.benchmark_dir.as_posix())
         ).resolve()
-        out.check_output(re.escape(f"PATH:{expected_path}"), repetition=n_jobs)
+        out.check_output(re.escape(f"PATH:{expected_path}"), repetition=1)
 
 
 @pytest.mark.parametrize("n_runs,n_reps", [(1, 3), (2, 2), (5, 1)])
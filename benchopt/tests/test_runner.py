@@ -1,5 +1,7 @@
+import sys
 import pytest
 import inspect
+from pathlib import Path
 
 from benchopt.cli.main import run
 from benchopt.results import read_results
@@ -181,6 +183,77 @@ def test_warmup_error(no_debug_log):
         out.check_output("No output produced.", repetition=1)
 
 
+@pytest.mark.parametrize('strategy', ['iteration', 'tolerance'])
+def test_solver_continuation(no_debug_log, strategy):
+    from benchopt import run_benchmark
+
+    solver = f"""from benchopt.utils.temp_benchmark import TempSolver
+
+        class Solver(TempSolver):
+            name = "solver1"
+            sampling_strategy = '{strategy}'
+            supports_continuation = True
+            def set_objective(self, X, y, lmbd):
+                print("#RESET")
+                self.n_calls = 0
+            def warm_up(self): self.run_once()
+            def run(self, stop_val):
+                self.n_calls += 1
+                print(f"#RUN:{{self.n_calls}}")
+            def get_result(self): return dict(beta=self.n_calls)
+    """
+    objective = """from benchopt.utils.temp_benchmark import TempObjective
+
+        class Objective(TempObjective):
+            def evaluate_result(self, beta): return -beta
+    """
+
+    with temp_benchmark(solvers=solver, objective=objective) as benchmark:
+        with CaptureCmdOutput() as out:
+            output_file = run_benchmark(
+                str(benchmark.benchmark_dir),
+                solver_names=["solver1"], dataset_names=["test-dataset"],
+                max_runs=4, n_repetitions=1, n_jobs=1, plot_result=False
+            )
+            df = read_results(output_file)
+
+    # The state is only reset after the warm up, and each run continues from
+    # the previous one, with a cumulative time.
+    out.check_output("#RESET", repetition=2)
+    out.check_output("#RUN:1", repetition=2)
+    out.check_output("#RUN:5", repetition=1)
+    assert df['objective_value'].tolist() == [-1, -2, -3, -4, -5]
+    assert df['time'].is_monotonic_increasing
+
+
+@pytest.mark.parametrize('strategy, run', [
+    ('iteration', 'pass'), ('callback', 'while cb(): pass')
+])
+def test_sys_info_in_results(no_debug_log, strategy, run):
+    from benchopt import run_benchmark
+
+    solver = f"""from benchopt.utils.temp_benchmark import TempSolver
+
+        class Solver(TempSolver):
+            name = "solver1"
+            sampling_strategy = '{strategy}'
+            def run(self, cb):
+                {run}
+    """
+
+    with temp_benchmark(solvers=solver) as benchmark:
+        output_file = run_benchmark(
+            str(benchmark.benchmark_dir),
+            solver_names=["solver1"], dataset_names=["test-dataset"],
+            max_runs=3, n_repetitions=2, n_jobs=1, plot_result=False
+        )
+        df = read_results(output_file)
+
+    # The system info is added to all the rows of the results
+    for col in ['platform', 'system-cpus', 'version-numpy']:
+        assert df[col].notna().all(), col
+
+
 class TestCache:
     """Test the cache of the benchmark."""
 
@@ -212,6 +285,77 @@ class TestCache:
         # when using multiple repetitions
         out.check_output("#RUN_SOLVER", repetition=n_reps)
 
+    @pytest.mark.parametrize('strategy', ['run_once', 'iteration'])
+    def test_cache_run_one_resolution(self, no_debug_log, strategy):
+        solver = self.solver.replace('run_once', strategy)
+        with temp_benchmark(solvers=solver, datasets=self.dataset) as bench:
+            with CaptureCmdOutput():
+                run(f"{bench.benchmark_dir} --no-plot -n 2".split(),
+                    standalone_mode=False)
+            cached_funcs = [
+                p.name for p in bench.get_cache_location().rglob('*')
+                if 'run_one' in p.name
+            ]
+
+        # For run_once solvers, run_one_resolution is only called once and
+        # its result is cached with run_one_to_cvg.
+        assert 'run_one_to_cvg' in cached_funcs
+        if strategy == 'run_once':
+            assert not any('resolution' in f for f in cached_funcs)
+        else:
+            assert any('resolution' in f for f in cached_funcs)
+
+    def test_cache_expensive_after(self, no_debug_log):
+        from benchopt.runner import cache_run_one_resolution
+        from benchopt._generate_runs import get_solver_kwargs
+        from benchopt.utils.terminal_output import TerminalOutput
+
+        objective = """from benchopt.utils.temp_benchmark import TempObjective
+
+            class Objective(TempObjective):
+                def evaluate_result(self, beta): return dict(value=1)
+                def evaluate_expensive_result(self, beta):
+                    return dict(expensive=1)
+        """
+        solver = self.solver.replace('run_once', 'iteration')
+        with temp_benchmark(
+            objective=objective, solvers=solver, datasets=self.dataset
+        ) as bench:
+            terminal = TerminalOutput(1, False)
+            kwargs = next(get_solver_kwargs(
+                benchmark=bench,
+                dataset=bench.get_datasets()[0].get_instance(),
+                objective=bench.get_benchmark_objective().get_instance(),
+                solver=bench.get_solvers()[0].get_instance(),
+                n_repetitions=1, max_runs=1, terminal=terminal,
+            ))
+            objective, solver = kwargs['objective'], kwargs['solver']
+            objective._restore_dataset()
+            solver._set_objective(objective)
+            run_cached = cache_run_one_resolution(bench)
+
+            def has_metrics(stop_val, expensive_after):
+                objective_list, _ = run_cached(
+                    objective=objective, solver=solver, meta=kwargs['meta'],
+                    stop_val=stop_val, expensive_after=expensive_after
+                )
+                return 'objective_expensive' in objective_list[0]
+
+            with CaptureCmdOutput() as out:
+                # The threshold is not in the cache key, and the cached
+                # metrics are kept even when they are not due.
+                assert has_metrics(1, 1e-9)
+                assert has_metrics(1, 2e-9)
+                assert has_metrics(1, float('inf'))
+
+                # The run is done again when the metrics are due but were
+                # not computed in the cached run.
+                assert not has_metrics(2, float('inf'))
+                assert has_metrics(2, 0.)
+                assert has_metrics(2, 0.)
+
+        out.check_output("#RUN_SOLVER", repetition=3)
+
     @pytest.mark.parametrize('n_reps', [1, 4])
     def test_no_cache(self, no_debug_log, n_reps):
         with temp_benchmark(
@@ -571,12 +715,35 @@ class TestSeed:
                     .split(), standalone_mode=False,
                 )
 
-        # With n_jobs=1, the dataset is loaded once regardless the numbe
-        # of repetitions.
-        # With n_jobs>1, the dataset is loaded once per repetition, plus once
-        # when creating loading the dataset in the main process, so 1 + n_reps.
-        n_match = 1 if n_jobs == 1 else 4
-        out.check_output("#DATA-LOAD", repetition=n_match)
+        # The dataset is loaded once regardless the number of repetitions.
+        # With n_jobs>1, the data is shared with the workers by the main
+        # process so they do not load it again.
+        out.check_output("#DATA-LOAD", repetition=1)
+
+    @pytest.mark.parametrize('use_repetition', [True, False])
+    def test_set_data_once(self, no_debug_log, use_repetition):
+        objective = """from benchopt.utils.temp_benchmark import TempObjective
+
+            class Objective(TempObjective):
+                def set_data(self, X, y):
+                    print('#SET-DATA')
+        """
+        solvers = [
+            self.get_solver(name="solver1"), self.get_solver(name="solver2")
+        ]
+        with temp_benchmark(
+            objective=objective, solvers=solvers,
+            datasets=self.get_dataset(
+                use_solver=False, use_repetition=use_repetition
+            )
+        ) as bench:
+            with CaptureCmdOutput() as out:
+                cmd_str = f"{bench.benchmark_dir} --no-plot --no-cache -r 3"
+                run(cmd_str.split(), standalone_mode=False)
+
+        # The state after set_data is shared by all the solvers, and by the
+        # repetitions when the data does not depend on them.
+        out.check_output("#SET-DATA", repetition=3 if use_repetition else 1)
 
 
 def test_get_run_output_path():
@@ -699,3 +866,629 @@ def test_dataset_run_context_in_evaluate_result(no_debug_log, monkeypatch):
                  "--no-plot", "--no-cache"], standalone_mode=False)
 
     out.check_output("#DATASET-SEED-IN-EVAL#", repetition=1)
+
+
+def test_release_data_after_last_run(no_debug_log):
+    from benchopt._generate_runs import DataReleaser, generate_run_kwargs
+    from benchopt.utils.terminal_output import TerminalOutput
+
+    dataset = """from benchopt.utils.temp_benchmark import TempDataset
+
+        class Dataset(TempDataset):
+            name = "test-dataset"
+            parameters = {'n_samples': [10, 20]}
+    """
+    with temp_benchmark(datasets=dataset) as bench:
+        def get_all_runs(data_releaser=None):
+            return generate_run_kwargs(
+                bench, solvers=bench.check_solver_patterns(["test-solver"]),
+                datasets=bench.check_dataset_patterns(["test-dataset"]),
+                objectives=bench.check_objective_filters([]),
+                n_repetitions=2, terminal=TerminalOutput(2, False),
+                data_releaser=data_releaser,
+            )
+
+        with CaptureCmdOutput():
+            datasets = []
+            for kwargs in get_all_runs():
+                datasets.append(kwargs['objective']._dataset)
+                assert datasets[-1]._data is not None
+                # Without data_releaser, the data of the previous dataset is
+                # released once all its runs have been generated.
+                assert all(d._data is None for d in datasets[:-2])
+
+            # With data_releaser, the data is kept until all the runs of the
+            # dataset have completed, even if they are all generated first.
+            data_releaser = DataReleaser()
+            all_runs = list(get_all_runs(data_releaser))
+            for i, kwargs in enumerate(all_runs):
+                dataset = kwargs['objective']._dataset
+                assert dataset._data is not None
+                data_releaser.release(kwargs['meta']['dataset_name'])
+                assert (dataset._data is None) == (i % 2 == 1)
+
+    assert len(datasets) == 4
+    assert datasets[0] is datasets[1] and datasets[2] is datasets[3]
+    assert all(d._data is None for d in datasets)
+
+
+def test_time_budget_load_data_once(no_debug_log):
+    # The runs are all generated before the first one starts to share the
+    # time budget, but the data is not released before they run.
+    dataset = """from benchopt.utils.temp_benchmark import TempDataset
+        import numpy as np
+
+        class Dataset(TempDataset):
+            name = "test-dataset"
+            parameters = {'n_samples': [10, 20]}
+            def get_data(self):
+                print("#GET_DATA")
+                return dict(X=np.ones((self.n_samples, 2)), y=np.ones(10))
+    """
+    objective = """from benchopt.utils.temp_benchmark import TempObjective
+
+        class Objective(TempObjective):
+            def set_data(self, X, y):
+                print("#SET_DATA")
+    """
+    with temp_benchmark(objective=objective, datasets=dataset) as bench:
+        with CaptureCmdOutput() as out:
+            run(f"{bench.benchmark_dir} -d test-dataset -s test-solver -r 2 "
+                "-n 1 --time-budget 100 --no-plot --no-cache".split(),
+                standalone_mode=False)
+
+    out.check_output("#GET_DATA", repetition=2)
+    out.check_output("#SET_DATA", repetition=2)
+
+
+def test_order_runs_by_cost():
+    from types import SimpleNamespace
+    from benchopt._generate_runs import order_runs_by_cost
+
+    def get_kwargs(solver_name, cost_hint=None, force=False):
+        return dict(
+            meta=dict(
+                dataset_name="d", objective_name="o", solver_name=solver_name
+            ),
+            solver=SimpleNamespace(cost_hint=cost_hint), force=force,
+        )
+
+    all_run_kwargs = [
+        get_kwargs("fast"), get_kwargs("cached"), get_kwargs("hint", 5),
+        get_kwargs("unknown"), get_kwargs("slow"),
+        get_kwargs("cached", force=True),
+    ]
+    costs = {("d", "o", "fast"): 1, ("d", "o", "slow"): 10,
+             ("d", "o", "cached"): 100}
+
+    def is_cached(meta, **kwargs):
+        return meta['solver_name'] == "cached"
+
+    ordered = order_runs_by_cost(all_run_kwargs, costs, is_cached=is_cached)
+    # The forced run is not cached and the runs without estimate are
+    # considered as expensive as the most expensive known run.
+    assert [
+        (kw['meta']['solver_name'], kw['force']) for kw in ordered
+    ] == [
+        ("unknown", False), ("cached", True), ("slow", False),
+        ("hint", False), ("fast", False), ("cached", False)
+    ]
+
+
+def test_get_run_costs(no_debug_log):
+    from benchopt.runner import get_run_costs
+
+    solver = """from benchopt.utils.temp_benchmark import TempSolver
+        import time
+
+        class Solver(TempSolver):
+            name = "slow-solver"
+            sampling_strategy = "run_once"
+            def run(self, _):
+                time.sleep(0.1)
+    """
+    with temp_benchmark(solvers=[solver]) as bench:
+        assert get_run_costs(bench) == {}
+        with CaptureCmdOutput():
+            run(f"{bench.benchmark_dir} -d test-dataset -s slow-solver -r 2 "
+                "--no-plot --no-cache".split(), standalone_mode=False)
+            costs = get_run_costs(bench)
+
+    assert list(costs) == [("test-dataset", "test-objective", "slow-solver")]
+    assert 0.1 <= costs["test-dataset", "test-objective", "slow-solver"] < 1
+
+
+def test_time_budget(no_debug_log):
+    from benchopt.results.parquet import get_metadata
+
+    solvers = [
+        f"""from benchopt.utils.temp_benchmark import TempSolver
+        import time
+
+        class Solver(TempSolver):
+            name = "solver{i}"
+            sampling_strategy = "run_once"
+            def run(self, _):
+                time.sleep(1.2)
+        """ for i in range(3)
+    ]
+    with temp_benchmark(solvers=solvers) as bench:
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            run(f"{bench.benchmark_dir} -d test-dataset -r 2 "
+                "--time-budget 3 --no-plot --no-cache".split(),
+                standalone_mode=False)
+
+        result_file = Path(out.result_files[0])
+        df = read_results(result_file)
+        budget_runs = get_metadata(result_file)['budget_runs']
+
+    # The first repetition of each solver is run first, and the runs that
+    # cannot start before the deadline are reported.
+    assert sorted(df['idx_rep'].unique()) == [0]
+    assert df['solver_name'].nunique() == 3
+    out.check_output(r"not run \(time budget\)", repetition=3)
+    assert sorted(run[2:] for run in budget_runs) == [
+        [f"solver{i}", 1] for i in range(3)
+    ]
+
+
+def test_time_budget_dispatched(no_debug_log):
+    from benchopt.results.parquet import get_metadata
+
+    solvers = [
+        f"""from benchopt.utils.temp_benchmark import TempSolver
+        import time
+
+        class Solver(TempSolver):
+            name = "solver{i}"
+            sampling_strategy = "run_once"
+            def run(self, _):
+                time.sleep(4.5)
+        """ for i in range(4)
+    ]
+    with temp_benchmark(solvers=solvers) as bench:
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            run(f"{bench.benchmark_dir} -d test-dataset -j 2 "
+                "--time-budget 4 --no-plot --no-cache".split(),
+                standalone_mode=False)
+
+        result_file = Path(out.result_files[0])
+        df = read_results(result_file)
+        budget_runs = get_metadata(result_file)['budget_runs']
+
+    # All the runs are sent to the workers before the deadline, but the ones
+    # waiting for a free worker start after it and are reported.
+    assert len(budget_runs) >= 2
+    out.check_output(r"not run \(time budget\)", repetition=len(budget_runs))
+    assert sorted(
+        [*df['solver_name'].unique(), *(run[2] for run in budget_runs)]
+    ) == [f"solver{i}" for i in range(4)]
+
+
+def test_time_budget_no_results(no_debug_log):
+    from benchopt.results.parquet import get_metadata
+
+    solver = """from benchopt.utils.temp_benchmark import TempSolver
+
+        class Solver(TempSolver):
+            name = "solver"
+            sampling_strategy = "run_once"
+            def run(self, _): print("#RUN")
+    """
+    with temp_benchmark(solvers=[solver]) as bench:
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            with pytest.raises(SystemExit, match="1"):
+                run(f"{bench.benchmark_dir} -d test-dataset -r 2 "
+                    "--time-budget 0 --no-plot --no-cache".split(),
+                    standalone_mode=False)
+
+        # The runs out of budget are stored in the metadata of the output,
+        # even if no run produced results, so they can be resumed.
+        out.check_output("#RUN", repetition=0)
+        result_file = Path(out.result_files[0])
+        assert len(read_results(result_file)) == 0
+        assert sorted(get_metadata(result_file)['budget_runs']) == [
+            ["test-dataset", "test-objective", "solver", i] for i in range(2)
+        ]
+
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            run(f"{bench.benchmark_dir} -d test-dataset -r 2 --no-plot "
+                f"--no-cache --resume {result_file}".split(),
+                standalone_mode=False)
+
+        out.check_output("#RUN", repetition=2)
+        assert len(read_results(result_file)) == 2
+        assert get_metadata(result_file)['budget_runs'] == []
+
+
+@pytest.mark.parametrize('strategy', ['iteration', 'callback'])
+def test_resource_usage(no_debug_log, strategy):
+    from benchopt.utils.resource_usage import RESOURCE_COLUMNS
+
+    solver = f"""from benchopt.utils.temp_benchmark import TempSolver
+        import time
+
+        class Solver(TempSolver):
+            name = "busy"
+            sampling_strategy = "{strategy}"
+            def run(self, n_iter):
+                if self.sampling_strategy == "callback":
+                    while n_iter():
+                        self._busy()
+                else:
+                    for _ in range(n_iter):
+                        self._busy()
+            def _busy(self):
+                t_start = time.process_time()
+                while time.process_time() - t_start < 0.005:
+                    pass
+            def get_result(self): return dict(beta=1)
+    """
+    with temp_benchmark(solvers=[solver]) as bench:
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            run(f"{bench.benchmark_dir} -d test-dataset --max-runs 5 "
+                "--no-plot --no-cache".split(), standalone_mode=False)
+
+        df = read_results(Path(out.result_files[0]))
+
+    # The resources used by the solver are stored, and increase along the
+    # curve as the solver runs longer.
+    assert all(col in df for col in RESOURCE_COLUMNS)
+    assert df['cpu_time'].iloc[-1] > 0
+    assert df['cpu_time'].iloc[-1] <= df['time'].iloc[-1] * 1.5
+    assert (df[RESOURCE_COLUMNS] >= 0).all().all()
+
+
+@pytest.mark.parametrize('options, n_repeat', [
+    ("--timing-repeat 3", 3), ("--timing-window 0.1", 5)
+])
+def test_timing_repeat(no_debug_log, options, n_repeat):
+    objective = """from benchopt.utils.temp_benchmark import TempObjective
+
+        class Objective(TempObjective):
+            def evaluate_result(self, n_runs): return n_runs
+    """
+    solver = """from benchopt.utils.temp_benchmark import TempSolver
+        import time
+
+        class Solver(TempSolver):
+            name = "repeated"
+            sampling_strategy = "iteration"
+            n_runs = 0
+            def run(self, n_iter):
+                self.n_runs += 1
+                time.sleep(0.02)
+            def get_result(self): return dict(n_runs=self.n_runs)
+    """
+    with temp_benchmark(objective=objective, solvers=[solver]) as bench:
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            run(f"{bench.benchmark_dir} -d test-dataset --max-runs 3 "
+                f"{options} --no-plot --no-cache".split(),
+                standalone_mode=False)
+
+        df = read_results(Path(out.result_files[0]))
+
+    # The solver is run several times for each stop_val, and the objective is
+    # evaluated after the last run.
+    assert (df['time_repeat'] >= n_repeat).all()
+    n_runs = df['objective_value'].diff().dropna()
+    assert (n_runs == df['time_repeat'][1:]).all()
+    assert (df['time_min'] <= df['time_median']).all()
+    assert (df['time'] == df['time_median']).all()
+    assert (df['time_iqr'] >= 0).all()
+
+
+def test_async_eval(no_debug_log):
+    objective = """from benchopt.utils.temp_benchmark import TempObjective
+        import time
+
+        class Objective(TempObjective):
+            def evaluate_result(self, x):
+                time.sleep(0.01)
+                return len(x)
+    """
+    solver = """from benchopt.utils.temp_benchmark import TempSolver
+
+        class Solver(TempSolver):
+            name = "inplace"
+            sampling_strategy = "callback"
+            def run(self, cb):
+                self.x = []
+                while cb():
+                    self.x.append(0)
+            def get_result(self): return dict(x=self.x)
+    """
+    stop_vals = {}
+    with temp_benchmark(objective=objective, solvers=[solver]) as bench:
+        for options in ["", "--async-eval 2"]:
+            with CaptureCmdOutput(delete_result_files=False) as out:
+                run(f"{bench.benchmark_dir} -d test-dataset --max-runs 5 "
+                    f"{options} --no-plot --no-cache".split(),
+                    standalone_mode=False)
+
+            df = read_results(Path(out.result_files[0]))
+            stop_vals[options] = df['stop_val'].tolist()
+
+            # The result is copied before the solver updates it in place, and
+            # the points after the stopping criterion are dropped.
+            assert (df['objective_value'] == df['stop_val']).all()
+            assert (df['overhead_eval'] >= 0).all()
+
+    assert stop_vals[""] == stop_vals["--async-eval 2"]
+
+
+def test_async_eval_stop_vals(no_debug_log):
+    objective = """from benchopt.utils.temp_benchmark import TempObjective
+        import time
+
+        class Objective(TempObjective):
+            def evaluate_result(self, x):
+                time.sleep(0.01)
+                return -(len(x) // 8)
+    """
+    solver = """from benchopt.utils.temp_benchmark import TempSolver
+        from benchopt.stopping_criterion import SufficientProgressCriterion
+        import time
+
+        class Solver(TempSolver):
+            name = "plateaus"
+            sampling_strategy = "callback"
+            stopping_criterion = SufficientProgressCriterion(patience=100)
+            def run(self, cb):
+                self.x = []
+                while cb():
+                    time.sleep(1e-4)
+                    self.x.append(0)
+            def get_result(self): return dict(x=self.x)
+    """
+    stop_vals = {}
+    with temp_benchmark(objective=objective, solvers=[solver]) as bench:
+        for options in ["", "--async-eval 1", "--async-eval 3"]:
+            with CaptureCmdOutput(delete_result_files=False) as out:
+                run(f"{bench.benchmark_dir} -d test-dataset --max-runs 10 "
+                    f"{options} --no-plot --no-cache".split(),
+                    standalone_mode=False)
+
+            df = read_results(Path(out.result_files[0]))
+            stop_vals[options] = df['stop_val'].tolist()
+
+    # The flat parts of the curve increase the steps between the stop values,
+    # which are only known once the points are evaluated, so the stop values
+    # computed ahead are corrected. With more pending evaluations, the solver
+    # can pass the corrected stop value before it is known.
+    assert stop_vals["--async-eval 1"] == stop_vals[""]
+    assert stop_vals["--async-eval 3"][:3] == stop_vals[""][:3]
+    assert len(stop_vals["--async-eval 3"]) == len(stop_vals[""])
+
+
+def test_async_eval_resources(no_debug_log):
+    objective = """from benchopt.utils.temp_benchmark import TempObjective
+        import time
+
+        class Objective(TempObjective):
+            def evaluate_result(self, beta):
+                t0 = time.thread_time()
+                while time.thread_time() - t0 < 0.03:
+                    pass
+                return 1
+    """
+    solver = """from benchopt.utils.temp_benchmark import TempSolver
+        import time
+
+        class Solver(TempSolver):
+            name = "sleeping"
+            sampling_strategy = "callback"
+            def run(self, cb):
+                while cb():
+                    time.sleep(0.05)
+            def get_result(self): return dict(beta=1)
+    """
+    with temp_benchmark(objective=objective, solvers=[solver]) as bench:
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            run(f"{bench.benchmark_dir} -d test-dataset --max-runs 6 "
+                "--async-eval 1 --no-plot --no-cache".split(),
+                standalone_mode=False)
+
+        df = read_results(Path(out.result_files[0]))
+
+    # The CPU time of the evaluations, in the background thread while the
+    # solver sleeps, is not counted for the solver.
+    assert len(df) >= 4
+    assert df['cpu_time'].iloc[-1] < 0.03
+    if sys.platform == 'linux':
+        assert df['cpu_user_time'].notna().all()
+
+
+def test_callback_time_correction(no_debug_log):
+    solver = """from benchopt.utils.temp_benchmark import TempSolver
+
+        class Solver(TempSolver):
+            name = "fast"
+            sampling_strategy = "callback"
+            def run(self, cb):
+                while cb():
+                    pass
+            def get_result(self): return dict(beta=1)
+    """
+    with temp_benchmark(solvers=[solver]) as bench:
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            run(f"{bench.benchmark_dir} -d test-dataset --max-runs 5 "
+                "--no-plot --no-cache".split(), standalone_mode=False)
+
+        df = read_results(Path(out.result_files[0]))
+
+    # The overhead of the calls to the callback, measured when starting, is
+    # subtracted from the time of the points, proportionally to the number of
+    # calls.
+    assert (df['time_correction'] >= 0).all()
+    assert (df['time'] >= 0).all()
+    df = df[df['stop_val'] > 0]
+    overhead_call = df['time_correction'] / df['stop_val']
+    assert overhead_call.iloc[0] > 0
+    assert overhead_call.tolist() == pytest.approx(
+        [overhead_call.iloc[0]] * len(overhead_call)
+    )
+
+
+@pytest.mark.parametrize('strategy', ['iteration', 'callback'])
+@pytest.mark.parametrize('schedule, expected', [
+    (2, [0, 2, 4, 5]), ("'final'", [5])
+])
+def test_expensive_metrics(no_debug_log, strategy, schedule, expected):
+    objective = f"""from benchopt.utils.temp_benchmark import TempObjective
+
+        class Objective(TempObjective):
+            expensive_metrics_schedule = {schedule}
+            def evaluate_result(self, beta): return dict(value=beta)
+            def evaluate_expensive_result(self, beta):
+                return dict(expensive=-beta)
+    """
+    solver = f"""from benchopt.utils.temp_benchmark import TempSolver
+        from benchopt.stopping_criterion import NoCriterion
+
+        class Solver(TempSolver):
+            name = "counter"
+            sampling_strategy = "{strategy}"
+            stopping_criterion = NoCriterion(strategy="{strategy}")
+            def run(self, n_iter):
+                self.beta = 0
+                if self.sampling_strategy == "callback":
+                    while n_iter():
+                        self.beta += 1
+                else:
+                    self.beta = n_iter
+            def get_result(self): return dict(beta=self.beta)
+    """
+    with temp_benchmark(objective=objective, solvers=[solver]) as bench:
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            run(f"{bench.benchmark_dir} -d test-dataset --max-runs 5 "
+                "--no-plot --no-cache".split(), standalone_mode=False)
+
+        df = read_results(Path(out.result_files[0]))
+
+    # The expensive metrics are only computed for the points selected by the
+    # schedule and for the final point, and are NaN for the others.
+    assert len(df) == 6
+    computed = df['objective_expensive'].notna()
+    assert df.index[computed].tolist() == expected
+    assert (
+        df['objective_expensive'][computed] == -df['objective_value'][computed]
+    ).all()
+
+
+def test_fan_out(no_debug_log):
+    from benchopt.utils.thread_limits import get_available_cpus
+
+    objective = """from benchopt.utils.temp_benchmark import TempObjective
+
+        class Objective(TempObjective):
+            def evaluate_result(self, beta): return max(8 - beta, 0)
+    """
+    solver = """from benchopt.utils.temp_benchmark import TempSolver
+        import os
+        import time
+
+        class Solver(TempSolver):
+            name = "independent"
+            sampling_strategy = "iteration"
+            def warm_up(self):
+                print("#WARMUP")
+            def run(self, n_iter):
+                print(f"#THREADS={os.environ.get('OMP_NUM_THREADS')}")
+                time.sleep(0.01)
+                self.beta = n_iter
+            def get_result(self): return dict(beta=self.beta)
+    """
+    curves = {}
+    with temp_benchmark(objective=objective, solvers=[solver]) as bench:
+        for options in ["", "--fan-out 3"]:
+            with CaptureCmdOutput(delete_result_files=False) as out:
+                run(f"{bench.benchmark_dir} -d test-dataset --max-runs 10 "
+                    f"{options} --no-plot --no-cache".split(),
+                    standalone_mode=False)
+
+            df = read_results(Path(out.result_files[0]))
+            curves[options] = df[['stop_val', 'objective_value']]
+
+    # The resolutions run ahead give the same curve, and the ones after the
+    # stopping point, or out of the schedule when it is flat, are dropped.
+    assert curves[""].equals(curves["--fan-out 3"])
+
+    # Each worker is warmed up once, and uses its share of the threads.
+    n_warm_up = out.output.count("#WARMUP")
+    assert 2 <= n_warm_up <= 4
+    assert out.output.count("#THREADS=") > n_warm_up
+    n_threads = max(1, len(get_available_cpus()) // 3)
+    out.check_output(f"#THREADS={n_threads}", repetition=out.output.count(
+        "#THREADS="
+    ))
+
+
+def test_racing(no_debug_log):
+    from benchopt.results.parquet import get_metadata
+
+    objective = """from benchopt.utils.temp_benchmark import TempObjective
+
+        class Objective(TempObjective):
+            def evaluate_result(self, beta): return beta
+    """
+    solver = """from benchopt.utils.temp_benchmark import TempSolver
+        from benchopt.stopping_criterion import NoCriterion
+        import time
+
+        class Solver(TempSolver):
+            name = "racer"
+            parameters = {'rate': [1, 2, 3, 4]}
+            stopping_criterion = NoCriterion()
+            def run(self, _):
+                time.sleep(0.05)
+            def get_result(self): return dict(beta=self.rate)
+    """
+    with temp_benchmark(objective=objective, solvers=[solver]) as bench:
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            run(f"{bench.benchmark_dir} -d test-dataset --racing 0.5 "
+                "--timeout 1 --no-plot --no-cache".split(),
+                standalone_mode=False)
+
+        result_file = Path(out.result_files[0])
+        df = read_results(result_file)
+        dominated_runs = get_metadata(result_file)['dominated_runs']
+
+        # The worst half is dropped after the first round, then the second
+        # worst solver after the second one, and only the best one runs to
+        # the timeout.
+        assert sorted(run[2] for run in dominated_runs) == [
+            f"racer[rate={i}]" for i in [2, 3, 4]
+        ]
+        out.check_output("dominated", repetition=3)
+        n_points = df.groupby('solver_name').size()
+        assert df['solver_name'].nunique() == 4
+        assert n_points["racer[rate=1]"] > n_points["racer[rate=2]"]
+        assert n_points["racer[rate=2]"] > n_points["racer[rate=4]"]
+
+        dominated = df.groupby('solver_name')['run_status'].unique()
+        assert dominated.map(list).to_dict() == {
+            "racer[rate=1]": ["timeout"], **{
+                f"racer[rate={i}]": ["dominated"] for i in [2, 3, 4]
+            }
+        }
+
+        # With --resume, the dropped runs race again and their new results
+        # replace the partial ones. The metadata of the file are kept.
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            run(f"{bench.benchmark_dir} -d test-dataset --racing 0.5 "
+                f"--timeout 1 --no-plot --no-cache --resume {result_file}"
+                .split(), standalone_mode=False)
+
+        assert out.result_files == [str(result_file)]
+        out.check_output("dominated", repetition=2)
+        dominated_runs = get_metadata(result_file)['dominated_runs']
+        assert sorted(run[2] for run in dominated_runs) == [
+            f"racer[rate={i}]" for i in [3, 4]
+        ]
+        df = read_results(result_file)
+        status = df.groupby('solver_name')['run_status'].unique()
+        assert status.map(list).to_dict() == {
+            "racer[rate=1]": ["timeout"], "racer[rate=2]": ["timeout"],
+            "racer[rate=3]": ["dominated"], "racer[rate=4]": ["dominated"],
+        }
@@ -471,3 +471,28 @@ def test_minimize_flag_plateau(criterion_class, strategy, minimize):
         )
 
     assert stop, "Did not stop on plateau"
+
+
+@pytest.mark.parametrize('strategy', ['iteration', 'tolerance'])
+def test_time_schedule(strategy):
+    "Check that the 'time' schedule spaces the points evenly in log-time."
+    max_runs, timeout = 10, 10
+    criterion = SufficientProgressCriterion(strategy=strategy)
+    criterion = criterion.get_runner_instance(
+        max_runs=max_runs, timeout=timeout, schedule='time'
+    )
+
+    # Solver whose iterations get more and more costly.
+    stop_val = criterion.init_stop_val()
+    times = []
+    while not times or times[-1] < timeout:
+        work = 1 / stop_val if strategy == 'tolerance' else stop_val
+        times.append(1e-5 + 1e-4 * work ** 2 if work < 1e30 else 1e-5)
+        criterion.record_time(stop_val, times[-1])
+        stop_val = criterion.get_next_stop_val(stop_val)
+
+    # The timeout is reached with about max_runs points, instead of wasting
+    # them on small steps, and the points are evenly spaced in log-time.
+    assert len(times) <= max_runs + 3
+    log_ratios = np.diff(np.log(times[-5:]))
+    assert np.allclose(log_ratios, log_ratios.mean(), rtol=0.3)
@@ -0,0 +1,91 @@
+import math
+
+# Ratio between the times of two consecutive points of the log grid on which
+# the expensive metrics are computed with the 'log' schedule.
+LOG_GRID_RATIO = 2
+
+
+class ExpensiveMetricsSchedule:
+    """Select the points of a curve where the expensive metrics are computed.
+
+    The expensive metrics of an objective, returned by
+    ``Objective.evaluate_expensive_result``, are only computed on a subsample
+    of the points of each curve, and always at its final point. The decision
+    for a point is taken when its time is known, before evaluating it.
+
+    Parameters
+    ----------
+    schedule : int | 'log' | 'final'
+        With an int ``k``, compute the metrics every ``k`` points, starting
+        with the first one. With ``'log'``, compute them for the first point
+        and then for the first point whose time is at least ``LOG_GRID_RATIO``
+        times the one of the last point where they were computed. With
+        ``'final'``, only compute them for the final point.
+
+    Attributes
+    ----------
+    last_due : bool
+        Whether the metrics were computed for the last point.
+    """
+
+    def __init__(self, schedule):
+        is_int = isinstance(schedule, int) and not isinstance(schedule, bool)
+        if not (is_int and schedule >= 1) and schedule not in ('log', 'final'):
+            raise ValueError(
+                "expensive_metrics_schedule should be a positive int, 'log' "
+                f"or 'final'. Got {schedule!r}."
+            )
+        self.schedule = schedule
+        self.n_points = 0
+        self.next_time = 0.
+        self.last_due = False
+
+    def time_threshold(self, offset=0):
+        """Return the time from which the next point computes the metrics.
+
+        Parameters
+        ----------
+        offset : int
+            Number of points between the next point and the point whose
+            threshold is requested, for the points computed ahead. With
+            ``'log'``, their threshold is the one of the next point, as it
+            depends on the times of the points before them.
+
+        Returns
+        -------
+        threshold : float
+            The metrics are computed for the next point if its time is at
+            least ``threshold``: 0 to always compute them, and ``inf`` to
+            never compute them.
+        """
+        if self.schedule == 'final':
+            return math.inf
+        if self.schedule == 'log':
+            return self.next_time
+        if (self.n_points + offset) % self.schedule == 0:
+            return 0.
+        return math.inf
+
+    def update(self, time, threshold=None):
+        """Record a new point of the curve.
+
+        Parameters
+        ----------
+        time : float
+            The time of the point.
+        threshold : float | None
+            The threshold used to compute the point, if it was computed ahead
+            with ``time_threshold(offset)``. By default, the current one.
+
+        Returns
+        -------
+        is_due : bool
+            Whether the expensive metrics are computed for this point.
+        """
+        if threshold is None:
+            threshold = self.time_threshold()
+        self.last_due = time >= threshold
+        self.n_points += 1
+        if self.last_due and self.schedule == 'log':
+            self.next_time = time * LOG_GRID_RATIO
+        return self.last_due
@@ -0,0 +1,61 @@
+import time
+
+# Columns of the results with the time spent by benchopt around the solver,
+# in seconds, for each point of the curves:
+# - overhead_eval: ``solver.get_result`` and the evaluation of the objective,
+# - overhead_stop: the stopping criterion, including the progress display,
+# - overhead_cache: the lookup and the storage in the cache of the point,
+# - overhead_ipc: the (un)pickling of the run sent to a worker, for the
+#   whole run.
+OVERHEAD_COLUMNS = [
+    'overhead_eval', 'overhead_stop', 'overhead_cache', 'overhead_ipc'
+]
+
+
+class DispatchTimer:
+    """Measure the time to send a run to a local worker process.
+
+    This is the time to pickle the run kwargs in the main process and to
+    unpickle them in the worker. The time spent by the pickled run in the
+    queue of the executor, waiting for a free worker, is not included. The
+    timer should be the first value of the run kwargs and its ``end`` marker
+    the last one, and ``elapsed`` is called when the run starts, once all its
+    kwargs are unpickled.
+    """
+
+    def __init__(self):
+        self.t_loads = None
+        self.dumps_duration = 0.
+
+    def __getstate__(self):
+        return {'t_dumps': time.perf_counter()}
+
+    def __setstate__(self, state):
+        self.t_dumps = state['t_dumps']
+        self.dumps_duration = 0.
+        self.t_loads = time.perf_counter()
+
+    @property
+    def end(self):
+        "Marker recording the end of the pickling of the run kwargs."
+        return _DispatchEnd(self)
+
+    def elapsed(self):
+        "Time to pickle and unpickle the run, or 0 if it was not pickled."
+        if self.t_loads is None:
+            return 0.
+        return self.dumps_duration + time.perf_counter() - self.t_loads
+
+
+class _DispatchEnd:
+    def __init__(self, timer):
+        self.timer = timer
+
+    def __reduce__(self):
+        # The timer is already pickled, so only a reference to it is stored.
+        return _set_dumps_duration, (self.timer, time.perf_counter())
+
+
+def _set_dumps_duration(timer, t_end):
+    # Both times are taken in the main process, so they can be compared.
+    timer.dumps_duration = max(t_end - timer.t_dumps, 0.)
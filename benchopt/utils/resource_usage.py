@@ -0,0 +1,177 @@
+import time
+import threading
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+# Columns added to the results to describe the resources used by the solver
+# to reach each point, in addition to the wall-clock time.
+RESOURCE_COLUMNS = [
+    'cpu_time', 'cpu_user_time', 'cpu_system_time',
+    'ctx_switches_voluntary', 'ctx_switches_involuntary',
+    'page_faults_major', 'page_faults_minor',
+]
+
+
+def get_resource_usage(thread=False):
+    """Return the resources used by the current process since its start.
+
+    The CPU time is given by ``time.process_time`` and sums all the threads of
+    the process. The user and system CPU times, the context switches and the
+    page faults are given by ``resource.getrusage`` and are only available on
+    Unix.
+
+    Parameters
+    ----------
+    thread : bool
+        If True, only return the resources used by the current thread, with
+        ``time.thread_time`` and ``RUSAGE_THREAD``. The counters of
+        ``resource.getrusage`` are then only available on Linux.
+
+    Returns
+    -------
+    usage : dict
+        Mapping from the names in ``RESOURCE_COLUMNS`` to the counters.
+    """
+    if thread:
+        usage = dict(cpu_time=time.thread_time())
+        who = getattr(resource, 'RUSAGE_THREAD', None)
+    else:
+        usage = dict(cpu_time=time.process_time())
+        who = getattr(resource, 'RUSAGE_SELF', None)
+    if who is not None:
+        rusage = resource.getrusage(who)
+        usage.update(
+            cpu_user_time=rusage.ru_utime,
+            cpu_system_time=rusage.ru_stime,
+            ctx_switches_voluntary=rusage.ru_nvcsw,
+            ctx_switches_involuntary=rusage.ru_nivcsw,
+            page_faults_major=rusage.ru_majflt,
+            page_faults_minor=rusage.ru_minflt,
+        )
+    return usage
+
+
+def diff_resource_usage(start, stop):
+    "Return the resources used between two calls to ``get_resource_usage``."
+    return {k: stop[k] - start[k] for k in start}
+
+
+# Column storing the peak memory of the solver for each mode of the memory
+# sampler, in bytes.
+MEMORY_COLUMNS = {
+    'rss': 'memory_peak_rss',
+    'tracemalloc': 'memory_peak_alloc',
+}
+
+
+class MemorySampler:
+    """Measure the peak memory used by the current process.
+
+    With the ``'rss'`` mode, a background thread samples the resident memory
+    of the process with ``psutil``, which accounts for the native libraries
+    but can miss short peaks between two samples. With the ``'tracemalloc'``
+    mode, the memory allocated by Python is traced, which is exact but misses
+    the memory allocated outside of the Python allocator and slows down the
+    allocations.
+
+    Parameters
+    ----------
+    mode : 'rss' | 'tracemalloc'
+        How to measure the memory.
+    interval : float | None
+        Time between two samples of the resident memory, in seconds. If None,
+        use the ``memory_sampling_interval`` setting. The sampling thread
+        competes with the solver for the GIL, so short intervals slow it down.
+
+    Attributes
+    ----------
+    peak : int
+        Peak memory above the baseline, in bytes, set when stopping.
+    """
+
+    def __init__(self, mode, interval=None):
+        if mode not in MEMORY_COLUMNS:
+            raise ValueError(
+                f"mode should be one of {list(MEMORY_COLUMNS)}. Got {mode}."
+            )
+        if interval is None:
+            from ..config import get_setting
+
+            interval = get_setting('memory_sampling_interval') / 1000
+        self.mode = mode
+        self.interval = interval
+        self.column = MEMORY_COLUMNS[mode]
+        self._thread = None
+
+    def start(self):
+        "Start the measure, with the current memory as baseline."
+        if self.mode == 'tracemalloc':
+            import tracemalloc
+
+            self._stop_tracing = not tracemalloc.is_tracing()
+            if self._stop_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self.baseline = tracemalloc.get_traced_memory()[0]
+            return
+
+        import psutil
+
+        self._process = psutil.Process()
+        self.baseline = self._peak = self._process.memory_info().rss
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def _sample(self):
+        while not self._stop_event.wait(self.interval):
+            self._peak = max(self._peak, self._process.memory_info().rss)
+
+    def get_peak(self):
+        """Return the peak memory since the start or the last reset.
+
+        Returns
+        -------
+        peak : int
+            Peak memory above the baseline, in bytes.
+        """
+        if self.mode == 'tracemalloc':
+            import tracemalloc
+
+            peak = tracemalloc.get_traced_memory()[1]
+        else:
+            self._peak = max(self._peak, self._process.memory_info().rss)
+            peak = self._peak
+        return max(peak - self.baseline, 0)
+
+    def reset_peak(self):
+        "Set the peak to the current memory, e.g. after an evaluation."
+        if self.mode == 'tracemalloc':
+            import tracemalloc
+
+            tracemalloc.reset_peak()
+        else:
+            self._peak = self._process.memory_info().rss
+
+    def stop(self):
+        "Stop the measure and store the peak memory in ``peak``."
+        self.peak = self.get_peak()
+        if self.mode == 'tracemalloc':
+            import tracemalloc
+
+            if self._stop_tracing:
+                tracemalloc.stop()
+        elif self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
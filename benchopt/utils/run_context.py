@@ -26,15 +26,21 @@ class RunContext:
     ``__getstate__``; the cache is keyed on ``meta`` instead.
 
     Config fields (set once in ``_run_benchmark``):
-        run_output_base, pdb
+        run_output_base, pdb, n_threads, cpu_pinning
 
     Per-run fields (filled via ``dataclasses.replace`` in
     ``get_solver_kwargs`` for each dataset × objective × solver × rep):
-        base_seed, objective_name, dataset_name, solver_name, repetition
+        base_seed, objective_name, dataset_name, solver_name, repetition,
+        shared_data, deadline, time_share
     """
     # Config fields — set once per benchmark invocation
     run_output_base: Path | None = None
     pdb: bool = False
+    # Default limit on the threads of the native libraries in each run, to
+    # avoid over-subscription with local parallel workers.
+    n_threads: int | None = None
+    # With --pin-cpus, WorkerPinning binding each worker to its core set.
+    cpu_pinning: object = None
     # Per-run fields — cloned/updated for each (dataset, obj, solver, rep).
     # A field left as None means the corresponding component is not available
     # in this context (e.g. objective/solver/repetition during prepare) and
@@ -44,6 +50,13 @@ class RunContext:
     dataset_name: str | None = None
     solver_name: str | None = None
     repetition: int | None = None
+    # Handle to the dataset's data shared by the main process with the local
+    # workers, to avoid calling get_data in each worker.
+    shared_data: object = None
+    # With --time-budget, wall-clock time (as given by time.time) of the end
+    # of the benchmark, and duration allotted to the run when it is submitted.
+    deadline: float | None = None
+    time_share: float | None = None
 
     def get_seed(self, class_name, use_objective=False, use_dataset=False,
                  use_solver=False, use_repetition=False):
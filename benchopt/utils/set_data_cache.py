@@ -0,0 +1,193 @@
+import sys
+from collections import OrderedDict
+
+import numpy as np
+
+from ..config import get_setting
+
+# Attributes of the objective that are specific to one run, and should not be
+# reused from the cache.
+RUN_ATTRIBUTES = (
+    '_run_context', '_repetition', '_dataset', '_dataset_pending'
+)
+# State of the dataset after get_data, reused with the objective's state.
+DATASET_ATTRIBUTES = ('_data', '_used_seed', '_seed_params')
+
+
+def get_nbytes(values):
+    """Estimate the memory used by a collection of values, in bytes.
+
+    Memory mapped arrays are not counted as their memory is backed by a file,
+    possibly shared with other processes, and values appearing several times
+    are only counted once.
+    """
+    nbytes, seen = 0, set()
+    for value in values:
+        if isinstance(value, np.memmap) or id(value) in seen:
+            continue
+        seen.add(id(value))
+        value_nbytes = getattr(value, 'nbytes', None)
+        if isinstance(value_nbytes, int):
+            nbytes += value_nbytes
+        else:
+            nbytes += sys.getsizeof(value)
+    return nbytes
+
+
+def _copy_containers(value):
+    """Copy the lists, tuples, dicts and sets in a value, recursively.
+
+    The other values, such as numpy arrays, are shared with the cached state
+    to avoid copying the data.
+    """
+    if isinstance(value, list):
+        return [_copy_containers(v) for v in value]
+    if type(value) is tuple:
+        return tuple(_copy_containers(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _copy_containers(v) for k, v in value.items()}
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+def _get_component_key(component):
+    return (str(component._module_filename), component._file_hash,
+            str(component))
+
+
+def _get_key(objective):
+    return (
+        _get_component_key(objective),
+        _get_component_key(objective._dataset)
+    )
+
+
+def _check_seed(component, state):
+    "Check that the seed of a component matches the one used in the state."
+    if state['_used_seed'] is None:
+        return True
+    return state['_used_seed'] == component._run_context.get_seed(
+        class_name=component._base_class_name, **state['_seed_params']
+    )
+
+
+class SetDataCache:
+    """LRU cache of the state of the objectives after ``set_data``.
+
+    Each run uses a copy of the objective, whose ``Objective.set_data`` would
+    be called again, even when the process has just set the same objective
+    and dataset for another solver or repetition. This cache keeps the state
+    of the last objectives in memory to reuse it, within the memory budget
+    given by the ``set_data_cache_size`` setting. The states are only reused
+    when the seeds of the current run context match the ones used to compute
+    them.
+
+    The containers of the restored states, such as lists and dicts, are
+    copied so that each run can update them. Other values, such as numpy
+    arrays, are shared between the runs restoring the same state, and should
+    not be modified in place.
+    """
+
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.nbytes = 0
+
+    def restore(self, objective):
+        """Restore the state of the objective after set_data if available.
+
+        Parameters
+        ----------
+        objective : BaseObjective
+            An objective whose dataset is set but not loaded yet, with its
+            run context attached.
+
+        Returns
+        -------
+        restored : bool
+            True if the state of the objective was found in the cache.
+        """
+        key = _get_key(objective)
+        dataset = objective._dataset
+        for entry_key, (state, dataset_state, _) in self.entries.items():
+            if entry_key[0] == key and _check_seed(objective, state) and (
+                _check_seed(dataset, dataset_state)
+            ):
+                break
+        else:
+            return False
+
+        self.entries.move_to_end(entry_key)
+        objective.__dict__.update(_copy_containers(state))
+        dataset.__dict__.update(dataset_state)
+        dataset._seed_params = dict(dataset_state['_seed_params'])
+        objective._dataset_pending = False
+        return True
+
+    def store(self, objective):
+        """Store the state of an objective after set_data.
+
+        Parameters
+        ----------
+        objective : BaseObjective
+            An objective whose dataset has just been set.
+        """
+        budget = get_setting('set_data_cache_size') * 1024 ** 2
+        # The state depends on the seeds used in get_data and set_data, so
+        # keep one entry per seed, e.g. for each repetition.
+        key = (
+            _get_key(objective),
+            getattr(objective, '_used_seed', None),
+            getattr(objective._dataset, '_used_seed', None),
+        )
+        self.pop(key)
+        if budget <= 0:
+            return
+
+        state = {
+            k: v for k, v in objective.__dict__.items()
+            if k not in RUN_ATTRIBUTES
+        }
+        dataset_state = {
+            k: getattr(objective._dataset, k, None)
+            for k in DATASET_ATTRIBUTES
+        }
+        # The seed parameters are updated in place by get_seed.
+        for s in (state, dataset_state):
+            s['_seed_params'] = dict(s['_seed_params'])
+        nbytes = get_nbytes(
+            [*state.values(), *(dataset_state['_data'] or {}).values()]
+        )
+        if nbytes > budget:
+            return
+
+        while self.nbytes + nbytes > budget:
+            self.pop(next(iter(self.entries)))
+        self.entries[key] = (state, dataset_state, nbytes)
+        self.nbytes += nbytes
+
+    def pop(self, key):
+        "Remove an entry from the cache."
+        if key in self.entries:
+            *_, nbytes = self.entries.pop(key)
+            self.nbytes -= nbytes
+
+    def clear(self, dataset=None):
+        """Remove the entries from the cache.
+
+        Parameters
+        ----------
+        dataset : BaseDataset | None
+            If not None, only remove the entries computed with this dataset.
+        """
+        if dataset is None:
+            self.entries.clear()
+            self.nbytes = 0
+            return
+        dataset_key = _get_component_key(dataset)
+        for key in [k for k in self.entries if k[0][1] == dataset_key]:
+            self.pop(key)
+
+
+# Cache of the current process.
+SET_DATA_CACHE = SetDataCache()
@@ -10,6 +10,9 @@ from pathlib import Path
 
 from ..config import DEBUG
 from .shell_cmd import _run_shell
+from .thread_limits import format_cpu_list
+from .thread_limits import get_threads_info
+from .thread_limits import get_available_cpus
 
 
 def _get_processor_name():
@@ -96,8 +99,13 @@ def _get_git_tag():
     return tag
 
 
-def get_sys_info():
-    "Return a dictionary with info from the current system."
+# Cache for the system info, computed once per process. It is keyed on the
+# working directory, as the benchmark git tag depends on it.
+_SYS_INFO_CACHE = {}
+
+
+def _get_static_sys_info():
+    "Return the info from the current system that do not change in a process."
 
     # Import are nested to avoid long import time when func is not called
     import scipy
@@ -107,9 +115,6 @@ def get_sys_info():
 
     info = {}
 
-    # Info on the env
-    info["env-OMP_NUM_THREADS"] = os.environ.get('OMP_NUM_THREADS')
-
     # Info on the OS
     info["platform"] = platform.system()
     info["platform-architecture"] = platform.machine()
@@ -133,3 +138,29 @@ def get_sys_info():
     info["benchmark-git-tag"] = _get_git_tag()
 
     return info
+
+
+def get_sys_info():
+    """Return a dictionary with info from the current system.
+
+    The info on the platform, the hardware and the libraries is computed once
+    per process and working directory, as it requires to spawn subprocesses.
+    The info on the environment, including the number of threads used by the
+    BLAS and OpenMP libraries and the CPUs the process can run on, is read at
+    each call.
+    """
+    cwd = os.getcwd()
+    if cwd not in _SYS_INFO_CACHE:
+        _SYS_INFO_CACHE[cwd] = _get_static_sys_info()
+
+    info = {}
+
+    # Info on the env
+    info["env-OMP_NUM_THREADS"] = os.environ.get('OMP_NUM_THREADS')
+    threads_info = get_threads_info()
+    info["env-blas-threads"] = threads_info['blas']
+    info["env-openmp-threads"] = threads_info['openmp']
+    info["env-cpus"] = format_cpu_list(get_available_cpus())
+
+    info.update(_SYS_INFO_CACHE[cwd])
+    return info
@@ -24,6 +24,8 @@ STATUS = {
     'interrupted': ("interrupted", YELLOW),
     'not run yet': ('not run yet', YELLOW),
     'skip': ('skip', YELLOW),
+    'budget': ('not run (time budget)', YELLOW),
+    'dominated': ('dominated', YELLOW),
     'timeout': ("done (timeout)", YELLOW),
     'max_runs': ("done (not enough run)", YELLOW),
     'done': ("done", GREEN),
@@ -67,6 +69,13 @@ def print_normalize(msg, endline=True, verbose=True):
         print(msg + '\r', end='', flush=True)
 
 
+def print_debug(msg, solver):
+    """Print a debug message for a solver, if debug logs are enabled."""
+    if DEBUG:
+        solver_tag = colorify(f"    |--{solver}:")
+        print_normalize(f"{solver_tag} [DEBUG] - {msg}")
+
+
 class TerminalOutput:
     def __init__(self, n_repetitions=None, show_progress=None):
         # enable ANSI colors in Windows
@@ -179,5 +188,4 @@ class TerminalOutput:
             print(f'{indent}Reason: {reason}')
 
     def debug(self, msg):
-        if DEBUG:
-            print_normalize(f"{self.solver_tag} [DEBUG] - {msg}")
+        print_debug(msg, self.solver)
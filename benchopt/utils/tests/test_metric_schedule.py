@@ -0,0 +1,32 @@
+import pytest
+
+from benchopt.utils.metric_schedule import ExpensiveMetricsSchedule
+
+
+@pytest.mark.parametrize('schedule, expected', [
+    (1, [True] * 6),
+    (3, [True, False, False, True, False, False]),
+    ('log', [True, True, False, True, False, True]),
+    ('final', [False] * 6),
+])
+def test_expensive_metrics_schedule(schedule, expected):
+    metrics_schedule = ExpensiveMetricsSchedule(schedule)
+    times = [0.1, 0.2, 0.3, 0.4, 0.7, 0.8]
+    assert [metrics_schedule.update(t) for t in times] == expected
+    assert metrics_schedule.last_due == expected[-1]
+
+
+@pytest.mark.parametrize('schedule', [0, True, 'linear', 1.5])
+def test_expensive_metrics_schedule_invalid(schedule):
+    with pytest.raises(ValueError, match="expensive_metrics_schedule"):
+        ExpensiveMetricsSchedule(schedule)
+
+
+def test_expensive_metrics_schedule_ahead():
+    # The thresholds of the points computed ahead are used to record them.
+    metrics_schedule = ExpensiveMetricsSchedule(2)
+    thresholds = [metrics_schedule.time_threshold(i) for i in range(3)]
+    assert thresholds == [0., float('inf'), 0.]
+    assert [
+        metrics_schedule.update(1., threshold) for threshold in thresholds
+    ] == [True, False, True]
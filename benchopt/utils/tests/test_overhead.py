@@ -0,0 +1,37 @@
+import time
+
+from benchopt.utils.overhead import DispatchTimer
+
+
+def _start_run(dispatch_timer, duration, dispatch_end):
+    t_start = time.time()
+    elapsed = dispatch_timer.elapsed()
+    time.sleep(duration)
+    return t_start, elapsed
+
+
+def test_dispatch_timer():
+    from joblib.externals.loky import ProcessPoolExecutor
+
+    # The timer is only set when the run is sent to a worker.
+    assert DispatchTimer().elapsed() == 0
+
+    # With one worker, the second run is pickled when it is submitted, but
+    # waits for the end of the first one before it starts. This wait is not
+    # counted in the time to send it.
+    executor = ProcessPoolExecutor(max_workers=1)
+    try:
+        timers = [DispatchTimer() for _ in range(2)]
+        t_submit = time.time()
+        futures = [
+            executor.submit(_start_run, timer, 0.5, timer.end)
+            for timer in timers
+        ]
+        results = [future.result() for future in futures]
+    finally:
+        executor.shutdown(wait=True)
+
+    (_, elapsed_first), (t_start, elapsed) = results
+    assert t_start - t_submit >= 0.5
+    assert 0 < elapsed < 0.1
+    assert 0 < elapsed_first < 0.1
@@ -0,0 +1,61 @@
+import time
+
+import pytest
+import numpy as np
+
+from benchopt.cli.main import run
+from benchopt.results import read_results
+from benchopt.tests.utils import CaptureCmdOutput
+from benchopt.utils.temp_benchmark import temp_benchmark
+from benchopt.utils.resource_usage import MemorySampler
+
+
+@pytest.mark.parametrize('mode', ['rss', 'tracemalloc'])
+def test_memory_sampler(mode):
+    size = 50 * 1024 ** 2
+
+    with MemorySampler(mode) as sampler:
+        x = np.ones(size, dtype=np.uint8)
+        time.sleep(0.01)
+        assert sampler.get_peak() >= 0.9 * size
+        del x
+        sampler.reset_peak()
+        assert sampler.get_peak() < 0.5 * size
+
+    assert sampler.peak < 0.5 * size
+
+
+def test_memory_sampler_interval(monkeypatch):
+    assert MemorySampler('rss').interval == 0.02
+    monkeypatch.setenv('BENCHOPT_MEMORY_SAMPLING_INTERVAL', '5')
+    assert MemorySampler('rss').interval == 0.005
+    assert MemorySampler('rss', interval=0.1).interval == 0.1
+
+
+@pytest.mark.parametrize('strategy', ['iteration', 'callback'])
+def test_memory_columns(no_debug_log, strategy):
+    solver = f"""from benchopt.utils.temp_benchmark import TempSolver
+        import numpy as np
+
+        class Solver(TempSolver):
+            name = "allocating"
+            sampling_strategy = "{strategy}"
+            def run(self, n_iter):
+                if self.sampling_strategy == "callback":
+                    while n_iter():
+                        x = np.ones(10 * 1024 ** 2, dtype=np.uint8)
+                else:
+                    x = np.ones(10 * 1024 ** 2, dtype=np.uint8)  # noqa
+            def get_result(self): return dict(beta=1)
+    """
+    with temp_benchmark(solvers=[solver]) as bench:
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            run(f"{bench.benchmark_dir} -d test-dataset --max-runs 3 "
+                "--memory tracemalloc --no-plot --no-cache".split(),
+                standalone_mode=False)
+
+        df = read_results(out.result_files[0])
+
+    # The first point of the callback is logged before the first allocation.
+    assert df['memory_peak_alloc'].iloc[-1] >= 10 * 1024 ** 2
+    assert 'memory_peak_rss' not in df
@@ -0,0 +1,146 @@
+import os
+from pathlib import Path
+
+import numpy as np
+
+from benchopt.cli.main import run
+from benchopt.utils import set_data_cache
+from benchopt.utils.run_context import RunContext
+from benchopt.utils.set_data_cache import SetDataCache
+from benchopt.utils.temp_benchmark import temp_benchmark
+from benchopt.utils.temp_benchmark import TempDataset, TempObjective
+
+from benchopt.tests.utils import CaptureCmdOutput
+
+
+class Objective(TempObjective):
+    name = "cached-objective"
+    _module_filename = Path(__file__)
+    _file_hash = "objective-hash"
+
+    def set_data(self, X, y):
+        self.n_calls = getattr(self, 'n_calls', 0) + 1
+        self.X = X
+        self.history = [dict(X=X)]
+
+
+class Dataset(TempDataset):
+    name = "cached-dataset"
+    _module_filename = Path(__file__)
+    _file_hash = "dataset-hash"
+    parameters = {'size': [10]}
+
+    def get_data(self):
+        return dict(X=np.ones(self.size), y=None)
+
+
+def get_objective(size=10, repetition=0):
+    # Mimic an objective received by a worker: its dataset is set but the
+    # data is not loaded yet.
+    objective = Objective.get_instance()
+    dataset = Dataset.get_instance(size=size)
+    RunContext(repetition=repetition).attach(objective, dataset, None)
+    objective._dataset = dataset
+    objective._repetition = repetition
+    objective._dataset_pending = True
+    return objective
+
+
+def test_set_data_cache(monkeypatch):
+    monkeypatch.setattr(set_data_cache, 'get_setting', lambda name: 1)
+    cache = SetDataCache()
+
+    objective = get_objective()
+    assert not cache.restore(objective)
+    objective._set_dataset(objective._dataset)
+    cache.store(objective)
+    assert cache.nbytes > 0
+
+    # The state of the objective is restored without calling set_data
+    objective = get_objective(repetition=1)
+    assert cache.restore(objective)
+    assert objective.n_calls == 1
+    assert objective.X.shape == (10,)
+    assert not objective._dataset_pending
+    assert objective._repetition == 1
+
+    # Different datasets are cached separately
+    assert not cache.restore(get_objective(size=20))
+
+
+def test_set_data_cache_copy(monkeypatch):
+    monkeypatch.setattr(set_data_cache, 'get_setting', lambda name: 1)
+    cache = SetDataCache()
+
+    objective = get_objective()
+    objective._set_dataset(objective._dataset)
+    cache.store(objective)
+
+    # The containers are copied for each run, but the arrays are shared
+    objective = get_objective()
+    assert cache.restore(objective)
+    objective.history[0]['y'] = 1
+    objective.history.append(None)
+    objective._seed_params['use_repetition'] = True
+
+    objective = get_objective()
+    assert cache.restore(objective)
+    assert objective.history == [dict(X=objective.X)]
+    assert not objective._seed_params['use_repetition']
+    state, *_ = next(iter(cache.entries.values()))
+    assert objective.X is state['X']
+    assert objective.history[0]['X'] is state['X']
+
+
+def test_set_data_cache_budget(monkeypatch):
+    # The budget is in MB, so each entry takes ~0.4MB
+    monkeypatch.setattr(set_data_cache, 'get_setting', lambda name: 1)
+    cache = SetDataCache()
+    for size in [50_000, 60_000, 70_000]:
+        objective = get_objective(size=size)
+        objective._set_dataset(objective._dataset)
+        cache.store(objective)
+    assert cache.nbytes <= 1024 ** 2
+
+    # The least recently used entries are evicted first
+    assert not cache.restore(get_objective(size=50_000))
+    assert cache.restore(get_objective(size=70_000))
+
+    # Entries larger than the budget are not stored
+    objective = get_objective(size=200_000)
+    objective._set_dataset(objective._dataset)
+    cache.store(objective)
+    assert not cache.restore(get_objective(size=200_000))
+
+    monkeypatch.setattr(set_data_cache, 'get_setting', lambda name: 0)
+    cache.store(get_objective(size=70_000))
+    assert len(cache.entries) == 1
+
+
+def test_set_data_cache_run(no_debug_log):
+    objective = """from benchopt.utils.temp_benchmark import TempObjective
+
+        class Objective(TempObjective):
+            def set_data(self, X, y):
+                import os
+                print(f"#SET_DATA={os.getpid()}")
+    """
+    solver = """from benchopt.utils.temp_benchmark import TempSolver
+
+        class Solver(TempSolver):
+            name = "test-solver"
+            parameters = {'p': [1, 2, 3]}
+    """
+
+    with temp_benchmark(objective=objective, solvers=solver) as bench:
+        with CaptureCmdOutput() as out:
+            run(f"{bench.benchmark_dir} -d test-dataset -r 2 -j 2 -n 1 "
+                "--no-plot --no-cache".split(), standalone_mode=False)
+
+    # set_data is called once in the main process to check if the objective
+    # should be skipped, and at most once per worker for the 6 runs, as the
+    # dataset and objective are the same.
+    n_calls = out.output.count("#SET_DATA=")
+    n_main_calls = out.output.count(f"#SET_DATA={os.getpid()}")
+    assert n_main_calls == 1
+    assert n_calls - n_main_calls <= 2
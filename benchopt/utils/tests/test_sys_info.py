@@ -0,0 +1,35 @@
+from benchopt.utils import sys_info
+from benchopt.utils.sys_info import get_sys_info
+
+
+def test_get_sys_info_cached(monkeypatch, tmp_path):
+    n_calls = []
+
+    def get_static_sys_info():
+        n_calls.append(1)
+        return {"benchmark-git-tag": "v0.1"}
+
+    monkeypatch.setattr(sys_info, "_SYS_INFO_CACHE", {})
+    monkeypatch.setattr(
+        sys_info, "_get_static_sys_info", get_static_sys_info
+    )
+
+    # The info is only computed once per process
+    info = get_sys_info()
+    assert get_sys_info() == info
+    assert len(n_calls) == 1
+
+    # The returned dict can be modified without altering the cache
+    info["benchmark-git-tag"] = "v0.2"
+    assert get_sys_info()["benchmark-git-tag"] == "v0.1"
+
+    # The env variables are read for each call
+    monkeypatch.setenv("OMP_NUM_THREADS", "3")
+    assert get_sys_info()["env-OMP_NUM_THREADS"] == "3"
+    assert len(n_calls) == 1
+
+    # The info is recomputed when changing the working directory, as it
+    # changes the benchmark git tag
+    monkeypatch.chdir(tmp_path)
+    get_sys_info()
+    assert len(n_calls) == 2
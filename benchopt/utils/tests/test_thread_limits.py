@@ -0,0 +1,130 @@
+import os
+
+import pytest
+import numpy as np  # noqa: F401, make sure a BLAS library is loaded
+
+from benchopt.cli.main import run
+from benchopt.results import read_results
+from benchopt.tests.utils import CaptureCmdOutput
+from benchopt.utils.temp_benchmark import temp_benchmark
+from benchopt.utils import thread_limits
+from benchopt.utils.thread_limits import pin_cpus
+from benchopt.utils.thread_limits import limit_threads
+from benchopt.utils.thread_limits import WorkerPinning
+from benchopt.utils.thread_limits import get_cpu_sets
+from benchopt.utils.thread_limits import parse_cpu_list
+from benchopt.utils.thread_limits import format_cpu_list
+from benchopt.utils.thread_limits import get_threads_info
+from benchopt.utils.thread_limits import get_n_threads_per_worker
+
+
+def test_get_n_threads_per_worker(monkeypatch):
+    monkeypatch.setattr("joblib.cpu_count", lambda: 8)
+    assert get_n_threads_per_worker(2) == 4
+    assert get_n_threads_per_worker(3) == 2
+    assert get_n_threads_per_worker(16) == 1
+
+
+def test_limit_threads(monkeypatch):
+    monkeypatch.delenv("OMP_NUM_THREADS", raising=False)
+    monkeypatch.setenv("MKL_NUM_THREADS", "3")
+    threads_info = get_threads_info()
+
+    with limit_threads(1):
+        assert os.environ["OMP_NUM_THREADS"] == "1"
+        assert os.environ["MKL_NUM_THREADS"] == "1"
+        assert get_threads_info()['blas'] == 1
+
+    # The limits and the environment are restored
+    assert get_threads_info() == threads_info
+    assert "OMP_NUM_THREADS" not in os.environ
+    assert os.environ["MKL_NUM_THREADS"] == "3"
+
+    with limit_threads(None):
+        assert get_threads_info() == threads_info
+
+
+def test_solver_n_threads(no_debug_log):
+    solver = """from benchopt.utils.temp_benchmark import TempSolver
+        import os
+
+        class Solver(TempSolver):
+            name = "test-solver"
+            sampling_strategy = "run_once"
+            n_threads = 1
+            def run(self, _):
+                print(f"#OMP_NUM_THREADS={os.environ['OMP_NUM_THREADS']}")
+    """
+    with temp_benchmark(solvers=[solver]) as bench:
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            run(f"{bench.benchmark_dir} -d test-dataset -j 2 "
+                "--no-plot --no-cache".split(), standalone_mode=False)
+
+        df = read_results(out.result_files[0])
+
+    # The solver's n_threads overrides the share of the CPUs of the workers,
+    # and the number of threads is recorded in the results.
+    out.check_output("#OMP_NUM_THREADS=1", repetition=1)
+    assert (df['env-blas-threads'] == 1).all()
+
+
+@pytest.mark.parametrize("cpu_list, cpus", [
+    ("0", [0]), ("0-3", [0, 1, 2, 3]), ("0-1,4,6-7\n", [0, 1, 4, 6, 7])
+])
+def test_cpu_list(cpu_list, cpus):
+    assert parse_cpu_list(cpu_list) == cpus
+    assert format_cpu_list(cpus) == cpu_list.strip()
+
+
+def test_get_cpu_sets(monkeypatch):
+    monkeypatch.setattr(
+        thread_limits, "get_available_cpus", lambda: list(range(8))
+    )
+    monkeypatch.setattr(thread_limits, "get_numa_nodes", lambda: [])
+    assert get_cpu_sets(2) == [[0, 1, 2, 3], [4, 5, 6, 7]]
+    assert get_cpu_sets(3) == [[0, 1], [2, 3], [4, 5]]
+
+    # The sets do not span several NUMA nodes
+    monkeypatch.setattr(
+        thread_limits, "get_numa_nodes", lambda: [[0, 2, 4, 6], [1, 3, 5, 7]]
+    )
+    assert get_cpu_sets(2) == [[0, 2, 4, 6], [1, 3, 5, 7]]
+
+    # With more sets than CPUs, the CPUs are shared
+    assert get_cpu_sets(10)[8:] == [[0], [2]]
+
+
+@pytest.mark.skipif(
+    not hasattr(os, 'sched_setaffinity'), reason="Only supported on Linux"
+)
+def test_worker_pinning(monkeypatch):
+    monkeypatch.setattr(thread_limits, "_PINNING_LOCKS", {})
+    available = os.sched_getaffinity(0)
+    pinning = WorkerPinning(2)
+    try:
+        # The worker keeps its core set, but is only pinned during the runs.
+        cpus = pinning.claim()
+        assert pinning.claim() == cpus
+        assert os.sched_getaffinity(0) == available
+        with pin_cpus(cpus):
+            assert os.sched_getaffinity(0) == set(cpus)
+        assert os.sched_getaffinity(0) == available
+    finally:
+        pinning.close()
+
+
+@pytest.mark.skipif(
+    not hasattr(os, 'sched_setaffinity'), reason="Only supported on Linux"
+)
+def test_pin_cpus_run(no_debug_log):
+    with temp_benchmark() as bench:
+        with CaptureCmdOutput(delete_result_files=False) as out:
+            run(f"{bench.benchmark_dir} -d test-dataset -j 2 -r 2 --pin-cpus "
+                "--no-plot --no-cache".split(), standalone_mode=False)
+
+        df = read_results(out.result_files[0])
+
+    # The core set of each run is recorded in the results
+    cpus = set(thread_limits.get_available_cpus())
+    for cpu_list in df['env-cpus'].unique():
+        assert set(parse_cpu_list(cpu_list)) <= cpus
@@ -0,0 +1,230 @@
+import os
+import shutil
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Environment variables read by the native libraries to set their number of
+# threads. They are also inherited by the processes spawned by the solvers.
+THREADS_ENV_VARS = [
+    'OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+    'BLIS_NUM_THREADS', 'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS',
+]
+
+
+def get_n_threads_per_worker(n_jobs):
+    """Number of threads for each worker to avoid over-subscription.
+
+    Parameters
+    ----------
+    n_jobs : int | None
+        Number of workers running at the same time on this machine.
+
+    Returns
+    -------
+    n_threads : int
+        The number of CPUs divided by the number of workers, at least 1.
+    """
+    from joblib import cpu_count, effective_n_jobs
+
+    return max(1, cpu_count() // effective_n_jobs(n_jobs))
+
+
+@contextlib.contextmanager
+def limit_threads(n_threads):
+    """Limit the number of threads of the native libraries.
+
+    The limit is set with ``threadpoolctl`` for the libraries already loaded,
+    and with the environment variables for the ones loaded afterwards. Both
+    are restored when exiting the context.
+
+    Parameters
+    ----------
+    n_threads : int | None
+        Maximal number of threads. If None, do not change the limits.
+    """
+    if n_threads is None:
+        yield
+        return
+
+    from threadpoolctl import threadpool_limits
+
+    old_env = {k: os.environ.get(k) for k in THREADS_ENV_VARS}
+    os.environ.update({k: str(n_threads) for k in THREADS_ENV_VARS})
+    try:
+        with threadpool_limits(limits=n_threads):
+            yield
+    finally:
+        for k, v in old_env.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+def get_threads_info():
+    """Return the number of threads used by the loaded native libraries.
+
+    Returns
+    -------
+    threads_info : dict
+        Mapping from the API of the libraries, ``'blas'`` and ``'openmp'``,
+        to their largest number of threads, or None if no such library is
+        loaded.
+    """
+    from threadpoolctl import threadpool_info
+
+    threads_info = {'blas': None, 'openmp': None}
+    for lib in threadpool_info():
+        api = lib['user_api']
+        if api in threads_info:
+            threads_info[api] = max(
+                threads_info[api] or 0, lib['num_threads']
+            )
+    return threads_info
+
+
+@contextlib.contextmanager
+def pin_cpus(cpus):
+    """Restrict the current process to run on the given cores.
+
+    The affinity is restored when exiting the context. This is a no-op on the
+    platforms that do not support setting the CPU affinity, e.g. macOS.
+
+    Parameters
+    ----------
+    cpus : list of int | None
+        Ids of the cores to run on. If None, do not change the affinity.
+    """
+    if cpus is None or not hasattr(os, 'sched_setaffinity'):
+        yield
+        return
+
+    old_cpus = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, cpus)
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, old_cpus)
+
+
+def get_available_cpus():
+    """Return the ids of the CPUs the current process can run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def parse_cpu_list(cpu_list):
+    "Parse a list of CPUs with the syntax of the kernel, e.g. '0-3,8'."
+    cpus = []
+    for part in cpu_list.strip().split(','):
+        if part == '':
+            continue
+        start, _, end = part.partition('-')
+        cpus.extend(range(int(start), int(end or start) + 1))
+    return cpus
+
+
+def format_cpu_list(cpus):
+    "Format a list of CPUs with the syntax of the kernel, e.g. '0-3,8'."
+    parts, cpus = [], sorted(cpus)
+    for i, cpu in enumerate(cpus):
+        if i > 0 and cpu == cpus[i - 1] + 1:
+            parts[-1][1] = cpu
+        else:
+            parts.append([cpu, cpu])
+    return ','.join(
+        str(start) if start == end else f"{start}-{end}"
+        for start, end in parts
+    )
+
+
+def get_numa_nodes():
+    """Return the CPUs of each NUMA node, or an empty list if unknown."""
+    nodes = sorted(
+        Path('/sys/devices/system/node').glob('node[0-9]*/cpulist'),
+        key=lambda p: int(p.parent.name[4:])
+    )
+    return [parse_cpu_list(p.read_text()) for p in nodes]
+
+
+def get_cpu_sets(n_sets):
+    """Split the available CPUs into disjoint sets of the same size.
+
+    The CPUs are ordered by NUMA node when the topology is available, so that
+    the sets do not span several nodes when possible. When there are less
+    CPUs than sets, each set has one CPU and the CPUs are shared.
+
+    Parameters
+    ----------
+    n_sets : int
+        Number of sets.
+
+    Returns
+    -------
+    cpu_sets : list of list of int
+        The ids of the CPUs of each set.
+    """
+    cpus = get_available_cpus()
+    order = {
+        cpu: i for i, cpu in enumerate(
+            cpu for node in get_numa_nodes() for cpu in node
+        )
+    }
+    cpus = sorted(cpus, key=lambda cpu: order.get(cpu, len(order) + cpu))
+    if n_sets >= len(cpus):
+        return [[cpus[i % len(cpus)]] for i in range(n_sets)]
+    size = len(cpus) // n_sets
+    return [sorted(cpus[i * size:(i + 1) * size]) for i in range(n_sets)]
+
+
+# Lock files held by the current process for its core set, per pinning.
+_PINNING_LOCKS = {}
+
+
+class WorkerPinning:
+    """Assign one of disjoint core sets to each worker process.
+
+    The first time a worker runs a job, it claims a free core set by taking
+    an exclusive lock on the file associated with this set. The lock is held
+    until the worker exits, so that the other workers use other sets. Each
+    run is then pinned to the cores of its worker with ``pin_cpus``, so that
+    the affinity of the reused workers is restored after the run.
+
+    Parameters
+    ----------
+    n_workers : int
+        Number of worker processes, and of core sets.
+    """
+
+    def __init__(self, n_workers):
+        self.cpu_sets = get_cpu_sets(n_workers)
+        self.folder = tempfile.mkdtemp(prefix="benchopt_pinning_")
+
+    def claim(self):
+        """Claim a free core set for the current process, if not done already.
+
+        Returns
+        -------
+        cpus : list of int | None
+            The cores of the process, or None if no set is free.
+        """
+        import fcntl
+
+        if self.folder in _PINNING_LOCKS:
+            return _PINNING_LOCKS[self.folder][1]
+        for i, cpus in enumerate(self.cpu_sets):
+            lock_file = open(Path(self.folder) / f"cpu_set_{i}.lock", 'w')
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                continue
+            _PINNING_LOCKS[self.folder] = (lock_file, cpus)
+            return cpus
+        return None
+
+    def close(self):
+        "Remove the lock files."
+        shutil.rmtree(self.folder, ignore_errors=True)